@@ -786,6 +786,7 @@ class LizCodeCLI:
                 approval_callback=self._approval_callback,
                 question_callback=ask_user_callback,
                 working_directory=Path.cwd(),
+                lazy_tool_schemas=self.settings.lazy_tool_schemas,
             )
 
         # Temporarily switch mode if needed
@@ -989,6 +990,7 @@ class LizCodeCLI:
     async def run(self) -> None:
         """Main run loop."""
         self._print_welcome()
+        self._model_completer.warmup()
 
         while self.running:
             try:
@@ -1048,10 +1050,17 @@ class LizCodeCLI:
     "--model", "-m",
     help="Model to use",
 )
+@click.option(
+    "--lazy-tool-schemas",
+    is_flag=True,
+    default=None,
+    help="Send compact tool schemas until each tool is first used",
+)
 @click.version_option(version=__version__)
 def main(
     provider: str | None,
     model: str | None,
+    lazy_tool_schemas: bool | None,
 ) -> None:
     """LizCode - AI pair programming CLI with Plan, Act, and Shell modes."""
     create_default_config()
@@ -1064,6 +1073,8 @@ def main(
             settings.openrouter_model = model
         else:
             settings.ollama_model = model
+    if lazy_tool_schemas:
+        settings.lazy_tool_schemas = True
 
     cli = LizCodeCLI(settings)
     asyncio.run(cli.run())
@@ -63,6 +63,12 @@ class Settings(BaseSettings):
         description="Enable streaming responses",
     )
 
+    # Tool settings
+    lazy_tool_schemas: bool = Field(
+        default=False,
+        description="Send compact tool schemas, expanding each to its full schema once used",
+    )
+
     # Paths
     config_dir: Path = Field(
         default_factory=lambda: Path.home() / ".lizcode",
@@ -98,6 +104,7 @@ class Settings(BaseSettings):
             "ollama_model": self.ollama_model,
             "default_mode": self.default_mode,
             "streaming": self.streaming,
+            "lazy_tool_schemas": self.lazy_tool_schemas,
         }
         
         # Only include API key if it's set
@@ -30,8 +30,11 @@ class Agent:
         approval_callback: Callable[[str, str, dict], bool] | None = None,
         question_callback: Callable[[str, list | None, str | None], str] | None = None,
         working_directory: Path | None = None,
+        lazy_tool_schemas: bool = False,
     ):
         self.provider = provider
+        # Send one-line tool summaries, promoting to full schemas once used
+        self.lazy_tool_schemas = lazy_tool_schemas
         self.state = state or ConversationState()
         self.working_directory = working_directory or Path.cwd()
         self.approval_callback = approval_callback or self._default_approval
@@ -113,6 +116,20 @@ class Agent:
         """Get tools available for the current mode and state context."""
         return self.tool_registry.get_for_context(self.state.mode, self._has_plan())
 
+    def _used_tool_names(self) -> set[str]:
+        """Names of every tool called so far in the conversation.
+
+        Read from the messages rather than tracked separately, so the set
+        follows clears and restored conversations. Once promoted, a tool
+        keeps its full schema and the tool list stays stable across turns.
+        """
+        return {
+            tc.name
+            for msg in self.state.messages
+            if msg.role == Role.ASSISTANT and msg.tool_calls
+            for tc in msg.tool_calls
+        }
+
     def _build_messages(self) -> list[dict[str, Any]]:
         """Build the messages list for the API call."""
         messages = []
@@ -181,6 +198,10 @@ class Agent:
 
             messages = self._build_messages()
             tools = self.get_available_tools()
+            if tools and self.lazy_tool_schemas:
+                tools = self.tool_registry.get_promoted_schemas(
+                    self.state.mode, self._used_tool_names(), self._has_plan()
+                )
 
             try:
                 response = await self.provider.chat(messages, tools=tools if tools else None)
@@ -347,4 +368,11 @@ class Agent:
 
     async def close(self) -> None:
         """Clean up resources."""
+        from lizcode.tools.browser import BrowserTool
+        from lizcode.tools.webfetch import WebFetchTool
+
+        await BrowserTool.shutdown()
+        await WebFetchTool.shutdown()
+        await self.subagent_manager.aclose()
+        self.task_list.close()
         await self.provider.close()
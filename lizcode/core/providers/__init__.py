@@ -1,20 +1,36 @@
 """Model providers for LizCode."""
 
 from lizcode.core.providers.base import Provider
-from lizcode.core.providers.ollama import OllamaProvider
-from lizcode.core.providers.openrouter import OpenRouterProvider
 
 __all__ = ["Provider", "OpenRouterProvider", "OllamaProvider"]
 
+# Concrete providers are imported on first use so that loading one
+# (e.g. in a background worker) doesn't import the other
+_PROVIDER_MODULES = {
+    "OllamaProvider": "lizcode.core.providers.ollama",
+    "OpenRouterProvider": "lizcode.core.providers.openrouter",
+}
+
+_PROVIDER_CLASSES = {
+    "openrouter": "OpenRouterProvider",
+    "ollama": "OllamaProvider",
+}
+
+
+def __getattr__(name: str):
+    """Lazy import concrete provider classes."""
+    if name in _PROVIDER_MODULES:
+        import importlib
+
+        return getattr(importlib.import_module(_PROVIDER_MODULES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def get_provider(provider_name: str, **kwargs) -> Provider:
     """Factory function to get a provider by name."""
-    providers = {
-        "openrouter": OpenRouterProvider,
-        "ollama": OllamaProvider,
-    }
-
-    if provider_name not in providers:
-        raise ValueError(f"Unknown provider: {provider_name}. Available: {list(providers.keys())}")
+    if provider_name not in _PROVIDER_CLASSES:
+        raise ValueError(
+            f"Unknown provider: {provider_name}. Available: {list(_PROVIDER_CLASSES.keys())}"
+        )
 
-    return providers[provider_name](**kwargs)
+    return __getattr__(_PROVIDER_CLASSES[provider_name])(**kwargs)
@@ -57,16 +57,9 @@ class Provider(ABC):
         """
         ...
 
-    def format_tools(self, tools: list[Tool]) -> list[dict[str, Any]]:
-        """Format tools for the API request."""
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "parameters": tool.parameters,
-                },
-            }
-            for tool in tools
-        ]
+    def format_tools(self, tools: list[Tool | dict[str, Any]]) -> list[dict[str, Any]]:
+        """Format tools for the API request.
+
+        Entries may also be prebuilt schema dicts (e.g. summary schemas).
+        """
+        return [tool if isinstance(tool, dict) else tool.get_schema() for tool in tools]
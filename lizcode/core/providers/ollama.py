@@ -45,19 +45,12 @@ class OllamaProvider(Provider):
             await self._client.aclose()
             self._client = None
 
-    def _format_tools_ollama(self, tools: list[Tool]) -> list[dict[str, Any]]:
-        """Format tools for Ollama's tool calling format."""
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "parameters": tool.parameters,
-                },
-            }
-            for tool in tools
-        ]
+    def _format_tools_ollama(self, tools: list[Tool | dict[str, Any]]) -> list[dict[str, Any]]:
+        """Format tools for Ollama's tool calling format.
+
+        Entries may also be prebuilt schema dicts (e.g. summary schemas).
+        """
+        return [tool if isinstance(tool, dict) else tool.get_schema() for tool in tools]
 
     async def chat(
         self,
@@ -2,12 +2,27 @@
 
 from __future__ import annotations
 
+import heapq
 import json
+import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+
+def _ns_to_iso(ns: int) -> str:
+    """Format nanoseconds since the epoch as a local ISO timestamp."""
+    return datetime.fromtimestamp(ns / 1e9).isoformat()
+
+
+def _iso_to_ns(iso: str) -> int:
+    """Parse an ISO timestamp into nanoseconds since the epoch."""
+    try:
+        return int(datetime.fromisoformat(iso).timestamp() * 1e9)
+    except ValueError:
+        return 0
 
 
 @dataclass
@@ -46,12 +61,19 @@ class Session:
     checkpoints: list[Checkpoint] = field(default_factory=list)
     
     _session_dir: Path | None = field(default=None, repr=False)
+    _saved_hash: int | None = field(default=None, repr=False)
+    _updated_ns: int = field(default=0, repr=False)
+
+    def __post_init__(self) -> None:
+        if not self._updated_ns and self.updated_at:
+            self._updated_ns = _iso_to_ns(self.updated_at)
 
     @classmethod
     def create(cls, project_path: Path, name: str = "New Session") -> Session:
         """Create a new session with a fresh UUID."""
         session_id = str(uuid.uuid4())
-        now = datetime.now().isoformat()
+        now_ns = time.time_ns()
+        now = _ns_to_iso(now_ns)
         
         session = cls(
             id=session_id,
@@ -59,6 +81,7 @@ class Session:
             project_path=str(project_path.resolve()),
             created_at=now,
             updated_at=now,
+            _updated_ns=now_ns,
         )
         return session
 
@@ -96,10 +119,20 @@ class Session:
         """Save session metadata to session.json."""
         if not self._session_dir:
             return
-        
-        self.updated_at = datetime.now().isoformat()
+
+        # Skip the write (and the updated_at bump) if nothing but the
+        # timestamp would change since the last save
+        payload = self.to_dict()
+        del payload["updated_at"]
+        payload_hash = hash(json.dumps(payload, sort_keys=True))
         metadata_file = self._session_dir / "session.json"
+        if payload_hash == self._saved_hash and metadata_file.exists():
+            return
+
+        self._updated_ns = time.time_ns()
+        self.updated_at = _ns_to_iso(self._updated_ns)
         metadata_file.write_text(json.dumps(self.to_dict(), indent=2))
+        self._saved_hash = payload_hash
 
     def create_checkpoint(
         self,
@@ -206,10 +239,10 @@ class SessionManager:
         self.current_session = session
         return session
 
-    def list_sessions(self, project_path: Path | None = None) -> list[Session]:
-        """List all sessions, optionally filtered by project path."""
-        sessions = []
-        
+    def _iter_sessions(self, project_path: Path | None = None) -> Iterator[Session]:
+        """Yield stored sessions, optionally filtered by project path."""
+        resolved = str(project_path.resolve()) if project_path is not None else None
+
         for session_dir in self.sessions_dir.iterdir():
             if not session_dir.is_dir():
                 continue
@@ -222,21 +255,26 @@ class SessionManager:
                 data = json.loads(metadata_file.read_text())
                 session = Session.from_dict(data)
                 session.set_session_dir(session_dir)
-                
-                # Filter by project path if specified
-                if project_path is None or session.project_path == str(project_path.resolve()):
-                    sessions.append(session)
             except (json.JSONDecodeError, KeyError):
                 continue
+
+            # Filter by project path if specified
+            if resolved is None or session.project_path == resolved:
+                yield session
+
+    def list_sessions(self, project_path: Path | None = None) -> list[Session]:
+        """List all sessions, optionally filtered by project path."""
+        sessions = list(self._iter_sessions(project_path))
         
         # Sort by updated_at descending (most recent first)
-        sessions.sort(key=lambda s: s.updated_at, reverse=True)
+        sessions.sort(key=lambda s: s._updated_ns, reverse=True)
         return sessions
 
     def get_most_recent_session(self, project_path: Path) -> Session | None:
         """Get the most recent session for a project."""
-        sessions = self.list_sessions(project_path)
-        return sessions[0] if sessions else None
+        # Single pass, no full sort - callers only want the winner
+        latest = heapq.nlargest(1, self._iter_sessions(project_path), key=lambda s: s._updated_ns)
+        return latest[0] if latest else None
 
     def save_conversation(self, conversation_state: dict[str, Any]) -> None:
         """Save conversation state to current session."""
@@ -41,6 +41,13 @@ class ToolCall:
     name: str
     arguments: dict[str, Any]
 
+    def to_dict(self) -> dict[str, Any]:
+        return {"id": self.id, "name": self.name, "arguments": self.arguments}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ToolCall:
+        return cls(id=data["id"], name=data["name"], arguments=data["arguments"])
+
 
 @dataclass
 class ToolResult:
@@ -51,6 +58,23 @@ class ToolResult:
     result: str
     success: bool = True
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "tool_call_id": self.tool_call_id,
+            "name": self.name,
+            "result": self.result,
+            "success": self.success,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ToolResult:
+        return cls(
+            tool_call_id=data["tool_call_id"],
+            name=data["name"],
+            result=data["result"],
+            success=data.get("success", True),
+        )
+
 
 @dataclass
 class Message:
@@ -64,6 +88,10 @@ class Message:
 
     def to_api_format(self) -> dict[str, Any]:
         """Convert to API message format."""
+        # Plain text messages are the common case - skip the branchy build
+        if self.tool_calls is None and self.tool_result is None:
+            return {"role": self.role.value, "content": self.content}
+
         msg: dict[str, Any] = {
             "role": self.role.value,
             "content": self.content,
@@ -90,6 +118,32 @@ class Message:
 
         return msg
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        tool_calls = self.tool_calls
+        tool_result = self.tool_result
+        return {
+            "role": self.role.value,
+            "content": self.content,
+            "timestamp": self.timestamp.isoformat(),
+            "tool_calls": [tc.to_dict() for tc in tool_calls] if tool_calls else None,
+            "tool_result": tool_result.to_dict() if tool_result else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Message:
+        """Create from dictionary."""
+        tool_calls = data.get("tool_calls")
+        tool_result = data.get("tool_result")
+        timestamp = data.get("timestamp")
+        return cls(
+            role=Role(data["role"]),
+            content=data["content"],
+            timestamp=datetime.fromisoformat(timestamp) if timestamp else datetime.now(),
+            tool_calls=[ToolCall.from_dict(tc) for tc in tool_calls] if tool_calls else None,
+            tool_result=ToolResult.from_dict(tool_result) if tool_result else None,
+        )
+
 
 @dataclass
 class ConversationState:
@@ -159,24 +213,7 @@ class ConversationState:
             "working_directory": self.working_directory,
             "model": self.model,
             "provider": self.provider,
-            "messages": [
-                {
-                    "role": msg.role.value,
-                    "content": msg.content,
-                    "timestamp": msg.timestamp.isoformat(),
-                    "tool_calls": [
-                        {"id": tc.id, "name": tc.name, "arguments": tc.arguments}
-                        for tc in msg.tool_calls
-                    ] if msg.tool_calls else None,
-                    "tool_result": {
-                        "tool_call_id": msg.tool_result.tool_call_id,
-                        "name": msg.tool_result.name,
-                        "result": msg.tool_result.result,
-                        "success": msg.tool_result.success,
-                    } if msg.tool_result else None,
-                }
-                for msg in self.messages
-            ],
+            "messages": [msg.to_dict() for msg in self.messages],
         }
 
     def from_dict(self, data: dict[str, Any]) -> None:
@@ -190,31 +227,4 @@ class ConversationState:
         if "provider" in data:
             self.provider = data["provider"]
         if "messages" in data:
-            self.messages = []
-            for msg_data in data["messages"]:
-                tool_calls = None
-                if msg_data.get("tool_calls"):
-                    tool_calls = [
-                        ToolCall(
-                            id=tc["id"],
-                            name=tc["name"],
-                            arguments=tc["arguments"],
-                        )
-                        for tc in msg_data["tool_calls"]
-                    ]
-                tool_result = None
-                if msg_data.get("tool_result"):
-                    tr = msg_data["tool_result"]
-                    tool_result = ToolResult(
-                        tool_call_id=tr["tool_call_id"],
-                        name=tr["name"],
-                        result=tr["result"],
-                        success=tr.get("success", True),
-                    )
-                self.messages.append(Message(
-                    role=Role(msg_data["role"]),
-                    content=msg_data["content"],
-                    timestamp=datetime.fromisoformat(msg_data["timestamp"]) if msg_data.get("timestamp") else datetime.now(),
-                    tool_calls=tool_calls,
-                    tool_result=tool_result,
-                ))
+            self.messages = [Message.from_dict(msg_data) for msg_data in data["messages"]]
@@ -12,16 +12,23 @@ import asyncio
 import json
 import multiprocessing
 import os
+import secrets
 import sys
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
-from uuid import uuid4
+from typing import TYPE_CHECKING, Any, Callable
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, installed with the "fast" extra
+    orjson = None
 
 if TYPE_CHECKING:
     from lizcode.core.providers.base import Provider
+    from lizcode.tools.base import Tool, ToolRegistry
 
 
 class SubagentType(Enum):
@@ -33,17 +40,21 @@ class SubagentType(Enum):
     BUILD_VALIDATOR = "build_validator"  # Check builds
     CODE_REVIEWER = "code_reviewer"  # Review code changes
 
+    # Filled in from SUBAGENT_TOOLS / SUBAGENT_PROMPTS below
+    tools: frozenset[str]
+    system_prompt: str
+
     def __str__(self) -> str:
         return self.value
 
 
 # Tool restrictions per subagent type
 SUBAGENT_TOOLS = {
-    SubagentType.EXPLORE: ["read_file", "glob", "grep", "list_files"],
-    SubagentType.PLAN: ["read_file", "glob", "grep", "list_files"],
-    SubagentType.TEST_RUNNER: ["read_file", "glob", "grep", "list_files", "bash"],
-    SubagentType.BUILD_VALIDATOR: ["read_file", "glob", "grep", "list_files", "bash"],
-    SubagentType.CODE_REVIEWER: ["read_file", "glob", "grep", "list_files"],
+    SubagentType.EXPLORE: frozenset(["read_file", "glob", "grep", "list_files"]),
+    SubagentType.PLAN: frozenset(["read_file", "glob", "grep", "list_files"]),
+    SubagentType.TEST_RUNNER: frozenset(["read_file", "glob", "grep", "list_files", "bash"]),
+    SubagentType.BUILD_VALIDATOR: frozenset(["read_file", "glob", "grep", "list_files", "bash"]),
+    SubagentType.CODE_REVIEWER: frozenset(["read_file", "glob", "grep", "list_files"]),
 }
 
 # System prompts for each subagent type
@@ -159,8 +170,14 @@ Report:
 """,
 }
 
+# Attach the tables to the members so spawns read plain attributes
+for _agent_type in SubagentType:
+    _agent_type.tools = SUBAGENT_TOOLS[_agent_type]
+    _agent_type.system_prompt = SUBAGENT_PROMPTS[_agent_type]
+del _agent_type
 
-@dataclass
+
+@dataclass(slots=True)
 class SubagentResult:
     """Result from a subagent execution."""
 
@@ -194,12 +211,83 @@ class SubagentManager:
     working_directory: Path = field(default_factory=Path.cwd)
     output_dir: Path = field(default_factory=lambda: Path(".lizcode/subagents"))
 
+    max_background_workers: int = 4
+    max_parallel: int = 4  # Concurrent async subagents in spawn_parallel
+
     # Track running background agents
-    _background_processes: dict[str, multiprocessing.Process] = field(default_factory=dict)
+    _background_processes: dict[str, Future] = field(default_factory=dict)
+    _executor: ProcessPoolExecutor | None = field(default=None, repr=False)
+    _registry: ToolRegistry | None = field(default=None, repr=False)
+    _tools_by_type: dict[SubagentType, dict[str, Tool]] = field(default_factory=dict, repr=False)
+    _providers: dict[tuple[Any, ...], Provider] = field(default_factory=dict, repr=False)
 
     def __post_init__(self):
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Get or create the worker pool for background agents.
+
+        Workers are started from a forkserver where available and pre-import
+        the provider/tool modules once, so each background spawn only pays
+        for a task submission instead of a fresh interpreter.
+        """
+        if self._executor is None:
+            if "forkserver" in multiprocessing.get_all_start_methods():
+                mp_context = multiprocessing.get_context("forkserver")
+            else:
+                mp_context = multiprocessing.get_context()
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_background_workers,
+                mp_context=mp_context,
+                initializer=_init_background_worker,
+            )
+        return self._executor
+
+    def _get_tools(self, agent_type: SubagentType) -> dict[str, Tool]:
+        """Get the allowed tools for an agent type, keyed by name.
+
+        The registry and per-type filter are built once per manager rather
+        than on every spawn.
+        """
+        tools = self._tools_by_type.get(agent_type)
+        if tools is None:
+            if self._registry is None:
+                from lizcode.tools import create_tool_registry
+
+                self._registry = create_tool_registry()
+            tools = _filter_tools(self._registry, agent_type)
+            self._tools_by_type[agent_type] = tools
+        return tools
+
+    def _get_provider(self) -> Provider:
+        """Get a provider for an async subagent.
+
+        One provider is shared per provider class, model, credentials and
+        endpoint so subagents reuse its warm HTTP connection pool. The factory
+        is still called each time to pick up settings changes; providers open
+        their client lazily, so a discarded duplicate costs nothing.
+        """
+        provider = self.provider_factory()
+        key = (
+            type(provider),
+            provider.model,
+            getattr(provider, "api_key", None),
+            getattr(provider, "base_url", None),
+            getattr(provider, "host", None),
+        )
+        return self._providers.setdefault(key, provider)
+
+    async def aclose(self) -> None:
+        """Release background workers and shared providers."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+        providers = list(self._providers.values())
+        self._providers.clear()
+        for provider in providers:
+            await provider.close()
+
     async def spawn(
         self,
         agent_type: SubagentType,
@@ -216,7 +304,7 @@ class SubagentManager:
         Returns:
             SubagentResult with the agent's findings
         """
-        agent_id = str(uuid4())[:8]
+        agent_id = _new_id()
         start_time = datetime.now()
 
         if run_in_background:
@@ -236,11 +324,24 @@ class SubagentManager:
         Returns:
             List of results in same order as input
         """
-        coroutines = [
-            self._spawn_async(str(uuid4())[:8], agent_type, prompt)
-            for agent_type, prompt in tasks
-        ]
-        return await asyncio.gather(*coroutines)
+        # At most max_parallel workers drain a shared iterator, so large
+        # fan-outs don't hit the provider (and its rate limits) all at once
+        pending = iter(enumerate(tasks))
+        results: list[SubagentResult | None] = [None] * len(tasks)
+
+        async def worker() -> None:
+            for index, (agent_type, prompt) in pending:
+                results[index] = await self._spawn_async(_new_id(), agent_type, prompt)
+
+        num_workers = min(self.max_parallel, len(tasks))
+        if sys.version_info < (3, 11):
+            await asyncio.gather(*(worker() for _ in range(num_workers)))
+        else:
+            # _spawn_async never raises, so a TaskGroup is a drop-in for gather
+            async with asyncio.TaskGroup() as tg:
+                for _ in range(num_workers):
+                    tg.create_task(worker())
+        return results
 
     async def _spawn_async(
         self,
@@ -252,25 +353,16 @@ class SubagentManager:
         start_time = datetime.now()
 
         try:
-            # Create a provider for this subagent
-            provider = self.provider_factory()
+            provider = self._get_provider()
 
             # Get the restricted tools for this agent type
-            from lizcode.tools import create_tool_registry
-            
-            registry = create_tool_registry()
-            allowed_tools = SUBAGENT_TOOLS.get(agent_type, [])
-
-            # Filter to only allowed tools
-            tools = [
-                tool for tool in registry.get_all()
-                if tool.name in allowed_tools
-            ]
+            allowed = self._get_tools(agent_type)
+            tools = list(allowed.values())
+            bash_lock = asyncio.Lock()
 
             # Build messages
-            system_prompt = SUBAGENT_PROMPTS.get(agent_type, "You are a helpful assistant.")
             messages = [
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": agent_type.system_prompt},
                 {"role": "user", "content": prompt},
             ]
 
@@ -291,46 +383,8 @@ class SubagentManager:
                     break
 
                 # Execute tools
-                messages.append({
-                    "role": "assistant",
-                    "content": content,
-                    "tool_calls": [
-                        {
-                            "id": tc["id"],
-                            "type": "function",
-                            "function": {
-                                "name": tc["name"],
-                                "arguments": json.dumps(tc["arguments"]),
-                            },
-                        }
-                        for tc in tool_calls
-                    ],
-                })
-
-                for tc in tool_calls:
-                    tool = registry.get(tc["name"])
-                    if tool and tool.name in allowed_tools:
-                        try:
-                            tool_result = await tool.execute(**tc["arguments"])
-                            messages.append({
-                                "role": "tool",
-                                "tool_call_id": tc["id"],
-                                "content": str(tool_result),
-                            })
-                        except Exception as e:
-                            messages.append({
-                                "role": "tool",
-                                "tool_call_id": tc["id"],
-                                "content": f"Error: {e}",
-                            })
-                    else:
-                        messages.append({
-                            "role": "tool",
-                            "tool_call_id": tc["id"],
-                            "content": f"Tool not allowed: {tc['name']}",
-                        })
-
-            await provider.close()
+                messages.append(_assistant_tool_message(content, tool_calls))
+                messages.extend(await _run_tool_calls(tool_calls, allowed, bash_lock))
 
             duration = (datetime.now() - start_time).total_seconds()
 
@@ -365,21 +419,21 @@ class SubagentManager:
         output_file = self.output_dir / f"{agent_id}.txt"
         
         # Write initial status
-        output_file.write_text(f"[{datetime.now().isoformat()}] Starting {agent_type.value} agent...\n")
-
-        # Spawn subprocess
-        process = multiprocessing.Process(
-            target=_run_background_agent,
-            args=(
-                agent_id,
-                agent_type.value,
-                prompt,
-                str(output_file),
-                str(self.working_directory),
-            ),
+        await asyncio.to_thread(
+            output_file.write_text,
+            f"[{datetime.now().isoformat()}] Queued {agent_type.value} agent...\n",
         )
-        process.start()
-        self._background_processes[agent_id] = process
+
+        # Hand off to a pooled worker process
+        future = self._get_executor().submit(
+            _run_background_agent,
+            agent_id,
+            agent_type.value,
+            prompt,
+            str(output_file),
+            str(self.working_directory),
+        )
+        self._background_processes[agent_id] = future
 
         # Return immediately with output file path
         return SubagentResult(
@@ -392,24 +446,34 @@ class SubagentManager:
             output_file=output_file,
         )
 
-    def check_background_agent(self, agent_id: str) -> dict[str, Any]:
-        """Check status of a background agent."""
-        process = self._background_processes.get(agent_id)
+    async def check_background_agent(self, agent_id: str) -> dict[str, Any]:
+        """Check status of a background agent.
+
+        The output file is read in a worker thread so polling many agents
+        doesn't block the event loop.
+        """
+        future = self._background_processes.get(agent_id)
         output_file = self.output_dir / f"{agent_id}.txt"
 
-        if not process:
+        if not future:
             return {"status": "not_found", "agent_id": agent_id}
 
-        is_running = process.is_alive()
-        output = output_file.read_text() if output_file.exists() else ""
+        # Agents wait in the executor's queue until a worker picks them up
+        if future.done():
+            status = "completed"
+        elif future.running():
+            status = "running"
+        else:
+            status = "queued"
+        output = await asyncio.to_thread(_read_output, output_file)
 
         return {
-            "status": "running" if is_running else "completed",
+            "status": status,
             "agent_id": agent_id,
             "output": output,
         }
 
-    def resume_agent(self, agent_id: str, additional_prompt: str) -> None:
+    async def resume_agent(self, agent_id: str, additional_prompt: str) -> str:
         """Resume a completed agent with additional context.
         
         Note: This would require saving/loading conversation state.
@@ -417,10 +481,9 @@ class SubagentManager:
         """
         # Load previous output
         output_file = self.output_dir / f"{agent_id}.txt"
-        if not output_file.exists():
+        previous_output = await asyncio.to_thread(_read_output, output_file, None)
+        if previous_output is None:
             raise ValueError(f"No output found for agent {agent_id}")
-
-        previous_output = output_file.read_text()
         
         # Create new prompt with context
         new_prompt = f"""Previous agent context:
@@ -432,6 +495,125 @@ Continue with:
         return new_prompt
 
 
+def _read_output(output_file: Path, missing: str | None = "") -> str | None:
+    """Read a background agent's output file, or return missing if absent."""
+    try:
+        return output_file.read_text()
+    except FileNotFoundError:
+        return missing
+
+
+def _new_id() -> str:
+    """Short random id for a subagent run (same 8-hex-char shape as before)."""
+    return secrets.token_hex(4)
+
+
+def _assistant_tool_message(content: str, tool_calls: list[dict[str, Any]]) -> dict[str, Any]:
+    """Build the assistant message that carries a response's tool calls."""
+    dumps = json.dumps if orjson is None else lambda obj: orjson.dumps(obj).decode()
+    return {
+        "role": "assistant",
+        "content": content,
+        "tool_calls": [
+            {
+                "id": tc["id"],
+                "type": "function",
+                "function": {"name": tc["name"], "arguments": dumps(tc["arguments"])},
+            }
+            for tc in tool_calls
+        ],
+    }
+
+
+async def _run_tool_calls(
+    tool_calls: list[dict[str, Any]],
+    allowed: dict[str, Tool],
+    bash_lock: asyncio.Lock,
+    log: Callable[[str], None] | None = None,
+) -> list[dict[str, Any]]:
+    """Execute one response's tool calls concurrently.
+
+    Returns the tool messages in call order. bash calls are serialized
+    through bash_lock (in call order) since commands may depend on each
+    other's side effects; read-only tools run freely alongside.
+    """
+
+    async def run_one(tc: dict[str, Any]) -> dict[str, Any]:
+        tool_name = tc["name"]
+        if log:
+            log(f"Calling tool: {tool_name}")
+
+        tool = allowed.get(tool_name)
+        if not tool:
+            return {
+                "role": "tool",
+                "tool_call_id": tc["id"],
+                "content": f"Tool not allowed: {tool_name}",
+            }
+
+        try:
+            if tool_name == "bash":
+                async with bash_lock:
+                    result = await tool.execute(**tc["arguments"])
+            else:
+                result = await tool.execute(**tc["arguments"])
+        except Exception as e:
+            if log:
+                log(f"Tool error: {e}")
+            return {
+                "role": "tool",
+                "tool_call_id": tc["id"],
+                "content": f"Error: {e}",
+            }
+
+        result_str = str(result)
+        if log:
+            # Truncate for logging
+            log_result = result_str[:500] + "..." if len(result_str) > 500 else result_str
+            log(f"Tool result: {log_result}")
+        return {
+            "role": "tool",
+            "tool_call_id": tc["id"],
+            "content": result_str,
+        }
+
+    return list(await asyncio.gather(*(run_one(tc) for tc in tool_calls)))
+
+
+def _filter_tools(registry: ToolRegistry, agent_type: SubagentType) -> dict[str, Tool]:
+    """Select the tools an agent type may use from a registry."""
+    allowed_names = agent_type.tools
+    return {tool.name: tool for tool in registry.get_all() if tool.name in allowed_names}
+
+
+# Per-worker-process tool cache for background agents
+_worker_tools: dict[SubagentType, dict[str, Tool]] = {}
+
+
+def _get_worker_tools(agent_type: SubagentType) -> dict[str, Tool]:
+    """Get allowed tools in a pool worker, building the registry once per process."""
+    tools = _worker_tools.get(agent_type)
+    if tools is None:
+        from lizcode.tools import create_tool_registry
+
+        tools = _filter_tools(create_tool_registry(), agent_type)
+        _worker_tools[agent_type] = tools
+    return tools
+
+
+def _init_background_worker() -> None:
+    """Warm a pool worker by importing the modules every agent run needs.
+
+    The concrete provider module is imported by the first run that uses it
+    and stays cached in the worker for later runs.
+    """
+    import httpx  # noqa: F401
+
+    import lizcode.config.settings  # noqa: F401
+    import lizcode.core.providers.base  # noqa: F401
+    import lizcode.tools  # noqa: F401
+
+
 def _run_background_agent(
     agent_id: str,
     agent_type_str: str,
@@ -439,7 +621,7 @@ def _run_background_agent(
     output_file: str,
     working_directory: str,
 ):
-    """Run agent in subprocess. This is the target for multiprocessing."""
+    """Run agent in a pool worker process. This is the target for the executor."""
     import asyncio
     
     # Change to working directory
@@ -448,44 +630,51 @@ def _run_background_agent(
     output_path = Path(output_file)
     agent_type = SubagentType(agent_type_str)
 
+    # One buffered handle for the agent's lifetime; flushed at iteration
+    # boundaries so the parent still sees progress while polling
+    log_file = open(output_path, "a", buffering=8192)
+
     def log(message: str):
-        with open(output_path, "a") as f:
-            f.write(f"[{datetime.now().isoformat()}] {message}\n")
+        log_file.write(f"[{datetime.now().isoformat()}] {message}\n")
 
     async def run():
         log(f"Agent {agent_id} ({agent_type.value}) starting...")
         log(f"Prompt: {prompt[:200]}...")
 
+        provider = None
         try:
             # Import here to avoid circular imports
             from lizcode.config.settings import Settings
-            from lizcode.core.providers.openrouter import OpenRouterProvider
-            from lizcode.core.providers.ollama import OllamaProvider
-            from lizcode.tools import create_tool_registry
 
             settings = Settings.load_from_yaml()
 
-            # Create provider
+            # Create provider, importing only the module that is configured
             if settings.provider == "openrouter":
+                from lizcode.core.providers.openrouter import OpenRouterProvider
+
                 provider = OpenRouterProvider(
                     api_key=settings.openrouter_api_key,
                     model=settings.openrouter_model,
                 )
             else:
+                from lizcode.core.providers.ollama import OllamaProvider
+
                 provider = OllamaProvider(
                     model=settings.ollama_model,
                     host=settings.ollama_host,
                 )
 
             # Get tools
-            registry = create_tool_registry()
-            allowed_tools = SUBAGENT_TOOLS.get(agent_type, [])
-            tools = [t for t in registry.get_all() if t.name in allowed_tools]
+            allowed = _get_worker_tools(agent_type)
+            if "bash" in allowed:
+                # Reused workers may have run an agent in another directory
+                allowed["bash"].refresh_cwd()
+            tools = list(allowed.values())
+            bash_lock = asyncio.Lock()
 
             # Build messages
-            system_prompt = SUBAGENT_PROMPTS.get(agent_type, "")
             messages = [
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": agent_type.system_prompt},
                 {"role": "user", "content": prompt},
             ]
 
@@ -493,6 +682,7 @@ def _run_background_agent(
             max_iterations = 15
             for iteration in range(max_iterations):
                 log(f"Iteration {iteration + 1}...")
+                log_file.flush()
 
                 response = await provider.chat(messages, tools=tools if tools else None)
 
@@ -505,54 +695,9 @@ def _run_background_agent(
                 if not tool_calls:
                     break
 
-                messages.append({
-                    "role": "assistant",
-                    "content": content,
-                    "tool_calls": [
-                        {
-                            "id": tc["id"],
-                            "type": "function",
-                            "function": {
-                                "name": tc["name"],
-                                "arguments": json.dumps(tc["arguments"]),
-                            },
-                        }
-                        for tc in tool_calls
-                    ],
-                })
-
-                for tc in tool_calls:
-                    tool_name = tc["name"]
-                    log(f"Calling tool: {tool_name}")
-
-                    tool = registry.get(tool_name)
-                    if tool and tool.name in allowed_tools:
-                        try:
-                            result = await tool.execute(**tc["arguments"])
-                            result_str = str(result)
-                            # Truncate for logging
-                            log_result = result_str[:500] + "..." if len(result_str) > 500 else result_str
-                            log(f"Tool result: {log_result}")
-                            messages.append({
-                                "role": "tool",
-                                "tool_call_id": tc["id"],
-                                "content": result_str,
-                            })
-                        except Exception as e:
-                            log(f"Tool error: {e}")
-                            messages.append({
-                                "role": "tool",
-                                "tool_call_id": tc["id"],
-                                "content": f"Error: {e}",
-                            })
-                    else:
-                        messages.append({
-                            "role": "tool",
-                            "tool_call_id": tc["id"],
-                            "content": f"Tool not allowed: {tool_name}",
-                        })
+                messages.append(_assistant_tool_message(content, tool_calls))
+                messages.extend(await _run_tool_calls(tool_calls, allowed, bash_lock, log))
 
-            await provider.close()
             log("Agent completed successfully.")
 
         except Exception as e:
@@ -560,4 +705,12 @@ def _run_background_agent(
             import traceback
             log(traceback.format_exc())
 
-    asyncio.run(run())
+        finally:
+            # Close on every path; the client is bound to this run's event loop
+            if provider is not None:
+                await provider.close()
+
+    try:
+        asyncio.run(run())
+    finally:
+        log_file.close()
@@ -3,12 +3,40 @@
 from __future__ import annotations
 
 import json
+import secrets
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any
-from uuid import uuid4
+from typing import Any, TextIO
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, installed with the "fast" extra
+    orjson = None
+
+# Journal entries appended before the snapshot is rewritten and the journal reset
+JOURNAL_COMPACT_EVERY = 100
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _dumps(data: Any, indent: bool = False) -> str:
+    """Serialize task data, keeping datetimes as ISO strings."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, default=_json_default, option=option).decode()
+    return json.dumps(data, indent=2 if indent else None, default=_json_default)
+
+
+def _loads(data: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class TaskState(Enum):
@@ -22,7 +50,15 @@ class TaskState(Enum):
         return self.value
 
 
-@dataclass
+# State marker per state for TaskList.to_display
+_STATE_MARKS = {
+    TaskState.PENDING: "[ ]",
+    TaskState.IN_PROGRESS: "[>]",
+    TaskState.COMPLETED: "[x]",
+}
+
+
+@dataclass(slots=True)
 class Task:
     """A single task in the todo list."""
 
@@ -36,26 +72,40 @@ class Task:
     parent_id: str | None = None  # For subtasks
     metadata: dict[str, Any] = field(default_factory=dict)
 
-    def start(self) -> None:
+    # Serialized timestamps, filled when the datetime is set via start()/
+    # complete()/from_dict or on first to_dict
+    _created_iso: str | None = field(default=None, init=False, repr=False, compare=False)
+    _started_iso: str | None = field(default=None, init=False, repr=False, compare=False)
+    _completed_iso: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def start(self, at: datetime | None = None) -> None:
         """Mark task as in progress."""
         self.state = TaskState.IN_PROGRESS
-        self.started_at = datetime.now()
+        self.started_at = at or datetime.now()
+        self._started_iso = self.started_at.isoformat()
 
-    def complete(self) -> None:
+    def complete(self, at: datetime | None = None) -> None:
         """Mark task as completed."""
         self.state = TaskState.COMPLETED
-        self.completed_at = datetime.now()
+        self.completed_at = at or datetime.now()
+        self._completed_iso = self.completed_at.isoformat()
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
+        if self._created_iso is None:
+            self._created_iso = self.created_at.isoformat()
+        if self._started_iso is None and self.started_at:
+            self._started_iso = self.started_at.isoformat()
+        if self._completed_iso is None and self.completed_at:
+            self._completed_iso = self.completed_at.isoformat()
         return {
             "id": self.id,
             "content": self.content,
             "active_form": self.active_form,
             "state": self.state.value,
-            "created_at": self.created_at.isoformat(),
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "created_at": self._created_iso,
+            "started_at": self._started_iso if self.started_at else None,
+            "completed_at": self._completed_iso if self.completed_at else None,
             "parent_id": self.parent_id,
             "metadata": self.metadata,
         }
@@ -63,25 +113,62 @@ class Task:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Task:
         """Create from dictionary."""
-        return cls(
+        created = data["created_at"]
+        started = data.get("started_at")
+        completed = data.get("completed_at")
+        task = cls(
             id=data["id"],
             content=data["content"],
             active_form=data["active_form"],
             state=TaskState(data["state"]),
-            created_at=datetime.fromisoformat(data["created_at"]),
-            started_at=datetime.fromisoformat(data["started_at"]) if data.get("started_at") else None,
-            completed_at=datetime.fromisoformat(data["completed_at"]) if data.get("completed_at") else None,
+            created_at=datetime.fromisoformat(created),
+            started_at=datetime.fromisoformat(started) if started else None,
+            completed_at=datetime.fromisoformat(completed) if completed else None,
             parent_id=data.get("parent_id"),
             metadata=data.get("metadata", {}),
         )
+        # Keep the source strings so re-serializing doesn't reformat them
+        task._created_iso = created
+        task._started_iso = started
+        task._completed_iso = completed
+        return task
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskList:
     """Manages a list of tasks with state tracking."""
 
-    tasks: list[Task] = field(default_factory=list)
+    tasks: list[Task] = field(default_factory=list)  # Insertion order, for display
     _persist_path: Path | None = None
+    _by_id: dict[str, Task] = field(default_factory=dict, repr=False)
+    _state_counts: dict[TaskState, int] = field(default_factory=dict, repr=False)
+    _in_progress_id: str | None = field(default=None, repr=False)
+    _journal: TextIO | None = field(default=None, repr=False)
+    _journal_ops: int = field(default=0, repr=False)
+    _pending_entries: list[str] = field(default_factory=list, repr=False)
+    _persist_batching: bool = field(default=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._reindex()
+
+    def _reindex(self) -> None:
+        """Rebuild the id index and state tracking after self.tasks is replaced wholesale."""
+        self._by_id = {task.id: task for task in self.tasks}
+        self._state_counts = dict.fromkeys(TaskState, 0)
+        self._in_progress_id = None
+        for task in self.tasks:
+            self._state_counts[task.state] += 1
+            if task.state == TaskState.IN_PROGRESS and self._in_progress_id is None:
+                self._in_progress_id = task.id
+
+    def _track_transition(self, task: Task, old_state: TaskState) -> None:
+        """Update state counts and the in-progress id after a task changes state."""
+        self._state_counts[old_state] -= 1
+        self._state_counts[task.state] += 1
+        if task.state == TaskState.IN_PROGRESS:
+            self._in_progress_id = task.id
+        elif self._in_progress_id == task.id:
+            self._in_progress_id = None
 
     def add_task(
         self,
@@ -91,15 +178,20 @@ class TaskList:
         metadata: dict[str, Any] | None = None,
     ) -> Task:
         """Add a new task."""
+        task_id = secrets.token_hex(4)
+        while task_id in self._by_id:
+            task_id = secrets.token_hex(4)
         task = Task(
-            id=str(uuid4())[:8],
+            id=task_id,
             content=content,
             active_form=active_form,
             parent_id=parent_id,
             metadata=metadata or {},
         )
         self.tasks.append(task)
-        self._persist()
+        self._by_id[task.id] = task
+        self._state_counts[task.state] += 1
+        self._record("add", task=task.to_dict())
         return task
 
     def add_tasks(self, tasks: list[dict[str, str]]) -> list[Task]:
@@ -107,23 +199,26 @@ class TaskList:
         
         Each dict should have 'content' and 'active_form' keys.
         """
-        created = []
-        for task_data in tasks:
-            task = self.add_task(
-                content=task_data["content"],
-                active_form=task_data["active_form"],
-                parent_id=task_data.get("parent_id"),
-                metadata=task_data.get("metadata"),
-            )
-            created.append(task)
+        # Coalesce the journal entries into a single write
+        self._persist_batching = True
+        try:
+            created = [
+                self.add_task(
+                    content=task_data["content"],
+                    active_form=task_data["active_form"],
+                    parent_id=task_data.get("parent_id"),
+                    metadata=task_data.get("metadata"),
+                )
+                for task_data in tasks
+            ]
+        finally:
+            self._persist_batching = False
+            self._flush_journal()
         return created
 
     def get_task(self, task_id: str) -> Task | None:
         """Get a task by ID."""
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self._by_id.get(task_id)
 
     def start_task(self, task_id: str) -> Task | None:
         """Mark a task as in progress.
@@ -131,8 +226,8 @@ class TaskList:
         Enforces that only one task can be in_progress at a time.
         """
         # Check if another task is already in progress
-        current = self.get_in_progress()
-        if current and current.id != task_id:
+        if self._in_progress_id and self._in_progress_id != task_id:
+            current = self._by_id[self._in_progress_id]
             raise ValueError(
                 f"Cannot start task {task_id}: task '{current.content}' is already in progress. "
                 "Complete it first or mark it as pending."
@@ -140,26 +235,33 @@ class TaskList:
 
         task = self.get_task(task_id)
         if task:
+            old_state = task.state
             task.start()
-            self._persist()
+            self._track_transition(task, old_state)
+            self._record("start", id=task_id, ts=task._started_iso)
         return task
 
     def complete_task(self, task_id: str) -> Task | None:
         """Mark a task as completed."""
         task = self.get_task(task_id)
         if task:
+            old_state = task.state
             task.complete()
-            self._persist()
+            self._track_transition(task, old_state)
+            self._record("complete", id=task_id, ts=task._completed_iso)
         return task
 
     def remove_task(self, task_id: str) -> bool:
         """Remove a task from the list."""
-        for i, task in enumerate(self.tasks):
-            if task.id == task_id:
-                self.tasks.pop(i)
-                self._persist()
-                return True
-        return False
+        task = self._by_id.pop(task_id, None)
+        if task is None:
+            return False
+        self.tasks.remove(task)
+        self._state_counts[task.state] -= 1
+        if self._in_progress_id == task_id:
+            self._in_progress_id = None
+        self._record("remove", id=task_id)
+        return True
 
     def get_pending(self) -> list[Task]:
         """Get all pending tasks."""
@@ -167,10 +269,9 @@ class TaskList:
 
     def get_in_progress(self) -> Task | None:
         """Get the currently in-progress task (should be at most one)."""
-        for task in self.tasks:
-            if task.state == TaskState.IN_PROGRESS:
-                return task
-        return None
+        if self._in_progress_id is None:
+            return None
+        return self._by_id.get(self._in_progress_id)
 
     def get_completed(self) -> list[Task]:
         """Get all completed tasks."""
@@ -178,13 +279,15 @@ class TaskList:
 
     def get_next_pending(self) -> Task | None:
         """Get the next pending task to work on."""
-        pending = self.get_pending()
-        return pending[0] if pending else None
+        if not self._state_counts[TaskState.PENDING]:
+            return None
+        return next(t for t in self.tasks if t.state == TaskState.PENDING)
 
     def clear_completed(self) -> int:
         """Remove all completed tasks. Returns count removed."""
         original_count = len(self.tasks)
         self.tasks = [t for t in self.tasks if t.state != TaskState.COMPLETED]
+        self._reindex()
         removed = original_count - len(self.tasks)
         if removed > 0:
             self._persist()
@@ -193,6 +296,7 @@ class TaskList:
     def clear_all(self) -> None:
         """Clear all tasks."""
         self.tasks.clear()
+        self._reindex()
         self._persist()
 
     def to_display(self) -> str:
@@ -206,16 +310,12 @@ class TaskList:
         if not self.tasks:
             return "No tasks."
 
-        lines = []
-        for task in self.tasks:
-            if task.state == TaskState.PENDING:
-                lines.append(f"[{task.id}] [ ] {task.content}")
-            elif task.state == TaskState.IN_PROGRESS:
-                lines.append(f"[{task.id}] [>] {task.active_form}")
-            else:
-                lines.append(f"[{task.id}] [x] {task.content}")
-
-        return "\n".join(lines)
+        in_progress = TaskState.IN_PROGRESS
+        return "\n".join(
+            f"[{task.id}] {_STATE_MARKS[task.state]} "
+            f"{task.active_form if task.state is in_progress else task.content}"
+            for task in self.tasks
+        )
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -228,6 +328,7 @@ class TaskList:
         """Create from dictionary."""
         task_list = cls()
         task_list.tasks = [Task.from_dict(t) for t in data.get("tasks", [])]
+        task_list._reindex()
         return task_list
 
     def set_persist_path(self, path: Path) -> None:
@@ -236,30 +337,103 @@ class TaskList:
         path.parent.mkdir(parents=True, exist_ok=True)
 
     def _persist(self) -> None:
-        """Save to disk if persist path is set."""
-        if self._persist_path:
-            self._persist_path.write_text(
-                json.dumps(self.to_dict(), indent=2, default=str)
+        """Write a full snapshot to disk and reset the journal."""
+        if not self._persist_path:
+            return
+        self._persist_path.write_text(
+            _dumps(self.to_dict(), indent=True)
+        )
+        if self._journal is None:
+            self._journal = open(
+                self._persist_path.with_suffix(".jsonl"), "a", encoding="utf-8", buffering=1
             )
+        self._journal.truncate(0)
+        self._journal_ops = 0
+        self._pending_entries.clear()
+
+    def _record(self, op: str, **fields: Any) -> None:
+        """Append a single mutation to the journal next to the snapshot.
+
+        The first mutation after loading, and every JOURNAL_COMPACT_EVERY
+        after that, rewrites the snapshot instead. While batching, entries are
+        held until _flush_journal.
+        """
+        if not self._persist_path:
+            return
+        self._pending_entries.append(_dumps({"op": op, **fields}))
+        if not self._persist_batching:
+            self._flush_journal()
+
+    def _flush_journal(self) -> None:
+        """Write pending journal entries in one go, compacting if due."""
+        entries = self._pending_entries
+        if not entries or not self._persist_path:
+            return
+        if self._journal is None or self._journal_ops + len(entries) > JOURNAL_COMPACT_EVERY:
+            self._persist()
+            return
+        self._journal.write("\n".join(entries) + "\n")
+        self._journal_ops += len(entries)
+        entries.clear()
+
+    def _replay(self, journal_path: Path) -> None:
+        """Apply journal entries written after the snapshot was taken."""
+        with open(journal_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = _loads(line)
+                op = entry["op"]
+                if op == "add":
+                    task = Task.from_dict(entry["task"])
+                    # A crash between snapshot and journal reset can leave
+                    # entries the snapshot already contains
+                    if task.id not in self._by_id:
+                        self.tasks.append(task)
+                        self._by_id[task.id] = task
+                    continue
+
+                task = self._by_id.get(entry["id"])
+                if task is None:
+                    continue
+                if op == "start":
+                    task.start(datetime.fromisoformat(entry["ts"]))
+                elif op == "complete":
+                    task.complete(datetime.fromisoformat(entry["ts"]))
+                elif op == "remove":
+                    del self._by_id[task.id]
+                    self.tasks.remove(task)
+
+        self._reindex()
+
+    def close(self) -> None:
+        """Close the journal file handle."""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
 
     @classmethod
     def load(cls, path: Path) -> TaskList:
-        """Load task list from file."""
-        if not path.exists():
+        """Load task list from a snapshot file plus its journal."""
+        if path.exists():
+            task_list = cls.from_dict(_loads(path.read_bytes()))
+        else:
             task_list = cls()
-            task_list.set_persist_path(path)
-            return task_list
 
-        data = json.loads(path.read_text())
-        task_list = cls.from_dict(data)
+        journal_path = path.with_suffix(".jsonl")
+        if journal_path.exists():
+            task_list._replay(journal_path)
+
         task_list.set_persist_path(path)
         return task_list
 
     def get_progress(self) -> tuple[int, int]:
         """Get (completed_count, total_count)."""
-        completed = len(self.get_completed())
-        total = len(self.tasks)
-        return completed, total
+        return self._state_counts[TaskState.COMPLETED], len(self.tasks)
+
+    def get_pending_count(self) -> int:
+        """Get the number of pending tasks."""
+        return self._state_counts[TaskState.PENDING]
 
     def get_progress_display(self) -> str:
         """Get progress as a display string."""
@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import heapq
+import json
 from abc import ABC, abstractmethod
+from bisect import insort
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
 from lizcode.core.state import Mode
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, installed with the "fast" extra
+    orjson = None
+
 
 class Permission(Enum):
     """Tool permission levels."""
@@ -19,18 +27,56 @@ class Permission(Enum):
     PLAN = "plan"  # Planning operations (plan mode only)
 
 
-@dataclass
+# One bit per mode, so per-permission answers below are a single mask test
+_MODE_BITS = {mode: 1 << i for i, mode in enumerate(Mode)}
+_PLAN, _ACT = _MODE_BITS[Mode.PLAN], _MODE_BITS[Mode.ACT]
+_ALL_MODES = sum(_MODE_BITS.values())
+
+# Modes each permission is allowed in:
+# - PLAN mode: READ and PLAN tools; WRITE and EXECUTE are blocked
+# - ACT mode: READ, WRITE and EXECUTE; PLAN tools need plan mode
+# - Bash/AISH modes: no AI tools
+_ALLOWED_MASK = {
+    Permission.READ: _PLAN | _ACT,
+    Permission.PLAN: _PLAN,
+    Permission.WRITE: _ACT,
+    Permission.EXECUTE: _ACT,
+}
+
+# Modes in which each permission needs user approval:
+# - PLAN mode: anything but READ/PLAN (those are blocked anyway)
+# - ACT mode: WRITE and EXECUTE; READ is auto-approved
+# - Bash/AISH modes: user is in control, always
+_APPROVAL_MASK = {
+    Permission.READ: _ALL_MODES & ~(_PLAN | _ACT),
+    Permission.PLAN: _ALL_MODES & ~(_PLAN | _ACT),
+    Permission.WRITE: _ALL_MODES,
+    Permission.EXECUTE: _ALL_MODES,
+}
+
+# Permissions allowed per mode, derived from _ALLOWED_MASK for registry lookups
+_MODE_PERMISSIONS = {
+    mode: tuple(p for p in Permission if _ALLOWED_MASK[p] & bit)
+    for mode, bit in _MODE_BITS.items()
+}
+
+
+@dataclass(slots=True)
 class ToolResult:
     """Result of a tool execution."""
 
     success: bool
     output: str
     error: str | None = None
+    # Formatted error text, built on the first str() of a failed result
+    _error_str: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def __str__(self) -> str:
         if self.success:
             return self.output
-        return f"Error: {self.error or self.output}"
+        if self._error_str is None:
+            self._error_str = f"Error: {self.error or self.output}"
+        return self._error_str
 
 
 class Tool(ABC):
@@ -40,11 +86,22 @@ class Tool(ABC):
     name: str = "base_tool"
     description: str = "Base tool description"
     permission: Permission = Permission.READ
+    # One-line description for summary schemas; defaults to the description's first line
+    summary: str = ""
+
+    # Built on first get_schema(); tools with dynamic schemas call invalidate_schema()
+    _schema: dict[str, Any] | None = None
+    _summary_schema: dict[str, Any] | None = None
+    # Bumped on every invalidation so registries know cached schema lists are stale
+    _schema_generation: int = 0
 
     @property
     @abstractmethod
     def parameters(self) -> dict[str, Any]:
-        """JSON Schema for tool parameters."""
+        """JSON Schema for tool parameters.
+
+        Static schemas are built once and shared, so callers must not mutate it.
+        """
         ...
 
     @abstractmethod
@@ -54,44 +111,62 @@ class Tool(ABC):
 
     def requires_approval(self, mode: Mode) -> bool:
         """Check if this tool requires user approval in the given mode."""
-        if mode == Mode.PLAN:
-            # In plan mode, READ and PLAN operations don't need approval
-            # WRITE and EXECUTE are blocked entirely (see is_allowed_in_mode)
-            return self.permission not in (Permission.READ, Permission.PLAN)
-
-        if mode == Mode.ACT:
-            # In act mode, WRITE and EXECUTE require approval
-            # READ is auto-approved
-            return self.permission in (Permission.WRITE, Permission.EXECUTE)
-
-        # Bash mode - user is in control, no AI tool execution
-        return True
+        return bool(_APPROVAL_MASK[self.permission] & _MODE_BITS[mode])
 
     def is_allowed_in_mode(self, mode: Mode) -> bool:
         """Check if this tool can be used in the given mode."""
-        if mode == Mode.PLAN:
-            # READ and PLAN tools allowed in plan mode
-            # WRITE and EXECUTE are blocked
-            return self.permission in (Permission.READ, Permission.PLAN)
-
-        if mode == Mode.ACT:
-            # READ, WRITE, EXECUTE tools allowed in act mode
-            # PLAN tools are NOT allowed - must be in Plan mode to plan
-            return self.permission in (Permission.READ, Permission.WRITE, Permission.EXECUTE)
-
-        # Bash mode - no AI tools
-        return False
+        return bool(_ALLOWED_MASK[self.permission] & _MODE_BITS[mode])
 
     def get_schema(self) -> dict[str, Any]:
         """Get the full tool schema for API calls."""
-        return {
-            "type": "function",
-            "function": {
-                "name": self.name,
-                "description": self.description,
-                "parameters": self.parameters,
-            },
-        }
+        if self._schema is None:
+            self._schema = {
+                "type": "function",
+                "function": {
+                    "name": self.name,
+                    "description": self.description,
+                    "parameters": self.parameters,
+                },
+            }
+        return self._schema
+
+    def get_summary_schema(self) -> dict[str, Any]:
+        """Get a compact schema: name, one-line summary and required arguments.
+
+        Used to advertise tools cheaply; the full schema is sent once the
+        model starts using the tool (see ToolRegistry.get_promoted_schemas).
+        Required arguments keep their names, types and enums, not descriptions,
+        so a first call made from the summary still passes validation.
+        """
+        if self._summary_schema is None:
+            summary = self.summary or self.description.strip().split("\n", 1)[0]
+            parameters = self.parameters
+            required = parameters.get("required", [])
+            properties = parameters.get("properties", {})
+            summary_parameters: dict[str, Any] = {"type": "object"}
+            if required:
+                summary_parameters["properties"] = {
+                    name: {
+                        k: v for k, v in properties.get(name, {}).items() if k in ("type", "enum")
+                    }
+                    for name in required
+                }
+                summary_parameters["required"] = list(required)
+            self._summary_schema = {
+                "type": "function",
+                "function": {
+                    "name": self.name,
+                    "description": summary,
+                    "parameters": summary_parameters,
+                },
+            }
+        return self._summary_schema
+
+    def invalidate_schema(self) -> None:
+        """Drop the cached schemas after name, description or parameters change."""
+        self._schema = None
+        self._summary_schema = None
+        Tool._schema_generation += 1
 
 
 @dataclass
@@ -100,9 +175,38 @@ class ToolRegistry:
 
     _tools: dict[str, Tool] = field(default_factory=dict)
 
+    # (registration index, tool) per permission, each bucket in registration order
+    _by_permission: dict[Permission, list[tuple[int, Tool]]] = field(
+        default_factory=lambda: {p: [] for p in Permission}, repr=False
+    )
+    # Filter results keyed by (mode, has_plan); has_plan is None for get_for_mode
+    _tools_cache: dict[tuple[Mode | None, bool | None], list[Tool]] = field(
+        default_factory=dict, repr=False
+    )
+    # Schema lists, tagged with the Tool._schema_generation they were built at
+    _schema_cache: dict[tuple[Mode | None, bool | None], tuple[int, list[dict[str, Any]]]] = field(
+        default_factory=dict, repr=False
+    )
+    # Encoded schema lists, same keys and tagging as _schema_cache
+    _json_cache: dict[tuple[Mode | None, bool | None], tuple[int, bytes]] = field(
+        default_factory=dict, repr=False
+    )
+
     def register(self, tool: Tool) -> None:
         """Register a tool."""
+        old = self._tools.get(tool.name)
+        if old is None:
+            index = len(self._tools)
+        else:
+            # Replacing keeps the name's original position, as the dict does
+            bucket = self._by_permission[old.permission]
+            pos = next(i for i, (_, t) in enumerate(bucket) if t is old)
+            index = bucket.pop(pos)[0]
         self._tools[tool.name] = tool
+        insort(self._by_permission[tool.permission], (index, tool), key=lambda e: e[0])
+        self._tools_cache.clear()
+        self._schema_cache.clear()
+        self._json_cache.clear()
 
     def get(self, name: str) -> Tool | None:
         """Get a tool by name."""
@@ -113,8 +217,17 @@ class ToolRegistry:
         return list(self._tools.values())
 
     def get_for_mode(self, mode: Mode) -> list[Tool]:
-        """Get tools available for a specific mode."""
-        return [tool for tool in self._tools.values() if tool.is_allowed_in_mode(mode)]
+        """Get tools available for a specific mode, in registration order.
+
+        Only the permission buckets the mode allows are visited.
+        """
+        key = (mode, None)
+        tools = self._tools_cache.get(key)
+        if tools is None:
+            buckets = [self._by_permission[p] for p in _MODE_PERMISSIONS[mode]]
+            tools = [tool for _, tool in heapq.merge(*buckets, key=lambda e: e[0])]
+            self._tools_cache[key] = tools
+        return list(tools)
 
     def get_for_context(self, mode: Mode, has_plan: bool = False) -> list[Tool]:
         """Get tools available for a specific mode AND state context.
@@ -126,12 +239,13 @@ class ToolRegistry:
         Returns:
             List of tools appropriate for the current context
         """
+        key = (mode, has_plan)
+        cached = self._tools_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
         tools = []
-        for tool in self._tools.values():
-            # First check mode permission
-            if not tool.is_allowed_in_mode(mode):
-                continue
-            
+        for tool in self.get_for_mode(mode):
             # State-based filtering for plan tools in plan mode
             if mode == Mode.PLAN:
                 # create_plan is always available - user may want to restart
@@ -141,14 +255,63 @@ class ToolRegistry:
                         continue
             
             tools.append(tool)
-        return tools
+        self._tools_cache[key] = tools
+        return list(tools)
+
+    def _cached_schemas(
+        self, key: tuple[Mode | None, bool | None], tools: list[Tool]
+    ) -> list[dict[str, Any]]:
+        """Build (or reuse) the schema list for a filter result."""
+        cached = self._schema_cache.get(key)
+        if cached is None or cached[0] != Tool._schema_generation:
+            cached = (Tool._schema_generation, [tool.get_schema() for tool in tools])
+            self._schema_cache[key] = cached
+        return list(cached[1])
 
     def get_schemas(self, mode: Mode | None = None) -> list[dict[str, Any]]:
         """Get tool schemas, optionally filtered by mode."""
         tools = self.get_for_mode(mode) if mode else self.get_all()
-        return [tool.get_schema() for tool in tools]
+        return self._cached_schemas((mode, None), tools)
 
     def get_schemas_for_context(self, mode: Mode, has_plan: bool = False) -> list[dict[str, Any]]:
         """Get tool schemas filtered by mode AND state context."""
         tools = self.get_for_context(mode, has_plan)
-        return [tool.get_schema() for tool in tools]
+        return self._cached_schemas((mode, has_plan), tools)
+
+    def get_schemas_json(self, mode: Mode | None = None, has_plan: bool | None = None) -> bytes:
+        """Get tool schemas as compact UTF-8 JSON, ready for a request body.
+
+        Filters like get_schemas, or like get_schemas_for_context when has_plan
+        is given. The encoded bytes are cached until a schema changes.
+        """
+        key = (mode, has_plan)
+        cached = self._json_cache.get(key)
+        if cached is None or cached[0] != Tool._schema_generation:
+            if has_plan is None:
+                schemas = self.get_schemas(mode)
+            else:
+                schemas = self.get_schemas_for_context(mode, has_plan)
+            if orjson is not None:
+                data = orjson.dumps(schemas)
+            else:
+                data = json.dumps(schemas, separators=(",", ":"), ensure_ascii=False).encode()
+            cached = (Tool._schema_generation, data)
+            self._json_cache[key] = cached
+        return cached[1]
+
+    def get_summary_schemas(self, mode: Mode, has_plan: bool = False) -> list[dict[str, Any]]:
+        """Get compact summary schemas for every tool in the context."""
+        return [tool.get_summary_schema() for tool in self.get_for_context(mode, has_plan)]
+
+    def get_promoted_schemas(
+        self, mode: Mode, names: set[str], has_plan: bool = False
+    ) -> list[dict[str, Any]]:
+        """Get full schemas for the named tools and summaries for the rest.
+
+        Tool order matches get_for_context so the result stays stable while
+        the promoted set doesn't change.
+        """
+        return [
+            tool.get_schema() if tool.name in names else tool.get_summary_schema()
+            for tool in self.get_for_context(mode, has_plan)
+        ]
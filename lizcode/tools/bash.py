@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import codecs
 import os
+import signal
+from functools import cached_property
 from typing import Any
 
 from lizcode.tools.base import Permission, Tool, ToolResult
@@ -37,8 +40,13 @@ Example: bash(command="python game.py", background=true)
     def __init__(self, timeout: int = 120, max_output: int = 50000):
         self.timeout = timeout
         self.max_output = max_output
+        self._cwd = os.getcwd()
 
-    @property
+    def refresh_cwd(self) -> None:
+        """Re-read the process working directory after a chdir."""
+        self._cwd = os.getcwd()
+
+    @cached_property
     def parameters(self) -> dict[str, Any]:
         return {
             "type": "object",
@@ -73,14 +81,8 @@ Example: bash(command="python game.py", background=true)
     ) -> ToolResult:
         """Execute a bash command."""
         timeout = min(timeout or self.timeout, 300)
-        cwd = working_directory or os.getcwd()
+        cwd = working_directory or self._cwd
         
-        # Forward full environment including DISPLAY for GUI apps
-        env = {**os.environ}
-        # Only set TERM to dumb for non-background processes
-        if not background:
-            env["TERM"] = "dumb"
-
         try:
             # Background mode: launch and return immediately
             if background:
@@ -90,52 +92,53 @@ Example: bash(command="python game.py", background=true)
                     stderr=asyncio.subprocess.DEVNULL,
                     stdin=asyncio.subprocess.DEVNULL,
                     cwd=cwd,
-                    env=env,
+                    env=None,  # Inherit the full environment, including DISPLAY for GUI apps
                     start_new_session=True,  # Detach from parent
                 )
                 return ToolResult(
                     success=True,
-                    output=f"Background process started (PID: {process.pid})\nCommand: {command}\n\nProcess is running independently. Check manually or use `ps aux | grep {process.pid}` to verify.",
+                    output=(
+                        f"Background process started (PID: {process.pid})\n"
+                        f"Command: {command}\n\n"
+                        "Process is running independently. Check manually or use "
+                        f"`ps aux | grep {process.pid}` to verify."
+                    ),
                 )
 
-            # Normal mode: wait for completion
+            # Normal mode: wait for completion. The environment is inherited
+            # rather than copied per call; TERM=dumb is set by the shell itself
             process = await asyncio.create_subprocess_shell(
-                command,
+                f"export TERM=dumb\n{command}",
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,  # Interleaved as the command wrote them
                 cwd=cwd,
-                env=env,
+                env=None,
+                start_new_session=True,  # Own process group, so a timeout can kill its children
             )
 
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
+                (output, dropped), _ = await asyncio.wait_for(
+                    asyncio.gather(
+                        _drain(process.stdout, self.max_output),
+                        process.wait(),
+                    ),
                     timeout=timeout,
                 )
+            except asyncio.CancelledError:
+                await _kill_group(process)
+                raise
             except asyncio.TimeoutError:
-                process.kill()
-                await process.wait()
+                await _kill_group(process)
                 return ToolResult(
                     success=False,
                     output="",
                     error=f"Command timed out after {timeout} seconds. For long-running or GUI processes, use background=true.",
                 )
 
-            stdout_str = stdout.decode("utf-8", errors="replace")
-            stderr_str = stderr.decode("utf-8", errors="replace")
-
-            # Combine output
-            output_parts = []
-            if stdout_str:
-                output_parts.append(stdout_str)
-            if stderr_str:
-                output_parts.append(f"[stderr]\n{stderr_str}")
-
-            output = "\n".join(output_parts)
-
-            # Truncate if needed
-            if len(output) > self.max_output:
-                output = output[: self.max_output] + f"\n... (truncated, {len(output)} chars total)"
+            # The drain already capped the stream; report what it dropped
+            if dropped:
+                total = len(output) + dropped
+                output += f"\n... (truncated, {total} chars total)"
 
             success = process.returncode == 0
             return ToolResult(
@@ -150,3 +153,41 @@ Example: bash(command="python game.py", background=true)
                 output="",
                 error=f"Failed to execute command: {e}",
             )
+
+
+async def _kill_group(process: asyncio.subprocess.Process, grace: float = 2.0) -> None:
+    """SIGKILL a foreground command's process group and reap it, waiting at most grace seconds."""
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    try:
+        await asyncio.wait_for(process.wait(), timeout=grace)
+    except asyncio.TimeoutError:
+        pass
+
+
+async def _drain(stream: asyncio.StreamReader, limit: int) -> tuple[str, int]:
+    """Read a stream to EOF as UTF-8, keeping at most limit characters.
+
+    Returns the kept text and how many characters were dropped. Reading
+    continues past the limit so the process never blocks on a full pipe.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    parts: list[str] = []
+    kept = 0
+    dropped = 0
+    while True:
+        chunk = await stream.read(65536)
+        text = decoder.decode(chunk, final=not chunk)
+        room = limit - kept
+        if room >= len(text):
+            parts.append(text)
+            kept += len(text)
+        else:
+            if room > 0:
+                parts.append(text[:room])
+                kept = limit
+            dropped += len(text) - max(room, 0)
+        if not chunk:
+            return "".join(parts), dropped
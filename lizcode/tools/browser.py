@@ -2,10 +2,127 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import re
+from functools import cached_property
+from typing import Any, Awaitable, Callable
 
 from lizcode.tools.base import Permission, Tool, ToolResult
 
+# Injected into every document: bumps a counter on any DOM mutation so
+# _get_html can tell whether its cached serialization is still current
+_DOM_VERSION_SCRIPT = """
+window.__lizcodeDomVersion = 0;
+new MutationObserver(() => { window.__lizcodeDomVersion++; }).observe(document, {
+    subtree: true, childList: true, attributes: true, characterData: true,
+});
+"""
+
+# Cap on HTML returned to the model, after pruning
+MAX_HTML_SIZE = 150_000
+_TRUNCATION_NOTE = "\n<!-- HTML truncated - showing first 150KB -->"
+
+# Raw HTML sent back from in-page serialization; pruning usually shrinks
+# pages several times over, so this still fills MAX_HTML_SIZE
+_RAW_HTML_LIMIT = MAX_HTML_SIZE * 4
+
+_NOISE_RE = re.compile(
+    r"<script\b[^>]*>.*?</script\s*>|<style\b[^>]*>.*?</style\s*>|<!--.*?-->",
+    re.DOTALL | re.IGNORECASE,
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+# Elements whose whitespace is content
+_PREFORMATTED_RE = re.compile(
+    r"<(pre|textarea|code)\b[^>]*>.*?</\1\s*>", re.DOTALL | re.IGNORECASE
+)
+
+# Serializes the document the way page.content() does, capped in the page
+# so at most max characters cross the wire
+_SERIALIZE_JS = """
+const doctype = document.doctype ? new XMLSerializer().serializeToString(document.doctype) : "";
+const html = doctype + document.documentElement.outerHTML;
+return [window.__lizcodeDomVersion ?? null, html.slice(0, max), html.length > max];
+"""
+
+# Resolves sel to an element the fused paths may act on directly, or returns
+# null so the caller falls back to playwright. Playwright-only selectors
+# (text=, :has-text(), xpath=, >>) make querySelector throw, and elements
+# that fail playwright's actionability checks (detached, hidden, disabled)
+# must go through page.click / page.fill so they are waited on or rejected.
+_FIND_ACTIONABLE_JS = """
+let el;
+try {
+  el = document.querySelector(sel);
+} catch (e) {
+  return null;
+}
+if (!el || !el.isConnected || el.disabled || el.closest("fieldset:disabled")) return null;
+const style = getComputedStyle(el);
+const rect = el.getBoundingClientRect();
+if (style.visibility !== "visible" || rect.width === 0 || rect.height === 0) return null;
+"""
+
+# Clicks an element and serializes the result in one roundtrip. el.click()
+# fires a lone click event with no pointer or mouse events, so only plain
+# buttons and links take this path. Returns null (so the caller falls back to
+# page.click) for any other element, or when it isn't actionable, is covered
+# by another element or off screen, or looks like it could navigate: links
+# with an href, and anything inside a form.
+_FUSED_CLICK_JS = """([sel, max]) => {""" + _FIND_ACTIONABLE_JS + """
+if (!el.matches("a, button, input[type=submit]")) return null;
+const hit = document.elementFromPoint(rect.left + rect.width / 2, rect.top + rect.height / 2);
+if (!hit || !el.contains(hit)) return null;
+if (el.closest("a[href], form")) return null;
+el.click();
+""" + _SERIALIZE_JS + "}"
+
+# Same for typing into a plain input or textarea. The native value setter is
+# used so framework-managed inputs see the change.
+_FUSED_FILL_JS = """([sel, text, max]) => {""" + _FIND_ACTIONABLE_JS + """
+if (el.readOnly) return null;
+if (!(el instanceof HTMLTextAreaElement || el instanceof HTMLInputElement)) return null;
+el.focus();
+Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), "value").set.call(el, text);
+el.dispatchEvent(new Event("input", {bubbles: true}));
+el.dispatchEvent(new Event("change", {bubbles: true}));
+""" + _SERIALIZE_JS + "}"
+
+# Outcome of the one playwright import attempt: the async_playwright factory
+# or the ImportError, so a missing install isn't re-searched on every call
+_playwright_import: tuple[Any, ImportError | None] | None = None
+
+
+def _load_playwright() -> Any:
+    """Return playwright's async_playwright, importing it at most once."""
+    global _playwright_import
+    if _playwright_import is None:
+        try:
+            from playwright.async_api import async_playwright
+        except ImportError as e:
+            _playwright_import = (None, e)
+        else:
+            _playwright_import = (async_playwright, None)
+
+    async_playwright, error = _playwright_import
+    if error is not None:
+        raise RuntimeError(
+            "Playwright not installed. Run: pip install playwright && playwright install chromium"
+        ) from error
+    return async_playwright
+
+
+def _prune_html(html: str) -> str:
+    """Drop scripts, styles and comments and collapse whitespace outside pre/textarea/code."""
+    html = _NOISE_RE.sub("", html)
+    parts = []
+    pos = 0
+    for match in _PREFORMATTED_RE.finditer(html):
+        parts.append(_WHITESPACE_RE.sub(" ", html[pos:match.start()]))
+        parts.append(match.group())
+        pos = match.end()
+    parts.append(_WHITESPACE_RE.sub(" ", html[pos:]))
+    return "".join(parts)
+
 
 class BrowserTool(Tool):
     """Headless browser that returns raw HTML DOM."""
@@ -24,16 +141,42 @@ Actions:
 - close: Close the browser
 
 The browser returns raw HTML - you can read the DOM directly.
+Scripts, styles and comments are stripped and whitespace is collapsed
+(except inside pre, textarea and code).
+Clicks on plain buttons run in the page and fire only a click event; other
+elements get a real mouse click (pointer, mouse and click events).
 Use CSS selectors for click/type (e.g., "#login-button", "input[name=email]")."""
 
     permission = Permission.WRITE  # Can interact with web pages
 
+    # Chromium is shared by every BrowserTool in the process; each tool gets
+    # its own context (cookies, storage, tabs) on top of it. Playwright's
+    # connection and the lock belong to the event loop that created them, so
+    # they are rebuilt when used from a different loop (a later asyncio.run,
+    # subagent runs).
+    _playwright: Any = None
+    _browser: Any = None
+    _launch_lock: asyncio.Lock | None = None
+    _loop: asyncio.AbstractEventLoop | None = None
+
     def __init__(self):
-        self._browser = None
+        self._context = None
         self._page = None
-        self._playwright = None
+        self._page_loop: asyncio.AbstractEventLoop | None = None
+        # (DOM version, truncated HTML) for the current document
+        self._html_cache: tuple[int, str] | None = None
+        self._handlers: dict[str, Callable[..., Awaitable[ToolResult]]] = {
+            "goto": self._do_goto,
+            "click": self._do_click,
+            "type": self._do_type,
+            "get_html": self._do_get_html,
+            "execute_js": self._do_execute_js,
+            "back": self._do_back,
+            "forward": self._do_forward,
+            "close": self._do_close,
+        }
 
-    @property
+    @cached_property
     def parameters(self) -> dict[str, Any]:
         return {
             "type": "object",
@@ -63,34 +206,240 @@ Use CSS selectors for click/type (e.g., "#login-button", "input[name=email]").""
             "required": ["action"],
         }
 
+    @classmethod
+    async def _shared_browser(cls) -> Any:
+        """Return the process-wide chromium instance, launching it once per event loop."""
+        loop = asyncio.get_running_loop()
+        if cls._launch_lock is None or cls._loop is not loop:
+            # Handles from another loop can't be awaited here, so they are dropped
+            cls._playwright = None
+            cls._browser = None
+            cls._launch_lock = asyncio.Lock()
+            cls._loop = loop
+
+        async with cls._launch_lock:
+            if cls._browser is None or not cls._browser.is_connected():
+                async_playwright = _load_playwright()
+                if cls._playwright is None:
+                    cls._playwright = await async_playwright().start()
+                cls._browser = await cls._playwright.chromium.launch(headless=True)
+
+        return cls._browser
+
+    @classmethod
+    async def warmup(cls) -> None:
+        """Launch chromium ahead of time so the first action doesn't wait on it."""
+        await cls._shared_browser()
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Close the shared chromium instance and stop Playwright.
+
+        Called from Agent.close. Handles from another event loop are dropped
+        rather than closed, since they can't be awaited from this one.
+        """
+        browser, playwright, loop = cls._browser, cls._playwright, cls._loop
+        cls._browser = None
+        cls._playwright = None
+        if loop is not asyncio.get_running_loop():
+            return
+        if browser is not None:
+            await browser.close()
+        if playwright is not None:
+            await playwright.stop()
+
     async def _ensure_browser(self) -> None:
-        """Ensure browser is started."""
-        if self._browser is None:
-            try:
-                from playwright.async_api import async_playwright
-            except ImportError:
-                raise RuntimeError(
-                    "Playwright not installed. Run: pip install playwright && playwright install chromium"
-                )
-
-            self._playwright = await async_playwright().start()
-            self._browser = await self._playwright.chromium.launch(headless=True)
-            self._page = await self._browser.new_page()
+        """Ensure this tool has a page open on the shared browser."""
+        loop = asyncio.get_running_loop()
+        if self._page is None or self._page_loop is not loop or self._page.is_closed():
+            browser = await self._shared_browser()
+            self._page_loop = loop
+            self._context = await browser.new_context()
+            self._page = await self._context.new_page()
+            self._html_cache = None
+            await self._page.add_init_script(_DOM_VERSION_SCRIPT)
+            self._page.on("framenavigated", self._on_frame_navigated)
+
+    def _on_frame_navigated(self, frame: Any) -> None:
+        """Drop cached HTML when the main frame navigates."""
+        if self._page is not None and frame == self._page.main_frame:
+            self._html_cache = None
 
     async def _get_html(self) -> str:
-        """Get current page HTML."""
+        """Get current page HTML.
+
+        The serialized (and truncated) DOM is reused while the document's
+        mutation counter is unchanged, so repeated reads of a static page
+        cost one small evaluate instead of a full serialization.
+        """
         if not self._page:
             return "<html><body>No page loaded</body></html>"
 
+        version = await self._page.evaluate("window.__lizcodeDomVersion ?? null")
+        if version is not None and self._html_cache and self._html_cache[0] == version:
+            return self._html_cache[1]
+
         content = await self._page.content()
+        return self._store_html(version, content)
+
+    def _store_html(self, version: int | None, content: str) -> str:
+        """Prune and bound raw HTML, remembering it for the given DOM version."""
+        content = _prune_html(content)
 
         # Truncate if too large
-        max_size = 150_000
-        if len(content) > max_size:
-            content = content[:max_size] + "\n<!-- HTML truncated - showing first 150KB -->"
+        if len(content) > MAX_HTML_SIZE:
+            content = content[:MAX_HTML_SIZE] + _TRUNCATION_NOTE
 
+        self._html_cache = (version, content) if version is not None else None
         return content
 
+    async def _fused_html(self, version: int | None, content: str, truncated: bool) -> str:
+        """HTML from a fused action's in-page serialization.
+
+        If the page capped the raw HTML but pruning left it under
+        MAX_HTML_SIZE, the cut markup would have fit, so the full page is read.
+        """
+        html = self._store_html(version, content)
+        if truncated and len(html) <= MAX_HTML_SIZE:
+            html = self._store_html(version, await self._page.content())
+        return html
+
+    def _require_page(self, error: str = "No page loaded. Use 'goto' first.") -> ToolResult | None:
+        """Return an error result if no page is open, else None."""
+        if not self._page:
+            return ToolResult(success=False, output="", error=error)
+        return None
+
+    async def _do_goto(self, url: str | None = None, **kwargs: Any) -> ToolResult:
+        if not url:
+            return ToolResult(
+                success=False,
+                output="",
+                error="URL required for 'goto' action",
+            )
+
+        await self._ensure_browser()
+        await self._page.goto(url, wait_until="domcontentloaded")
+        html = await self._get_html()
+
+        return ToolResult(
+            success=True,
+            output=f"Navigated to: {self._page.url}\n\n{html}",
+        )
+
+    async def _do_click(self, selector: str | None = None, **kwargs: Any) -> ToolResult:
+        if not selector:
+            return ToolResult(
+                success=False,
+                output="",
+                error="Selector required for 'click' action",
+            )
+        if error := self._require_page():
+            return error
+
+        # Clicks that can't navigate are done and serialized in one evaluate
+        fused = await self._page.evaluate(
+            _FUSED_CLICK_JS, [selector, _RAW_HTML_LIMIT]
+        )
+        if fused is not None:
+            html = await self._fused_html(*fused)
+        else:
+            await self._page.click(selector)
+            await self._page.wait_for_load_state("domcontentloaded")
+            html = await self._get_html()
+
+        return ToolResult(
+            success=True,
+            output=f"Clicked: {selector}\nURL: {self._page.url}\n\n{html}",
+        )
+
+    async def _do_type(
+        self, selector: str | None = None, text: str | None = None, **kwargs: Any
+    ) -> ToolResult:
+        if not selector:
+            return ToolResult(
+                success=False,
+                output="",
+                error="Selector required for 'type' action",
+            )
+        if text is None:
+            return ToolResult(
+                success=False,
+                output="",
+                error="Text required for 'type' action",
+            )
+        if error := self._require_page():
+            return error
+
+        fused = await self._page.evaluate(
+            _FUSED_FILL_JS, [selector, text, _RAW_HTML_LIMIT]
+        )
+        if fused is not None:
+            html = await self._fused_html(*fused)
+        else:
+            await self._page.fill(selector, text)
+            html = await self._get_html()
+
+        return ToolResult(
+            success=True,
+            output=f"Typed into: {selector}\n\n{html}",
+        )
+
+    async def _do_get_html(self, **kwargs: Any) -> ToolResult:
+        if error := self._require_page():
+            return error
+
+        html = await self._get_html()
+        return ToolResult(
+            success=True,
+            output=f"URL: {self._page.url}\n\n{html}",
+        )
+
+    async def _do_execute_js(self, script: str | None = None, **kwargs: Any) -> ToolResult:
+        if not script:
+            return ToolResult(
+                success=False,
+                output="",
+                error="Script required for 'execute_js' action",
+            )
+        if error := self._require_page():
+            return error
+
+        result = await self._page.evaluate(script)
+        return ToolResult(
+            success=True,
+            output=f"Result: {result}",
+        )
+
+    async def _do_back(self, **kwargs: Any) -> ToolResult:
+        if error := self._require_page("No page loaded."):
+            return error
+
+        await self._page.go_back()
+        html = await self._get_html()
+        return ToolResult(
+            success=True,
+            output=f"Navigated back to: {self._page.url}\n\n{html}",
+        )
+
+    async def _do_forward(self, **kwargs: Any) -> ToolResult:
+        if error := self._require_page("No page loaded."):
+            return error
+
+        await self._page.go_forward()
+        html = await self._get_html()
+        return ToolResult(
+            success=True,
+            output=f"Navigated forward to: {self._page.url}\n\n{html}",
+        )
+
+    async def _do_close(self, **kwargs: Any) -> ToolResult:
+        await self.close()
+        return ToolResult(
+            success=True,
+            output="Browser closed.",
+        )
+
     async def execute(
         self,
         action: str,
@@ -101,163 +450,16 @@ Use CSS selectors for click/type (e.g., "#login-button", "input[name=email]").""
         **kwargs: Any,
     ) -> ToolResult:
         """Execute browser action."""
-        try:
-            if action == "goto":
-                if not url:
-                    return ToolResult(
-                        success=False,
-                        output="",
-                        error="URL required for 'goto' action",
-                    )
-
-                await self._ensure_browser()
-                await self._page.goto(url, wait_until="domcontentloaded")
-                html = await self._get_html()
-
-                return ToolResult(
-                    success=True,
-                    output=f"Navigated to: {self._page.url}\n\n{html}",
-                )
-
-            elif action == "click":
-                if not selector:
-                    return ToolResult(
-                        success=False,
-                        output="",
-                        error="Selector required for 'click' action",
-                    )
-
-                if not self._page:
-                    return ToolResult(
-                        success=False,
-                        output="",
-                        error="No page loaded. Use 'goto' first.",
-                    )
-
-                await self._page.click(selector)
-                await self._page.wait_for_load_state("domcontentloaded")
-                html = await self._get_html()
-
-                return ToolResult(
-                    success=True,
-                    output=f"Clicked: {selector}\nURL: {self._page.url}\n\n{html}",
-                )
-
-            elif action == "type":
-                if not selector:
-                    return ToolResult(
-                        success=False,
-                        output="",
-                        error="Selector required for 'type' action",
-                    )
-                if text is None:
-                    return ToolResult(
-                        success=False,
-                        output="",
-                        error="Text required for 'type' action",
-                    )
-
-                if not self._page:
-                    return ToolResult(
-                        success=False,
-                        output="",
-                        error="No page loaded. Use 'goto' first.",
-                    )
-
-                await self._page.fill(selector, text)
-                html = await self._get_html()
-
-                return ToolResult(
-                    success=True,
-                    output=f"Typed into: {selector}\n\n{html}",
-                )
-
-            elif action == "get_html":
-                if not self._page:
-                    return ToolResult(
-                        success=False,
-                        output="",
-                        error="No page loaded. Use 'goto' first.",
-                    )
-
-                html = await self._get_html()
-                return ToolResult(
-                    success=True,
-                    output=f"URL: {self._page.url}\n\n{html}",
-                )
-
-            elif action == "execute_js":
-                if not script:
-                    return ToolResult(
-                        success=False,
-                        output="",
-                        error="Script required for 'execute_js' action",
-                    )
-
-                if not self._page:
-                    return ToolResult(
-                        success=False,
-                        output="",
-                        error="No page loaded. Use 'goto' first.",
-                    )
-
-                result = await self._page.evaluate(script)
-                return ToolResult(
-                    success=True,
-                    output=f"Result: {result}",
-                )
-
-            elif action == "back":
-                if not self._page:
-                    return ToolResult(
-                        success=False,
-                        output="",
-                        error="No page loaded.",
-                    )
-
-                await self._page.go_back()
-                html = await self._get_html()
-                return ToolResult(
-                    success=True,
-                    output=f"Navigated back to: {self._page.url}\n\n{html}",
-                )
-
-            elif action == "forward":
-                if not self._page:
-                    return ToolResult(
-                        success=False,
-                        output="",
-                        error="No page loaded.",
-                    )
-
-                await self._page.go_forward()
-                html = await self._get_html()
-                return ToolResult(
-                    success=True,
-                    output=f"Navigated forward to: {self._page.url}\n\n{html}",
-                )
-
-            elif action == "close":
-                if self._browser:
-                    await self._browser.close()
-                    self._browser = None
-                    self._page = None
-                if self._playwright:
-                    await self._playwright.stop()
-                    self._playwright = None
-
-                return ToolResult(
-                    success=True,
-                    output="Browser closed.",
-                )
-
-            else:
-                return ToolResult(
-                    success=False,
-                    output="",
-                    error=f"Unknown action: {action}",
-                )
+        handler = self._handlers.get(action)
+        if handler is None:
+            return ToolResult(
+                success=False,
+                output="",
+                error=f"Unknown action: {action}",
+            )
 
+        try:
+            return await handler(url=url, selector=selector, text=text, script=script)
         except Exception as e:
             return ToolResult(
                 success=False,
@@ -266,11 +468,9 @@ Use CSS selectors for click/type (e.g., "#login-button", "input[name=email]").""
             )
 
     async def close(self) -> None:
-        """Clean up browser resources."""
-        if self._browser:
-            await self._browser.close()
-            self._browser = None
+        """Close this tool's context; the shared browser stays warm."""
+        if self._context:
+            await self._context.close()
+            self._context = None
             self._page = None
-        if self._playwright:
-            await self._playwright.stop()
-            self._playwright = None
+            self._html_cache = None
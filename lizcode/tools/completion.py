@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Any
 
 from lizcode.tools.base import Permission, Tool, ToolResult
@@ -31,7 +32,7 @@ ALWAYS call this when done with a task. Don't leave the user hanging."""
         """Override to never require approval - this is just a summary."""
         return False
 
-    @property
+    @cached_property
     def parameters(self) -> dict[str, Any]:
         return {
             "type": "object",
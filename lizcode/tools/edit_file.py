@@ -2,11 +2,108 @@
 
 from __future__ import annotations
 
+import os
+import tempfile
 from pathlib import Path
 from typing import Any
 
 from lizcode.tools.base import Permission, Tool, ToolResult
 
+# Files at least this big have unique same-length edits patched in place
+IN_PLACE_THRESHOLD = 1 << 20
+
+
+def _replace_and_count(
+    content: str, old_string: str, new_string: str, replace_all: bool
+) -> tuple[str | None, int]:
+    """Replace old_string, returning the new content and the occurrence count.
+
+    The content is None when nothing should be written: no occurrences, or
+    more than one without replace_all. A unique replacement stops looking
+    after the second occurrence unless it needs the full count to report.
+    """
+    if not old_string:
+        # The empty string matches at every position, so it is only unique
+        # in an empty file
+        count = len(content) + 1
+        if replace_all or count == 1:
+            return content.replace(old_string, new_string), count
+        return None, count
+
+    if replace_all:
+        parts = content.split(old_string)
+        count = len(parts) - 1
+        return (new_string.join(parts) if count else None), count
+
+    start = content.find(old_string)
+    if start == -1:
+        return None, 0
+    end = start + len(old_string)
+    if content.find(old_string, end) != -1:
+        return None, content.count(old_string)
+    return content[:start] + new_string + content[end:], 1
+
+
+def _edit_in_place(path: Path, old_string: str, new_string: str) -> int | None:
+    """Overwrite a unique occurrence with same-length text, leaving the rest of
+    the file untouched, and return the occurrence count (only 1 writes).
+
+    Returns None when the edit has to go through the text path instead:
+    lengths differ in UTF-8, or text mode would rewrite line endings.
+    """
+    old_bytes = old_string.encode("utf-8")
+    new_bytes = new_string.encode("utf-8")
+    if not old_bytes or len(old_bytes) != len(new_bytes):
+        return None
+    if os.linesep != "\n" and "\n" in new_string:
+        return None
+
+    with open(path, "r+b") as f:
+        data = f.read()
+        if b"\r" in data:
+            return None
+        data.decode("utf-8")  # Refuse non-UTF-8 files like the text path does
+
+        # UTF-8 is self-synchronising, so byte matches are character matches
+        pos = data.find(old_bytes)
+        if pos == -1:
+            return 0
+        if data.find(old_bytes, pos + len(old_bytes)) != -1:
+            return data.count(old_bytes)
+        os.pwrite(f.fileno(), new_bytes, pos)
+        os.fsync(f.fileno())
+    return 1
+
+
+def write_atomic(path: Path, content: str | bytes) -> None:
+    """Write through a temporary file in the same directory, then rename it
+    over the original so readers never see a partial file.
+
+    New files, and files in directories that are not writable, are
+    written in place.
+    """
+    is_text = isinstance(content, str)
+    try:
+        mode = path.stat().st_mode & 0o7777
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    except (FileNotFoundError, PermissionError):
+        if is_text:
+            path.write_text(content, encoding="utf-8")
+        else:
+            path.write_bytes(content)
+        return
+    try:
+        with os.fdopen(fd, "w" if is_text else "wb", encoding="utf-8" if is_text else None) as f:
+            f.write(content)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 
 class EditFileTool(Tool):
     """Edit a file using search and replace."""
@@ -78,10 +175,18 @@ Tips:
             )
 
         try:
-            content = path.read_text(encoding="utf-8")
+            count = None
+            if not replace_all and path.stat().st_size >= IN_PLACE_THRESHOLD:
+                count = _edit_in_place(path, old_string, new_string)
+
+            if count is None:
+                content = path.read_text(encoding="utf-8")
+                new_content, count = _replace_and_count(
+                    content, old_string, new_string, replace_all
+                )
+                if new_content is not None:
+                    write_atomic(path, new_content)
 
-            # Check if old_string exists
-            count = content.count(old_string)
             if count == 0:
                 return ToolResult(
                     success=False,
@@ -97,20 +202,9 @@ Tips:
                     error=f"Found {count} occurrences of the text. Use replace_all=true or provide more context to make it unique.",
                 )
 
-            # Perform the replacement
-            if replace_all:
-                new_content = content.replace(old_string, new_string)
-                replaced_count = count
-            else:
-                new_content = content.replace(old_string, new_string, 1)
-                replaced_count = 1
-
-            # Write the updated content
-            path.write_text(new_content, encoding="utf-8")
-
             return ToolResult(
                 success=True,
-                output=f"Edited {file_path} ({replaced_count} replacement{'s' if replaced_count > 1 else ''})",
+                output=f"Edited {file_path} ({count} replacement{'s' if count > 1 else ''})",
             )
 
         except UnicodeDecodeError:
@@ -2,11 +2,191 @@
 
 from __future__ import annotations
 
+import fnmatch
+import itertools
+import os
+import re
+from collections.abc import Callable, Iterator
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from lizcode.tools.base import Permission, Tool, ToolResult
 
+try:
+    import pathspec
+except ImportError:  # Optional, installed with the "ignore" extra
+    pathspec = None
+
+# Directories recursive walks never descend into unless named explicitly
+DEFAULT_IGNORES = frozenset({
+    ".git", ".hg", ".svn", "node_modules", "__pycache__", ".venv", "venv",
+    "target", "dist", "build", ".mypy_cache", ".pytest_cache", ".ruff_cache", ".tox",
+})
+
+
+class IgnoreRules:
+    """Decides which walked entries to leave out.
+
+    Directories in DEFAULT_IGNORES are not descended into. When pathspec is
+    installed, paths matched by the base directory's .gitignore are skipped
+    as well.
+    """
+
+    def __init__(self, base_dir: Path | str):
+        self._prefix = os.path.join(base_dir, "")
+        self._spec = None
+        if pathspec is not None:
+            try:
+                with open(os.path.join(base_dir, ".gitignore")) as f:
+                    self._spec = pathspec.PathSpec.from_lines("gitwildmatch", f)
+            except OSError:
+                pass
+
+    def ignored(self, entry: os.DirEntry[str], is_dir: bool = False) -> bool:
+        """Whether .gitignore excludes the entry."""
+        if self._spec is None or not entry.path.startswith(self._prefix):
+            return False
+        rel_path = entry.path[len(self._prefix):]
+        return self._spec.match_file(rel_path + "/" if is_dir else rel_path)
+
+    def prune(self, entry: os.DirEntry[str]) -> bool:
+        """Whether a walk should skip the directory entry altogether."""
+        return entry.name in DEFAULT_IGNORES or self.ignored(entry, is_dir=True)
+
+
+def _scan(directory: str) -> list[os.DirEntry[str]]:
+    """List a directory, treating unreadable or missing ones as empty."""
+    try:
+        with os.scandir(directory) as it:
+            return list(it)
+    except OSError:
+        return []
+
+
+def _is_wildcard(part: str) -> bool:
+    return any(c in part for c in "*?[")
+
+
+def _is_file(entry: os.DirEntry[str]) -> bool:
+    try:
+        return entry.is_file()
+    except OSError:
+        return False
+
+
+def _is_dir(entry: os.DirEntry[str], follow_symlinks: bool = True) -> bool:
+    try:
+        return entry.is_dir(follow_symlinks=follow_symlinks)
+    except OSError:
+        return False
+
+
+# A compiled pattern component: its text, and a name matcher for wildcards
+_Part = tuple[str, Callable[[str], Any] | None]
+
+
+@lru_cache(maxsize=64)
+def _compile_pattern(pattern: str) -> tuple[_Part, ...]:
+    """Split a glob pattern into components, compiling each wildcard once."""
+    if pattern.startswith("/"):
+        raise NotImplementedError("Non-relative patterns are unsupported")
+    parts = [part for part in pattern.split("/") if part not in ("", ".")]
+    if not parts:
+        raise ValueError(f"Unacceptable pattern: {pattern!r}")
+    for part in parts:
+        if part != "**" and "**" in part:
+            raise ValueError("Invalid pattern: '**' can only be an entire path component")
+    return tuple(
+        (part, re.compile(fnmatch.translate(part)).match if _is_wildcard(part) else None)
+        for part in parts
+    )
+
+
+def iter_glob_files(
+    base_dir: Path | str, pattern: str, ignore: IgnoreRules | None = None
+) -> Iterator[os.DirEntry[str]]:
+    """Yield directory entries for the files matching a glob pattern.
+
+    Follows Path.glob semantics and order (``**`` does not descend into
+    symlinked directories), but works from os.scandir entries, so callers
+    get is_file()/stat() answered from the directory read instead of a
+    fresh stat per path.
+
+    With ``ignore``, entries reached through wildcards are filtered by it;
+    path components spelled out literally in the pattern are always followed.
+    """
+    parts = _compile_pattern(pattern)
+    if pattern.endswith("/"):
+        # A trailing separator only matches directories, so no files
+        return
+    yield from _select(str(base_dir), parts, ignore)
+
+
+def _select(
+    directory: str, parts: tuple[_Part, ...], ignore: IgnoreRules | None
+) -> Iterator[os.DirEntry[str]]:
+    (part, match), rest = parts[0], parts[1:]
+
+    if part == "**":
+        if not rest:
+            # A trailing ** only ever matches directories
+            return
+        seen: set[str] | None = set() if any(p == "**" for p, _ in rest) else None
+        for entry in _walk_dirs(directory, rest, ignore):
+            if seen is not None:
+                if entry.path in seen:
+                    continue
+                seen.add(entry.path)
+            yield entry
+        return
+
+    if not rest:
+        if match is not None:
+            for entry in _scan(directory):
+                if match(entry.name) and _is_file(entry):
+                    if ignore is None or not ignore.ignored(entry):
+                        yield entry
+        else:
+            for entry in _scan(directory):
+                if entry.name == part:
+                    if _is_file(entry):
+                        yield entry
+                    break
+        return
+
+    if match is not None:
+        for entry in _scan(directory):
+            if match(entry.name) and _is_dir(entry):
+                if ignore is None or not ignore.prune(entry):
+                    yield from _select(entry.path, rest, ignore)
+    else:
+        yield from _select(os.path.join(directory, part), rest, ignore)
+
+
+def _walk_dirs(
+    directory: str, rest: tuple[_Part, ...], ignore: IgnoreRules | None
+) -> Iterator[os.DirEntry[str]]:
+    """Apply ``rest`` to a directory and, depth first, every directory below it."""
+    if len(rest) == 1 and rest[0][0] != "**":
+        # "**/name": match and recurse off a single listing per directory
+        part, match = rest[0]
+        if match is None:
+            match = part.__eq__
+        entries = _scan(directory)
+        for entry in entries:
+            if match(entry.name) and _is_file(entry):
+                if ignore is None or not ignore.ignored(entry):
+                    yield entry
+    else:
+        yield from _select(directory, rest, ignore)
+        entries = _scan(directory)
+
+    for entry in entries:
+        if _is_dir(entry, follow_symlinks=False):
+            if ignore is None or not ignore.prune(entry):
+                yield from _walk_dirs(entry.path, rest, ignore)
+
 
 class GlobTool(Tool):
     """Find files matching a glob pattern."""
@@ -18,7 +198,9 @@ Usage:
 - Use glob patterns like *.py, **/*.js, src/**/*.ts
 - ** matches any number of directories
 - * matches any filename characters
-- Results are sorted and limited to prevent overwhelming output
+- Results are limited to prevent overwhelming output; the matches shown are sorted
+- Wildcards skip .git, node_modules, __pycache__, virtualenvs and build output;
+  name such a directory in the pattern to search it (e.g. node_modules/**/*.js)
 
 Examples:
 - "*.py" - Python files in current directory
@@ -72,17 +254,16 @@ Examples:
             )
 
         try:
-            # Find matching files
-            matches = sorted(base_dir.glob(pattern))
-
-            # Filter to only files (not directories)
-            files = [str(p) for p in matches if p.is_file()]
-
-            total_found = len(files)
+            # Stop walking once one match past the limit shows there are more
+            entries = iter_glob_files(base_dir, pattern, IgnoreRules(base_dir))
+            files = [
+                entry.path for entry in itertools.islice(entries, self.max_results + 1)
+            ]
+            truncated = len(files) > self.max_results
+            del files[self.max_results:]
 
-            # Limit results
-            if len(files) > self.max_results:
-                files = files[: self.max_results]
+            # Sort component-wise, like Path objects
+            files.sort(key=lambda p: p.split(os.sep))
 
             if not files:
                 return ToolResult(
@@ -92,8 +273,8 @@ Examples:
 
             output = "\n".join(files)
 
-            if total_found > self.max_results:
-                output += f"\n\n[Showing {self.max_results} of {total_found} matches]"
+            if truncated:
+                output += f"\n\n[Showing first {self.max_results} matches found, more exist]"
 
             return ToolResult(
                 success=True,
@@ -2,11 +2,391 @@
 
 from __future__ import annotations
 
+import asyncio
+import mmap
+import os
 import re
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from lizcode.tools.base import Permission, Tool, ToolResult
+from lizcode.tools.glob import IgnoreRules, iter_glob_files
+
+try:
+    from re import _parser as _sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse as _sre_parse
+
+# Files at least this big are scanned through mmap as raw bytes
+MMAP_THRESHOLD = 64 * 1024
+
+# Files scanned concurrently in worker threads
+GREP_CONCURRENCY = 16
+
+# Leading bytes checked for a NUL to tell binary files from text
+BINARY_SNIFF_SIZE = 8192
+
+# Extensions skipped without opening the file
+_BINARY_EXTS = frozenset({
+    ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".ico", ".webp", ".tif", ".tiff",
+    ".pdf", ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".rar", ".tar", ".jar",
+    ".whl", ".so", ".dll", ".dylib", ".exe", ".o", ".a", ".lib", ".class",
+    ".pyc", ".pyo", ".woff", ".woff2", ".ttf", ".otf", ".eot",
+    ".mp3", ".mp4", ".wav", ".ogg", ".avi", ".mov", ".mkv", ".flac",
+    ".sqlite", ".db", ".bin", ".dat", ".npy", ".pkl",
+})
+
+_REPEATS = {
+    _sre_parse.MAX_REPEAT,
+    _sre_parse.MIN_REPEAT,
+    getattr(_sre_parse, "POSSESSIVE_REPEAT", None),
+}
+
+# ASCII letters that also match non-ASCII characters under str IGNORECASE
+# (dotted/dotless I, the Kelvin sign, long S)
+_WIDE_FOLDING = frozenset(map(ord, "iksIKS"))
+
+
+def _ascii_code(code: int, ignorecase: bool) -> bool:
+    """Check that a pattern code point matches only itself (and ASCII case variants)."""
+    return code < 128 and not (ignorecase and code in _WIDE_FOLDING)
+
+
+def _ascii_items(items: Any, ignorecase: bool) -> bool:
+    """Check that a character set only lists ASCII literals and ranges."""
+    for op, av in items:
+        if op is _sre_parse.LITERAL and _ascii_code(av, ignorecase):
+            continue
+        if op is _sre_parse.RANGE and av[1] < 128:
+            if not (ignorecase and any(av[0] <= c <= av[1] for c in _WIDE_FOLDING)):
+                continue
+        return False
+    return True
+
+
+def _spans_any_bytes(sub: Any) -> bool:
+    """Check for a single "anything but these ASCII chars" item (., [^...], a negated literal).
+
+    Repeated without an upper bound, such an item matches any run of UTF-8
+    bytes that the str pattern would match, so it is safe in bytes mode.
+    """
+    if len(sub) != 1:
+        return False
+    op, av = sub[0]
+    if op is _sre_parse.ANY:
+        return True
+    if op is _sre_parse.NOT_LITERAL:
+        return av < 128
+    if op is _sre_parse.IN and av and av[0][0] is _sre_parse.NEGATE:
+        return _ascii_items(av[1:], False)
+    return False
+
+
+def _scoped_ignorecase(av: Any, ignorecase: bool) -> bool:
+    """Apply a group's (?i:...) / (?-i:...) flags."""
+    _, add_flags, del_flags, _ = av
+    if add_flags & re.IGNORECASE:
+        return True
+    if del_flags & re.IGNORECASE:
+        return False
+    return ignorecase
+
+
+def _bytes_safe(parsed: Any, ignorecase: bool) -> bool:
+    """Check that matching UTF-8 bytes can't miss a line the str pattern matches.
+
+    Extra bytes-mode candidates are fine (every hit is re-checked with the str
+    pattern); missed ones are not. Character categories, anchors other than
+    \\b, single wildcards and non-ASCII literals are rejected.
+    """
+    for op, av in parsed:
+        if op is _sre_parse.LITERAL:
+            if not _ascii_code(av, ignorecase):
+                return False
+        elif op is _sre_parse.IN:
+            if not _ascii_items(av, ignorecase):
+                return False
+        elif op is _sre_parse.SUBPATTERN:
+            if not _bytes_safe(av[-1], _scoped_ignorecase(av, ignorecase)):
+                return False
+        elif op is _sre_parse.BRANCH:
+            if not all(_bytes_safe(branch, ignorecase) for branch in av[1]):
+                return False
+        elif op in _REPEATS:
+            low, high, sub = av
+            if not (high == _sre_parse.MAXREPEAT and _spans_any_bytes(sub)):
+                if not _bytes_safe(sub, ignorecase):
+                    return False
+        elif op is _sre_parse.AT:
+            if av is not _sre_parse.AT_BOUNDARY:
+                return False
+        elif op is _sre_parse.ASSERT:
+            if not _bytes_safe(av[1], ignorecase):
+                return False
+        elif op is getattr(_sre_parse, "ATOMIC_GROUP", None):
+            if not _bytes_safe(av, ignorecase):
+                return False
+        elif op is not _sre_parse.GROUPREF:
+            return False
+    return True
+
+
+def _compile_bytes(pattern: str, parsed: Any, flags: int) -> re.Pattern[bytes] | None:
+    """Compile a pattern for scanning raw file bytes, or None if that isn't safe."""
+    if not pattern.isascii():
+        return None
+    if not _bytes_safe(parsed, bool(parsed.state.flags & re.IGNORECASE)):
+        return None
+    try:
+        return re.compile(pattern.encode("ascii"), flags)
+    except re.error:
+        return None
+
+
+def _literal_probe(parsed: Any, ignorecase: bool) -> str | None:
+    """Find the longest literal run that every match must contain.
+
+    Only top-level literals (and those inside top-level groups) count; any
+    other element ends the current run. Case-insensitive runs are lowercased
+    and stop at characters whose case folding leaves ASCII.
+    """
+    best: list[int] = []
+    run: list[int] = []
+
+    def flush() -> None:
+        nonlocal best, run
+        if len(run) > len(best):
+            best = run
+        run = []
+
+    for op, av in parsed:
+        if op is _sre_parse.LITERAL and (not ignorecase or _ascii_code(av, True)):
+            run.append(av)
+            continue
+        flush()
+        if op is _sre_parse.SUBPATTERN and _scoped_ignorecase(av, ignorecase) == ignorecase:
+            inner = _literal_probe(av[-1], ignorecase)
+            if inner and len(inner) > len(best):
+                best = list(map(ord, inner))
+    flush()
+
+    if not best:
+        return None
+    probe = "".join(map(chr, best))
+    return probe.lower() if ignorecase else probe
+
+
+def _buffer_safe(parsed: Any) -> bool:
+    """Check that a whole-text MULTILINE search can't miss a line-by-line match.
+
+    Only constructs that see past the line edges differ: $, \\A, \\Z (CRLF
+    lines keep their \\r in the buffer) and negative lookarounds.
+    """
+    for op, av in parsed:
+        if op is _sre_parse.AT:
+            if av not in _LINE_SAFE_ANCHORS:
+                return False
+        elif op is _sre_parse.ASSERT_NOT or op is _sre_parse.GROUPREF_EXISTS:
+            return False
+        elif op is _sre_parse.SUBPATTERN or op is _sre_parse.ASSERT:
+            if not _buffer_safe(av[-1]):
+                return False
+        elif op is _sre_parse.BRANCH:
+            if not all(_buffer_safe(branch) for branch in av[1]):
+                return False
+        elif op in _REPEATS:
+            if not _buffer_safe(av[2]):
+                return False
+        elif op is getattr(_sre_parse, "ATOMIC_GROUP", None):
+            if not _buffer_safe(av):
+                return False
+    return True
+
+
+_LINE_SAFE_ANCHORS = {
+    _sre_parse.AT_BEGINNING,
+    _sre_parse.AT_BEGINNING_LINE,
+    _sre_parse.AT_BOUNDARY,
+    _sre_parse.AT_NON_BOUNDARY,
+}
+
+# Line breaks str.splitlines() honours besides \n and \r\n. Buffer scans number
+# lines by \n, so text containing any of these takes the line-by-line path.
+_OTHER_BREAKS = re.compile("[\x0b\x0c\x1c-\x1e\x85\u2028\u2029]|\r(?!\n)")
+
+# The same breaks in UTF-8, looked for by has_other_breaks()
+_SINGLE_BYTE_BREAKS = (b"\x0b", b"\x0c", b"\x1c", b"\x1d", b"\x1e")
+_MULTI_BYTE_BREAKS = ((b"\xc2", (b"\xc2\x85",)), (b"\xe2", (b"\xe2\x80\xa8", b"\xe2\x80\xa9")))
+_CR_CHUNK = 1 << 20
+
+
+def has_other_breaks(buf: bytes | mmap.mmap) -> bool:
+    """Whether UTF-8 bytes hold line breaks other than \n and \r\n.
+
+    Built from find() and count() calls, which run at memchr speed; a regex
+    alternation over the same breaks is several times slower on large files.
+    Multi-byte breaks are only searched for when their lead byte occurs.
+    """
+    if any(buf.find(b) != -1 for b in _SINGLE_BYTE_BREAKS):
+        return True
+    for lead, breaks in _MULTI_BYTE_BREAKS:
+        if buf.find(lead) != -1 and any(buf.find(b) != -1 for b in breaks):
+            return True
+    if buf.find(b"\r") == -1:
+        return False
+    # Every \r must start a \r\n; mmap has no count(), so compare per slice
+    if not isinstance(buf, mmap.mmap):
+        return buf.count(b"\r") != buf.count(b"\r\n")
+    return any(
+        buf[pos : pos + _CR_CHUNK].count(b"\r") != buf[pos : pos + _CR_CHUNK + 1].count(b"\r\n")
+        for pos in range(0, len(buf), _CR_CHUNK)
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class _GrepPattern:
+    """A grep pattern compiled for each search strategy."""
+
+    regex: re.Pattern[str]  # Confirms a single line, exactly as the user wrote it
+    text_regex: re.Pattern[str] | None  # MULTILINE variant for whole-text scans
+    bytes_regex: re.Pattern[bytes] | None  # For scanning undecoded large files
+    probe: str | None  # Literal every match contains (lowercased if ignorecase)
+    literal: str | None  # The whole pattern, when it is plain case-sensitive text
+    ignorecase: bool
+
+    @classmethod
+    @lru_cache(maxsize=128)
+    def compile(cls, pattern: str, flags: int) -> _GrepPattern:
+        """Compile (or reuse) a pattern; agents tend to grep for the same things."""
+        regex = re.compile(pattern, flags)
+        parsed = _sre_parse.parse(pattern, flags)
+        ignorecase = bool(parsed.state.flags & re.IGNORECASE)
+        is_literal = not ignorecase and len(parsed) > 0 and all(
+            op is _sre_parse.LITERAL for op, _ in parsed
+        )
+        return cls(
+            regex=regex,
+            text_regex=re.compile(pattern, flags | re.MULTILINE) if _buffer_safe(parsed) else None,
+            bytes_regex=_compile_bytes(pattern, parsed, flags),
+            probe=_literal_probe(parsed, ignorecase),
+            literal="".join(chr(av) for _, av in parsed) if is_literal else None,
+            ignorecase=ignorecase,
+        )
+
+
+def _read_sequential(path: str) -> bytes | None:
+    """Read a whole file, telling the kernel it will be read front to back.
+
+    Returns None without reading further if the first block has a NUL byte.
+    """
+    with open(path, "rb") as f:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        head = f.read(BINARY_SNIFF_SIZE)
+        if b"\0" in head:
+            return None
+        return head + f.read()
+
+
+# Line boundaries recognised by str.splitlines()
+_LINE_BREAKS = re.compile("\r\n|[\n\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]")
+
+
+def _line_spans(text: str) -> Iterator[tuple[int, int]]:
+    """Yield (start, end) offsets of the lines str.splitlines() would return."""
+    pos = 0
+    for m in _LINE_BREAKS.finditer(text):
+        yield pos, m.start()
+        pos = m.end()
+    if pos < len(text):
+        yield pos, len(text)
+
+
+def _line_text(raw: str | bytes) -> str:
+    if isinstance(raw, bytes):
+        raw = raw.decode("utf-8", errors="replace")
+    return raw.removesuffix("\r")
+
+
+def _scan_buffer(
+    buf: str | bytes | mmap.mmap,
+    finder: re.Pattern[str] | re.Pattern[bytes] | str | bytes,
+    regex: re.Pattern[str],
+    context: int,
+) -> list[str]:
+    """Find matching lines in a whole file, decoding only matches and their context.
+
+    finder locates candidate lines in one pass over the buffer, either as a
+    regex or, for plain-text patterns, a needle for the buffer's own find();
+    each is confirmed with regex so results match a line-by-line search.
+    """
+    newline = "\n" if isinstance(buf, str) else b"\n"
+    if isinstance(finder, (str, bytes)):
+        def next_hit(pos: int) -> int:
+            return buf.find(finder, pos)
+    else:
+        def next_hit(pos: int) -> int:
+            m = finder.search(buf, pos)
+            return -1 if m is None else m.start()
+
+    # str and bytes count within bounds; mmap has no count, so count a slice
+    if isinstance(buf, mmap.mmap):
+        def count_newlines(lo: int, hi: int) -> int:
+            return buf[lo:hi].count(newline)
+    else:
+        def count_newlines(lo: int, hi: int) -> int:
+            return buf.count(newline, lo, hi)
+
+    blocks = []
+    size = len(buf)
+    pos = 0
+    counted = 0  # Offset up to which newlines have been counted
+    line_no = 0  # Zero-based line number at `counted`
+
+    while (hit := next_hit(pos)) != -1:
+        start = buf.rfind(newline, 0, hit) + 1
+        if start == size:
+            break  # Empty match after the final newline
+        end = buf.find(newline, hit)
+        if end == -1:
+            end = size
+
+        line_no += count_newlines(counted, start)
+        counted = start
+        pos = end + 1
+
+        line = _line_text(buf[start:end])
+        if regex.search(line):
+            before = []
+            line_start = start
+            while line_start > 0 and len(before) < context:
+                prev_start = buf.rfind(newline, 0, line_start - 1) + 1
+                before.append(_line_text(buf[prev_start:line_start - 1]))
+                line_start = prev_start
+
+            after = []
+            line_end = end
+            while line_end + 1 < size and len(after) < context:
+                next_end = buf.find(newline, line_end + 1)
+                if next_end == -1:
+                    next_end = size
+                after.append(_line_text(buf[line_end + 1:next_end]))
+                line_end = next_end
+
+            first = line_no - len(before)
+            blocks.append("\n".join(
+                f"{'>' if first + k == line_no else ' '} {first + k + 1:4}: {text}"
+                for k, text in enumerate(before[::-1] + [line] + after)
+            ))
+
+        if pos >= size:
+            break
+
+    return blocks
 
 
 class GrepTool(Tool):
@@ -61,6 +441,96 @@ Examples:
             "required": ["pattern"],
         }
 
+    def _search_file(
+        self, entry: os.DirEntry[str], grep: _GrepPattern, context: int
+    ) -> list[str] | None:
+        """Search one file, returning one context block per matching line.
+
+        Returns None for binary files, recognised by a NUL in the first block.
+        Files lacking the pattern's required literal are dropped before any
+        decoding. When the pattern allows it, the raw bytes are scanned and
+        only matching lines decoded, through mmap for large files; otherwise
+        the decoded text is scanned as a whole, falling back to line-by-line
+        matching where line edges matter.
+        """
+        probe = grep.probe.encode() if grep.probe is not None else None
+        bytes_finder = grep.bytes_regex if grep.literal is None else grep.literal.encode()
+
+        if grep.bytes_regex is not None and entry.stat().st_size >= MMAP_THRESHOLD:
+            # Large file: scan the mapped bytes, decode only hits
+            with (
+                open(entry.path, "rb") as f,
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+            ):
+                if hasattr(mm, "madvise"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                if mm.find(b"\0", 0, BINARY_SNIFF_SIZE) != -1:
+                    return None
+                if probe is not None and not grep.ignorecase and mm.find(probe) == -1:
+                    return []
+                if not has_other_breaks(mm):
+                    return _scan_buffer(mm, bytes_finder, grep.regex, context)
+                data = mm[:]
+        else:
+            data = _read_sequential(entry.path)
+            if data is None:
+                return None
+            if grep.bytes_regex is not None and not has_other_breaks(data):
+                # Scan the bytes as read, decode only hits
+                if probe is not None and not grep.ignorecase and probe not in data:
+                    return []
+                return _scan_buffer(data, bytes_finder, grep.regex, context)
+
+        if probe is not None and probe not in (data.lower() if grep.ignorecase else data):
+            return []
+
+        text = data.decode("utf-8", errors="replace")
+        if grep.text_regex is not None and _OTHER_BREAKS.search(text) is None:
+            finder = grep.text_regex if grep.literal is None else grep.literal
+            return _scan_buffer(text, finder, grep.regex, context)
+
+        return self._search_lines(text, grep, context)
+
+    def _search_lines(self, text: str, grep: _GrepPattern, context: int) -> list[str]:
+        """Match line by line, with the same line breaks as str.splitlines().
+
+        Lines are walked by offset and only sliced out when tested or shown;
+        lines without the required literal are skipped unsliced.
+        """
+        regex = grep.regex
+        line_probe = None if grep.ignorecase else grep.probe
+
+        file_matches = []
+        before: deque[tuple[int, int, int]] = deque(maxlen=context)  # Recent line spans
+        # Blocks still collecting trailing context: [lines, lines still wanted]
+        open_blocks: deque[list[Any]] = deque()
+
+        for i, (start, end) in enumerate(_line_spans(text)):
+            line = None
+            if open_blocks:
+                line = text[start:end]
+                for block in open_blocks:
+                    block[0].append(f"  {i + 1:4}: {line}")
+                    block[1] -= 1
+                while open_blocks and open_blocks[0][1] == 0:
+                    file_matches.append("\n".join(open_blocks.popleft()[0]))
+
+            if line_probe is None or text.find(line_probe, start, end) != -1:
+                if line is None:
+                    line = text[start:end]
+                if regex.search(line):
+                    block = [f"  {j + 1:4}: {text[s:e]}" for j, s, e in before]
+                    block.append(f"> {i + 1:4}: {line}")
+                    if context:
+                        open_blocks.append([block, context])
+                    else:
+                        file_matches.append("\n".join(block))
+
+            before.append((i, start, end))
+
+        file_matches.extend("\n".join(block) for block, _ in open_blocks)
+        return file_matches
+
     async def execute(
         self,
         pattern: str,
@@ -83,7 +553,7 @@ Examples:
 
         try:
             flags = re.IGNORECASE if case_insensitive else 0
-            regex = re.compile(pattern, flags)
+            grep = _GrepPattern.compile(pattern, flags)
         except re.error as e:
             return ToolResult(
                 success=False,
@@ -96,38 +566,48 @@ Examples:
             files_searched = 0
             files_with_matches = 0
 
-            for file_path in base_dir.glob(file_pattern):
-                if not file_path.is_file():
-                    continue
+            # Files are scanned in worker threads, up to GREP_CONCURRENCY ahead
+            # of the one being collected, so results keep glob order
+            pending: deque[tuple[str, asyncio.Future[list[str] | None]]] = deque()
 
+            async def collect() -> bool:
+                """Take the oldest scan's result; True once the result limit is hit."""
+                nonlocal files_searched, files_with_matches
+                file_path, scan = pending.popleft()
                 try:
-                    content = file_path.read_text(encoding="utf-8", errors="replace")
-                    lines = content.splitlines()
-                    files_searched += 1
-
-                    file_matches = []
-                    for i, line in enumerate(lines):
-                        if regex.search(line):
-                            # Get context lines
-                            start = max(0, i - context)
-                            end = min(len(lines), i + context + 1)
+                    file_matches = await scan
+                except (UnicodeDecodeError, PermissionError):
+                    return False
+                if file_matches is None:
+                    # Binary file
+                    return False
+                files_searched += 1
 
-                            context_block = []
-                            for j in range(start, end):
-                                prefix = ">" if j == i else " "
-                                context_block.append(f"{prefix} {j + 1:4}: {lines[j]}")
+                if file_matches:
+                    files_with_matches += 1
+                    matches.append(f"--- {file_path} ---\n" + "\n...\n".join(file_matches))
 
-                            file_matches.append("\n".join(context_block))
+                return len(matches) >= self.max_results
 
-                    if file_matches:
-                        files_with_matches += 1
-                        matches.append(f"--- {file_path} ---\n" + "\n...\n".join(file_matches))
+            try:
+                limit_hit = False
+                ignore = IgnoreRules(base_dir)
+                for entry in iter_glob_files(base_dir, file_pattern, ignore):
+                    if os.path.splitext(entry.name)[1].lower() in _BINARY_EXTS:
+                        continue
 
-                        if len(matches) >= self.max_results:
-                            break
+                    scan = asyncio.ensure_future(
+                        asyncio.to_thread(self._search_file, entry, grep, context)
+                    )
+                    pending.append((entry.path, scan))
+                    if len(pending) >= GREP_CONCURRENCY and (limit_hit := await collect()):
+                        break
 
-                except (UnicodeDecodeError, PermissionError):
-                    continue
+                while pending and not limit_hit:
+                    limit_hit = await collect()
+            finally:
+                for _, scan in pending:
+                    scan.cancel()
 
             if not matches:
                 return ToolResult(
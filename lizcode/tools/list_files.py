@@ -2,10 +2,68 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from lizcode.tools.base import Permission, Tool, ToolResult
+from lizcode.tools.glob import IgnoreRules
+
+# Concurrent stats when listing recursively on a network filesystem
+STAT_WORKERS = 16
+
+# Filesystem types where a stat is a network round trip
+_NETWORK_FS = frozenset({
+    "nfs", "nfs4", "cifs", "smb3", "smbfs", "9p", "ceph", "glusterfs", "lustre", "afs", "davfs",
+})
+
+
+def _on_network_fs(path: str) -> bool:
+    """Whether path lives on a network or FUSE mount, per /proc/self/mounts."""
+    try:
+        with open("/proc/self/mounts") as f:
+            mounts = f.read().splitlines()
+    except OSError:
+        return False
+
+    best, fstype = "", ""
+    for line in mounts:
+        fields = line.split()
+        if len(fields) < 3:
+            continue
+        mount_point = fields[1].replace("\\040", " ")
+        if (
+            path == mount_point or path.startswith(mount_point.rstrip("/") + "/")
+        ) and len(mount_point) >= len(best):
+            best, fstype = mount_point, fields[2]
+    return fstype in _NETWORK_FS or fstype.startswith("fuse.")
+
+
+def _walk(directory: str, ignore: IgnoreRules | None) -> Iterator[os.DirEntry[str]]:
+    """Yield the entries of a directory, and with ``ignore`` those below it.
+
+    Recursion skips symlinked and pruned directories, and entries the
+    ignore rules exclude. Only the top-level listing raises; unreadable
+    subdirectories are skipped.
+    """
+    with os.scandir(directory) as it:
+        entries = list(it)
+    for entry in entries:
+        if ignore is None:
+            yield entry
+            continue
+        is_dir = entry.is_dir(follow_symlinks=False)
+        if ignore.ignored(entry, is_dir):
+            continue
+        yield entry
+        if is_dir and not ignore.prune(entry):
+            try:
+                yield from _walk(entry.path, ignore)
+            except OSError:
+                continue
 
 
 class ListFilesTool(Tool):
@@ -16,7 +74,8 @@ class ListFilesTool(Tool):
 
 Usage:
 - Lists contents of a directory
-- Can list recursively for full directory trees
+- Can list recursively for full directory trees; recursion does not expand
+  .git, node_modules, __pycache__, virtualenvs or build output
 - Shows file sizes and indicates directories with /
 - Useful for exploring project structure"""
 
@@ -71,32 +130,7 @@ Usage:
             )
 
         try:
-            entries = []
-
-            if recursive:
-                iterator = base_dir.rglob("*")
-            else:
-                iterator = base_dir.iterdir()
-
-            for path in sorted(iterator):
-                # Skip hidden files unless requested
-                if not show_hidden and path.name.startswith("."):
-                    continue
-
-                # Format entry
-                try:
-                    rel_path = path.relative_to(base_dir)
-                    if path.is_dir():
-                        entries.append(f"{rel_path}/")
-                    else:
-                        size = path.stat().st_size
-                        size_str = self._format_size(size)
-                        entries.append(f"{rel_path} ({size_str})")
-                except (PermissionError, OSError):
-                    continue
-
-                if len(entries) >= self.max_entries:
-                    break
+            entries = await asyncio.to_thread(self._list, base_dir, recursive, show_hidden)
 
             if not entries:
                 return ToolResult(
@@ -127,11 +161,60 @@ Usage:
                 error=f"Error listing directory: {e}",
             )
 
+    def _list(self, base_dir: Path, recursive: bool, show_hidden: bool) -> list[str]:
+        """Collect up to max_entries formatted entries, sorted by path.
+
+        Runs in a worker thread. On network filesystems, where each stat is
+        a round trip, sizes are fetched STAT_WORKERS at a time.
+        """
+        ignore = IgnoreRules(base_dir) if recursive else None
+        # Entry paths are base_dir joined with the relative path
+        prefix = len(os.path.join(base_dir, ""))
+        # Skip hidden files unless requested, before paying to sort them
+        listing = [
+            (entry.path[prefix:], entry)
+            for entry in _walk(str(base_dir), ignore)
+            if show_hidden or not entry.name.startswith(".")
+        ]
+        # Sort component-wise, the way Path objects order
+        listing.sort(key=lambda item: item[0].split(os.sep))
+
+        def describe(item: tuple[str, os.DirEntry[str]]) -> str | None:
+            rel_path, entry = item
+            try:
+                if entry.is_dir():
+                    return f"{rel_path}/"
+                return f"{rel_path} ({self._format_size(entry.stat().st_size)})"
+            except (PermissionError, OSError):
+                return None
+
+        entries: list[str] = []
+        if recursive and _on_network_fs(str(base_dir)):
+            with ThreadPoolExecutor(max_workers=STAT_WORKERS) as pool:
+                for i in range(0, len(listing), STAT_WORKERS * 4):
+                    batch = listing[i:i + STAT_WORKERS * 4]
+                    entries.extend(e for e in pool.map(describe, batch) if e is not None)
+                    if len(entries) >= self.max_entries:
+                        break
+        else:
+            for item in listing:
+                described = describe(item)
+                if described is not None:
+                    entries.append(described)
+                    if len(entries) >= self.max_entries:
+                        break
+
+        return entries[: self.max_entries]
+
     @staticmethod
     def _format_size(size: int) -> str:
         """Format file size in human-readable format."""
-        for unit in ["B", "KB", "MB", "GB"]:
-            if size < 1024:
-                return f"{size:.1f}{unit}" if unit != "B" else f"{size}{unit}"
-            size /= 1024
-        return f"{size:.1f}TB"
+        if size < 1024:
+            return f"{size}B"
+        if size < 1024**2:
+            return f"{size / 1024:.1f}KB"
+        if size < 1024**3:
+            return f"{size / 1024**2:.1f}MB"
+        if size < 1024**4:
+            return f"{size / 1024**3:.1f}GB"
+        return f"{size / 1024**4:.1f}TB"
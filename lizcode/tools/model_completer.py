@@ -3,14 +3,38 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Iterable
+import bisect
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator
 
-from prompt_toolkit.completion import CompleteEvent, Completer, Completion
-from prompt_toolkit.document import Document
+from prompt_toolkit.completion import Completer, Completion
+
+from lizcode.tools.edit_file import write_atomic
 
 if TYPE_CHECKING:
+    from prompt_toolkit.completion import CompleteEvent
+    from prompt_toolkit.document import Document
+
     from lizcode.config.settings import Settings
 
+# Seconds before fetched model lists are refreshed
+MODEL_CACHE_TTL = 600.0
+
+# Seconds before retrying a provider whose listing failed: 1, 2, 4, ... up to this
+RETRY_BACKOFF_MAX = 60.0
+
+# Seconds a model list saved to disk stays usable by later runs
+DISK_CACHE_TTL = 6 * 3600.0
+
+# Provider names offered before a "/"
+_PROVIDERS: tuple[str, ...] = ("openrouter", "ollama")
+
+# Most models offered per keystroke; typing more narrows the rest down
+MAX_COMPLETIONS = 50
+
 
 class ModelCompleter(Completer):
     """Tab completer for model names with provider prefix support."""
@@ -18,27 +42,112 @@ class ModelCompleter(Completer):
     def __init__(self, settings: Settings):
         self.settings = settings
         self._model_cache: dict[str, list[str]] = {}
-        self._cache_refresh_task: asyncio.Task | None = None
+        # Sorted copies of the cached lists, for bisecting to a prefix
+        self._sorted_models: dict[str, list[str]] = {}
+        # Per provider: time.monotonic() and time.time() of the last refresh
+        self._fetched_at: dict[str, float] = {}
+        self._fetched_wall: dict[str, float] = {}
+        # Consecutive failed refreshes per provider, for backoff
+        self._failures: dict[str, int] = {}
+        self._refresh_tasks: dict[str, asyncio.Task] = {}
+        self._cache_path = self._disk_cache_path(settings)
+        self._load_disk_cache()
+
+    @staticmethod
+    def _disk_cache_path(settings: Settings) -> Path:
+        """Cache file for the model lists, keyed on the endpoints they came from."""
+        endpoints = f"{settings.openrouter_base_url}\n{settings.ollama_host}"
+        key = hashlib.sha256(endpoints.encode()).hexdigest()[:16]
+        return settings.config_dir / "cache" / f"models-{key}.json"
+
+    def _load_disk_cache(self) -> None:
+        """Seed the cache with lists a previous run saved, if still fresh."""
+        try:
+            data = json.loads(self._cache_path.read_text())
+            entries = [(name, entry["ts"], entry["models"]) for name, entry in data.items()]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return
+        now, now_wall = time.monotonic(), time.time()
+        for name, fetched_wall, models in entries:
+            age = now_wall - fetched_wall
+            if isinstance(models, list) and 0 <= age < DISK_CACHE_TTL:
+                self._set_models(name, models)
+                self._fetched_at[name] = now - age
+                self._fetched_wall[name] = fetched_wall
+
+    def _save_disk_cache(self) -> None:
+        """Write the model lists for later runs, atomically."""
+        data = {
+            name: {"ts": self._fetched_wall[name], "models": models}
+            for name, models in self._model_cache.items()
+        }
+        try:
+            content = json.dumps(data)
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(self._cache_path, content)
+        except (OSError, ValueError, TypeError):
+            pass
+
+    def _set_models(self, provider: str, models: list[str]) -> None:
+        """Cache a provider's model list along with its sorted index."""
+        self._model_cache[provider] = models
+        self._sorted_models[provider] = sorted(models)
+
+    def _models_with_prefix(self, provider: str, prefix: str) -> Iterator[str]:
+        """Yield up to MAX_COMPLETIONS cached models starting with prefix, sorted."""
+        self._get_cached_models(provider)
+        models = self._sorted_models.get(provider, [])
+        lo = bisect.bisect_left(models, prefix)
+        for i in range(lo, min(lo + MAX_COMPLETIONS, len(models))):
+            if not models[i].startswith(prefix):
+                break
+            yield models[i]
+
+    def _providers(self) -> list[str]:
+        """Providers whose models can be listed with the current settings."""
+        providers = []
+        if self.settings.provider == "openrouter" and self.settings.openrouter_api_key:
+            providers.append("openrouter")
+        providers.append("ollama")
+        return providers
+
+    def warmup(self) -> None:
+        """Start fetching model lists in the background unless they are fresh.
+
+        Called once the event loop is running, so the first /model TAB
+        finds a warm cache instead of waiting on the network.
+        """
+        for provider in self._providers():
+            self._revalidate(provider)
+
+    def _revalidate(self, provider: str) -> None:
+        """Refresh a provider's list in the background once it has gone stale.
+
+        At most one refresh per provider runs at a time. After a failure the
+        provider is retried with exponential backoff instead of waiting out
+        the full TTL, so a server started mid-session is picked up quickly.
+        """
+        fetched_at = self._fetched_at.get(provider)
+        failures = self._failures.get(provider)
+        ttl = min(RETRY_BACKOFF_MAX, 2.0 ** (failures - 1)) if failures else MODEL_CACHE_TTL
+        if fetched_at is not None and time.monotonic() - fetched_at <= ttl:
+            return
+        task = self._refresh_tasks.get(provider)
+        if task is None or task.done():
+            self._refresh_tasks[provider] = asyncio.ensure_future(self._refresh(provider))
 
     def get_completions(
         self, document: Document, complete_event: CompleteEvent
     ) -> Iterable[Completion]:
         """Provide completions for /model commands."""
         text = document.text_before_cursor
-        
-        # Only complete if we're in a /model command
-        if not text.startswith("/model"):
-            return
-        
-        # Get the part after "/model "
-        if len(text) <= 7:  # "/model" length
-            return
-        
-        if text[6] != " ":  # Should have space after /model
+
+        # Only complete after "/model " (runs on every keystroke, so one check)
+        if len(text) <= 7 or not text.startswith("/model "):
             return
-            
+
         incomplete = text[7:]  # Everything after "/model "
-        
+
         # Generate completions
         for completion in self._get_model_completions(incomplete):
             yield completion
@@ -48,93 +157,103 @@ class ModelCompleter(Completer):
         # Handle provider prefix completion
         if "/" not in incomplete:
             # Complete provider names
-            providers = ["openrouter", "ollama"]
-            for provider in providers:
-                if provider.startswith(incomplete.lower()):
+            typed = incomplete.lower()
+            start = -len(incomplete)
+            for provider in _PROVIDERS:
+                if provider.startswith(typed):
+                    choice = f"{provider}/"
                     yield Completion(
-                        text=f"{provider}/",
-                        start_position=-len(incomplete),
-                        display=f"{provider}/",
+                        text=choice,
+                        start_position=start,
+                        display=choice,
                         display_meta="Provider"
                     )
         else:
             # Complete specific models within provider
-            provider_prefix, model_partial = incomplete.split("/", 1)
+            provider_prefix, _, model_partial = incomplete.partition("/")
             provider = provider_prefix.lower()
-            
+            start = -len(model_partial)
+
             if provider == "openrouter":
-                models = self._get_cached_models("openrouter")
-                for model_id in models:
-                    if model_id.startswith(f"{provider_prefix}/{model_partial}"):
-                        # Extract just the model part after provider/
-                        model_name = model_id[len(f"{provider_prefix}/"):]
-                        yield Completion(
-                            text=model_name,
-                            start_position=-len(model_partial),
-                            display=model_name,
-                            display_meta="OpenRouter model"
-                        )
+                key = f"{provider_prefix}/{model_partial}"
+                prefix_len = len(provider_prefix) + 1
+                for model_id in self._models_with_prefix("openrouter", key):
+                    # Extract just the model part after provider/
+                    model_name = model_id[prefix_len:]
+                    yield Completion(
+                        text=model_name,
+                        start_position=start,
+                        display=model_name,
+                        display_meta="OpenRouter model"
+                    )
             elif provider == "ollama":
-                models = self._get_cached_models("ollama")
-                for model_name in models:
-                    if model_name.startswith(model_partial):
-                        yield Completion(
-                            text=model_name,
-                            start_position=-len(model_partial),
-                            display=model_name,
-                            display_meta="Ollama model"
-                        )
+                for model_name in self._models_with_prefix("ollama", model_partial):
+                    yield Completion(
+                        text=model_name,
+                        start_position=start,
+                        display=model_name,
+                        display_meta="Ollama model"
+                    )
 
     def _get_cached_models(self, provider: str) -> list[str]:
-        """Get cached model list for a provider."""
-        if provider not in self._model_cache:
-            # Start background refresh if not already running
-            if self._cache_refresh_task is None or self._cache_refresh_task.done():
-                self._cache_refresh_task = asyncio.create_task(self._refresh_model_cache())
-            return []
-        
+        """Get the last known model list for a provider without waiting.
+
+        Stale-while-revalidate: a stale list is still returned while a
+        background refresh fetches the new one.
+        """
+        if provider in self._providers():
+            self._revalidate(provider)
         return self._model_cache.get(provider, [])
 
-    async def _refresh_model_cache(self) -> None:
-        """Refresh model cache from providers."""
+    async def _refresh(self, provider: str) -> None:
+        """Fetch one provider's models into the cache and save them to disk."""
         try:
-            # Create providers to fetch models
-            if self.settings.provider == "openrouter":
-                if self.settings.openrouter_api_key:
-                    from lizcode.core.providers.openrouter import OpenRouterProvider
-                    provider = OpenRouterProvider(
-                        api_key=self.settings.openrouter_api_key,
-                        model=self.settings.openrouter_model,
-                        base_url=self.settings.openrouter_base_url,
-                    )
-                    try:
-                        models = await provider.list_models()
-                        self._model_cache["openrouter"] = models
-                    finally:
-                        await provider.close()
+            models = await self._fetch_models(provider)
+        except Exception:
+            # Don't crash completion on network errors
+            models = None
+
+        # Failures also count, so an unreachable provider isn't retried per TAB
+        self._fetched_at[provider] = time.monotonic()
+        if not models:
+            # An empty list is how OpenRouterProvider reports errors; keep
+            # serving the last good list meanwhile
+            self._failures[provider] = self._failures.get(provider, 0) + 1
+            return
 
-            # Always try to get Ollama models if possible
+        self._failures.pop(provider, None)
+        self._set_models(provider, models)
+        self._fetched_wall[provider] = time.time()
+        self._save_disk_cache()
+
+    async def _fetch_models(self, provider: str) -> list[str]:
+        """List a provider's models over the network."""
+        if provider == "openrouter":
+            from lizcode.core.providers.openrouter import OpenRouterProvider
+            openrouter_provider = OpenRouterProvider(
+                api_key=self.settings.openrouter_api_key,
+                model=self.settings.openrouter_model,
+                base_url=self.settings.openrouter_base_url,
+            )
             try:
-                from lizcode.core.providers.ollama import OllamaProvider
-                ollama_provider = OllamaProvider(
-                    model=self.settings.ollama_model,
-                    host=self.settings.ollama_host,
-                )
-                try:
-                    if await ollama_provider.is_available():
-                        models = await ollama_provider.list_models()
-                        self._model_cache["ollama"] = models
-                finally:
-                    await ollama_provider.close()
-            except Exception:
-                # Ollama might not be available, that's ok
-                pass
+                return await openrouter_provider.list_models()
+            finally:
+                await openrouter_provider.close()
 
-        except Exception:
-            # Don't crash completion on network errors
-            pass
+        from lizcode.core.providers.ollama import OllamaProvider
+        ollama_provider = OllamaProvider(
+            model=self.settings.ollama_model,
+            host=self.settings.ollama_host,
+        )
+        try:
+            # No separate is_available() probe: it requests the same endpoint,
+            # and a failed listing already counts as unavailable
+            return await ollama_provider.list_models()
+        finally:
+            await ollama_provider.close()
 
     async def close(self) -> None:
         """Cleanup completer resources."""
-        if self._cache_refresh_task and not self._cache_refresh_task.done():
-            self._cache_refresh_task.cancel()
\ No newline at end of file
+        for task in self._refresh_tasks.values():
+            if not task.done():
+                task.cancel()
\ No newline at end of file
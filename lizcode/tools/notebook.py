@@ -8,6 +8,60 @@ from typing import Any
 
 from lizcode.core.state import Mode
 from lizcode.tools.base import Permission, Tool, ToolResult
+from lizcode.tools.edit_file import write_atomic
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, installed with the "fast" extra
+    orjson = None
+
+
+def _read_notebook(path: Path) -> dict[str, Any]:
+    """Parse a notebook file, with orjson when it is installed."""
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dump_notebook(notebook: dict[str, Any]) -> bytes:
+    """Serialize a notebook the way nbformat does: one-space indent, UTF-8, trailing newline.
+
+    orjson can only indent by two spaces, which would re-indent every line of
+    a notebook saved by Jupyter, so it is only used for parsing.
+    """
+    return (json.dumps(notebook, indent=1, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+# Characters of each cell shown by the read action
+PREVIEW_CHARS = 500
+
+
+def _source_preview(source: list[str] | str) -> str:
+    """Cell source cut to PREVIEW_CHARS, joining only the lines that are shown."""
+    if isinstance(source, str):
+        parts = [source]
+    else:
+        parts, total = [], 0
+        for line in source:
+            parts.append(line)
+            total += len(line)
+            if total > PREVIEW_CHARS:
+                break
+    src = "".join(parts)
+    # Truncate long cells
+    if len(src) > PREVIEW_CHARS:
+        src = src[:PREVIEW_CHARS] + "..."
+    return src
+
+
+# Arguments each action needs, checked before the notebook is read
+_REQUIRED_ARGS: dict[str, tuple[str, ...]] = {
+    "read": (),
+    "edit": ("cell_number", "source"),
+    "insert": ("cell_number", "source"),
+    "delete": ("cell_number",),
+}
 
 
 class NotebookEditTool(Tool):
@@ -29,11 +83,35 @@ Cell types: "code" or "markdown"."""
 
     def __init__(self):
         self._mode: Mode | None = None
+        # Parsed notebooks by path, with the (mtime_ns, size) they were read at
+        self._nb_cache: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
 
     def set_mode(self, mode: Mode) -> None:
         """Set current mode for action validation."""
         self._mode = mode
 
+    def _load(self, path: Path) -> dict[str, Any]:
+        """Take a notebook out of the cache, or parse it if it changed on disk.
+
+        The caller owns the returned dict and hands it back with _keep()
+        once the file matches it again.
+        """
+        st = path.stat()
+        cached = self._nb_cache.pop(path, None)
+        if cached is not None and cached[0] == (st.st_mtime_ns, st.st_size):
+            return cached[1]
+        return _read_notebook(path)
+
+    def _keep(self, path: Path, notebook: dict[str, Any]) -> None:
+        """Cache a notebook that matches the file as it is now."""
+        st = path.stat()
+        self._nb_cache[path] = ((st.st_mtime_ns, st.st_size), notebook)
+
+    def _save(self, path: Path, notebook: dict[str, Any]) -> None:
+        """Write a notebook and keep it cached for the next action."""
+        write_atomic(path, _dump_notebook(notebook))
+        self._keep(path, notebook)
+
     @property
     def parameters(self) -> dict[str, Any]:
         return {
@@ -92,26 +170,46 @@ Cell types: "code" or "markdown"."""
                 error=f"Not a notebook file: {notebook_path}",
             )
 
+        # Argument checks come before any file access
+        if action not in _REQUIRED_ARGS:
+            return ToolResult(
+                success=False,
+                output="",
+                error=f"Unknown action: {action}",
+            )
+        args = {"cell_number": cell_number, "source": source}
+        for arg in _REQUIRED_ARGS[action]:
+            if args[arg] is None:
+                return ToolResult(
+                    success=False,
+                    output="",
+                    error=f"{arg} required for '{action}' action",
+                )
+        if action in ("edit", "delete") and cell_number < 0:
+            return ToolResult(
+                success=False,
+                output="",
+                error=f"Cell {cell_number} out of range",
+            )
+
         try:
-            if action == "read":
-                if not path.exists():
-                    return ToolResult(
-                        success=False,
-                        output="",
-                        error=f"Notebook not found: {notebook_path}",
-                    )
+            if action != "insert" and not path.exists():
+                return ToolResult(
+                    success=False,
+                    output="",
+                    error=f"Notebook not found: {notebook_path}",
+                )
 
-                notebook = json.loads(path.read_text(encoding="utf-8"))
+            if action == "read":
+                notebook = self._load(path)
+                self._keep(path, notebook)
                 cells = notebook.get("cells", [])
 
                 output_parts = [f"Notebook: {notebook_path}", f"Cells: {len(cells)}", ""]
 
                 for i, cell in enumerate(cells):
                     ct = cell.get("cell_type", "unknown")
-                    src = "".join(cell.get("source", []))
-                    # Truncate long cells
-                    if len(src) > 500:
-                        src = src[:500] + "..."
+                    src = _source_preview(cell.get("source", []))
                     output_parts.append(f"--- Cell {i} ({ct}) ---")
                     output_parts.append(src)
                     output_parts.append("")
@@ -122,29 +220,11 @@ Cell types: "code" or "markdown"."""
                 )
 
             elif action == "edit":
-                if cell_number is None:
-                    return ToolResult(
-                        success=False,
-                        output="",
-                        error="cell_number required for 'edit' action",
-                    )
-                if source is None:
-                    return ToolResult(
-                        success=False,
-                        output="",
-                        error="source required for 'edit' action",
-                    )
-                if not path.exists():
-                    return ToolResult(
-                        success=False,
-                        output="",
-                        error=f"Notebook not found: {notebook_path}",
-                    )
-
-                notebook = json.loads(path.read_text(encoding="utf-8"))
+                notebook = self._load(path)
                 cells = notebook.get("cells", [])
 
-                if cell_number < 0 or cell_number >= len(cells):
+                if cell_number >= len(cells):
+                    self._keep(path, notebook)
                     return ToolResult(
                         success=False,
                         output="",
@@ -154,7 +234,7 @@ Cell types: "code" or "markdown"."""
                 # Update cell source
                 cells[cell_number]["source"] = source.splitlines(keepends=True)
 
-                path.write_text(json.dumps(notebook, indent=1), encoding="utf-8")
+                self._save(path, notebook)
 
                 return ToolResult(
                     success=True,
@@ -162,21 +242,8 @@ Cell types: "code" or "markdown"."""
                 )
 
             elif action == "insert":
-                if cell_number is None:
-                    return ToolResult(
-                        success=False,
-                        output="",
-                        error="cell_number required for 'insert' action",
-                    )
-                if source is None:
-                    return ToolResult(
-                        success=False,
-                        output="",
-                        error="source required for 'insert' action",
-                    )
-
                 if path.exists():
-                    notebook = json.loads(path.read_text(encoding="utf-8"))
+                    notebook = self._load(path)
                 else:
                     # Create new notebook
                     notebook = {
@@ -202,31 +269,19 @@ Cell types: "code" or "markdown"."""
                 cells.insert(cell_number, new_cell)
                 notebook["cells"] = cells
 
-                path.write_text(json.dumps(notebook, indent=1), encoding="utf-8")
+                self._save(path, notebook)
 
                 return ToolResult(
                     success=True,
                     output=f"Inserted {cell_type} cell at position {cell_number}",
                 )
 
-            elif action == "delete":
-                if cell_number is None:
-                    return ToolResult(
-                        success=False,
-                        output="",
-                        error="cell_number required for 'delete' action",
-                    )
-                if not path.exists():
-                    return ToolResult(
-                        success=False,
-                        output="",
-                        error=f"Notebook not found: {notebook_path}",
-                    )
-
-                notebook = json.loads(path.read_text(encoding="utf-8"))
+            else:  # delete
+                notebook = self._load(path)
                 cells = notebook.get("cells", [])
 
-                if cell_number < 0 or cell_number >= len(cells):
+                if cell_number >= len(cells):
+                    self._keep(path, notebook)
                     return ToolResult(
                         success=False,
                         output="",
@@ -236,20 +291,13 @@ Cell types: "code" or "markdown"."""
                 deleted = cells.pop(cell_number)
                 notebook["cells"] = cells
 
-                path.write_text(json.dumps(notebook, indent=1), encoding="utf-8")
+                self._save(path, notebook)
 
                 return ToolResult(
                     success=True,
                     output=f"Deleted cell {cell_number} ({deleted.get('cell_type', 'unknown')})",
                 )
 
-            else:
-                return ToolResult(
-                    success=False,
-                    output="",
-                    error=f"Unknown action: {action}",
-                )
-
         except json.JSONDecodeError as e:
             return ToolResult(
                 success=False,
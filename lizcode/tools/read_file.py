@@ -2,10 +2,84 @@
 
 from __future__ import annotations
 
+import io
+import itertools
+import mmap
+import os
 from pathlib import Path
 from typing import Any
 
 from lizcode.tools.base import Permission, Tool, ToolResult
+from lizcode.tools.grep import MMAP_THRESHOLD, has_other_breaks
+
+# Bytes sliced out of the mapping at a time when counting lines
+_COUNT_CHUNK = 1 << 20
+
+
+def _skip_lines(mm: mmap.mmap, count: int) -> tuple[int, int]:
+    """Find where line number `count` (0-indexed) starts.
+
+    Returns the byte position and the number of lines skipped, which is
+    less than `count` when the file is shorter.
+    """
+    pos = skipped = 0
+    size = len(mm)
+    while skipped < count and pos < size:
+        chunk = mm[pos : pos + _COUNT_CHUNK]
+        newlines = chunk.count(b"\n")
+        if skipped + newlines < count:
+            skipped += newlines
+            pos += len(chunk)
+            continue
+        i = -1
+        for _ in range(count - skipped):
+            i = chunk.find(b"\n", i + 1)
+        return pos + i + 1, count
+    # Ran out of file; an unterminated last line still counts
+    if skipped < count and mm[-1] != ord("\n"):
+        skipped += 1
+    return pos, skipped
+
+
+def _count_lines(mm: mmap.mmap, start: int) -> int:
+    """Count the lines from byte position `start` to the end of the file."""
+    size = len(mm)
+    lines = sum(
+        mm[pos : pos + _COUNT_CHUNK].count(b"\n") for pos in range(start, size, _COUNT_CHUNK)
+    )
+    if start < size and mm[-1] != ord("\n"):
+        lines += 1
+    return lines
+
+
+def _read_window_text(path: Path, offset: int, limit: int) -> tuple[list[str], int]:
+    """Lines offset..offset+limit and the total line count, from decoded text."""
+    # Only the requested window is kept; other lines are just counted.
+    # splitlines() per line keeps str.splitlines() semantics for the
+    # rarer breaks (\f, \x1c, \u2028, ...) that file iteration ignores.
+    with path.open(encoding="utf-8", errors="replace") as f:
+        lines = itertools.chain.from_iterable(map(str.splitlines, f))
+        skipped = sum(1 for _ in itertools.islice(lines, offset))
+        selected_lines = list(itertools.islice(lines, limit))
+        return selected_lines, skipped + len(selected_lines) + sum(1 for _ in lines)
+
+
+def _read_window_mapped(mm: mmap.mmap, offset: int, limit: int) -> tuple[list[str], int]:
+    """Lines offset..offset+limit and the total line count, from raw bytes.
+
+    Only valid when the only line breaks are \n and \r\n; the window is
+    the only part that gets decoded.
+    """
+    start, skipped = _skip_lines(mm, offset)
+    end = start
+    for _ in range(limit):
+        newline = mm.find(b"\n", end)
+        if newline == -1:
+            end = len(mm)
+            break
+        end = newline + 1
+    selected_lines = mm[start:end].decode("utf-8", errors="replace").splitlines()
+    return selected_lines, skipped + len(selected_lines) + _count_lines(mm, end)
 
 
 class ReadFileTool(Tool):
@@ -74,23 +148,37 @@ Usage:
             )
 
         try:
-            # Try to read as text
-            content = path.read_text(encoding="utf-8", errors="replace")
-            lines = content.splitlines()
-
-            # Apply offset and limit
-            total_lines = len(lines)
-            selected_lines = lines[offset : offset + limit]
-
-            # Format with line numbers
-            output_lines = []
+            offset = max(offset, 0)
+            window = None
+            with path.open("rb") as f:
+                if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if not has_other_breaks(mm):
+                            # Large file with plain line breaks: count lines in
+                            # the raw bytes and decode only the window
+                            window = _read_window_mapped(mm, offset, limit)
+
+            if window is None:
+                window = _read_window_text(path, offset, limit)
+            selected_lines, total_lines = window
+
+            # Format with line numbers, written straight into one buffer
+            buf = io.StringIO()
+            write = buf.write
+            max_len = self.max_line_length
             for i, line in enumerate(selected_lines, start=offset + 1):
                 # Truncate long lines
-                if len(line) > self.max_line_length:
-                    line = line[: self.max_line_length] + "..."
-                output_lines.append(f"{i:6}\t{line}")
-
-            output = "\n".join(output_lines)
+                if len(line) > max_len:
+                    line = line[:max_len] + "..."
+                write(str(i).rjust(6))
+                write("\t")
+                write(line)
+                write("\n")
+
+            # Drop the last newline
+            if selected_lines:
+                buf.truncate(buf.tell() - 1)
+            output = buf.getvalue()
 
             # Add info about truncation
             if offset > 0 or offset + limit < total_lines:
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections import ChainMap
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Callable
 
@@ -119,27 +121,29 @@ When user says "/commit" or "run /commit", use this tool."""
     permission = Permission.READ  # Skills themselves may trigger other tools
 
     def __init__(self):
-        self._skills = BUILTIN_SKILLS.copy()
         self._custom_skills: dict[str, Skill] = {}
+        # Custom skills shadow built-ins of the same name
+        self._skills = ChainMap(self._custom_skills, BUILTIN_SKILLS)
 
     def register_skill(self, skill: Skill) -> None:
         """Register a custom skill."""
         self._custom_skills[skill.name] = skill
+        # The skill list is part of the parameters schema
+        self.__dict__.pop("parameters", None)
+        self.invalidate_schema()
 
     def get_skill(self, name: str) -> Skill | None:
         """Get a skill by name."""
-        # Remove leading slash if present
-        name = name.lstrip("/")
-        return self._custom_skills.get(name) or self._skills.get(name)
+        # Remove one leading slash if present: "//commit" is not a skill name
+        return self._skills.get(name.removeprefix("/"))
 
     def list_skills(self) -> list[Skill]:
         """List all available skills."""
-        all_skills = {**self._skills, **self._custom_skills}
-        return list(all_skills.values())
+        return list(self._skills.values())
 
-    @property
+    @cached_property
     def parameters(self) -> dict[str, Any]:
-        skill_names = list(self._skills.keys()) + list(self._custom_skills.keys())
+        skill_names = list(self._skills)
         return {
             "type": "object",
             "properties": {
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 from lizcode.core.subagent import SubagentType
@@ -10,6 +11,8 @@ from lizcode.tools.base import Permission, Tool, ToolResult
 if TYPE_CHECKING:
     from lizcode.core.subagent import SubagentManager
 
+SUBAGENT_TYPES = tuple(t.value for t in SubagentType)
+
 
 class TaskTool(Tool):
     """Launch specialized subagents to handle complex tasks autonomously."""
@@ -50,14 +53,14 @@ Usage:
         """Set the subagent manager."""
         self._manager = manager
 
-    @property
+    @cached_property
     def parameters(self) -> dict[str, Any]:
         return {
             "type": "object",
             "properties": {
                 "subagent_type": {
                     "type": "string",
-                    "enum": ["explore", "plan", "test_runner", "build_validator", "code_reviewer"],
+                    "enum": list(SUBAGENT_TYPES),
                     "description": "Type of specialized agent to launch",
                 },
                 "prompt": {
@@ -103,13 +106,13 @@ Usage:
             return ToolResult(
                 success=False,
                 output="",
-                error=f"Unknown agent type: {subagent_type}. Use: explore, plan, test_runner, build_validator, code_reviewer",
+                error=f"Unknown agent type: {subagent_type}. Use: {', '.join(SUBAGENT_TYPES)}",
             )
 
         try:
             # Handle resume
             if resume:
-                prompt = self._manager.resume_agent(resume, prompt)
+                prompt = await self._manager.resume_agent(resume, prompt)
 
             # Spawn the agent
             result = await self._manager.spawn(
@@ -182,7 +185,7 @@ This tool will prompt the user interactively and return their response."""
         """
         self._callback = callback
 
-    @property
+    @cached_property
     def parameters(self) -> dict[str, Any]:
         return {
             "type": "object",
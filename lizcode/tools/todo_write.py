@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Callable
 
 from lizcode.core.state import Mode
 from lizcode.tools.base import Permission, Tool, ToolResult
@@ -10,6 +11,17 @@ from lizcode.tools.base import Permission, Tool, ToolResult
 if TYPE_CHECKING:
     from lizcode.core.tasks import TaskList
 
+# Fixed failures, shared rather than rebuilt on every call
+_NOT_INITIALIZED = ToolResult(success=False, output="", error="Task list not initialized")
+_NO_TASK_ID = {
+    action: ToolResult(success=False, output="", error=f"No task_id provided for '{action}' action")
+    for action in ("start", "complete", "remove")
+}
+
+
+def _task_not_found(task_id: str) -> ToolResult:
+    return ToolResult(success=False, output="", error=f"Task not found: {task_id}")
+
 
 class TodoWriteTool(Tool):
     """Create and manage a task list for the current session."""
@@ -51,7 +63,7 @@ Only ONE task can be in_progress at any time."""
         """Set the task list to manage."""
         self._task_list = task_list
 
-    @property
+    @cached_property
     def parameters(self) -> dict[str, Any]:
         return {
             "type": "object",
@@ -96,122 +108,26 @@ Only ONE task can be in_progress at any time."""
     ) -> ToolResult:
         """Execute a task list operation."""
         if not self._task_list:
+            return _NOT_INITIALIZED
+
+        # In Plan mode, only "list" action is allowed
+        if self._mode == Mode.PLAN and action != "list":
             return ToolResult(
                 success=False,
                 output="",
-                error="Task list not initialized",
+                error=f"Action '{action}' not allowed in Plan mode. Only 'list' is available. Switch to Act mode to manage tasks.",
             )
 
-        # In Plan mode, only "list" action is allowed
-        if self._mode == Mode.PLAN and action != "list":
+        handler = self._HANDLERS.get(action)
+        if handler is None:
             return ToolResult(
                 success=False,
                 output="",
-                error=f"Action '{action}' not allowed in Plan mode. Only 'list' is available. Switch to Act mode to manage tasks.",
+                error=f"Unknown action: {action}. Use: create, start, complete, remove, list",
             )
 
         try:
-            if action == "create":
-                if not tasks:
-                    return ToolResult(
-                        success=False,
-                        output="",
-                        error="No tasks provided for 'create' action",
-                    )
-
-                created = self._task_list.add_tasks(tasks)
-                # Format: [id] [ ] content (consistent with to_display)
-                task_lines = [f"[{t.id}] [ ] {t.content}" for t in created]
-                return ToolResult(
-                    success=True,
-                    output="\n".join(task_lines),
-                )
-
-            elif action == "start":
-                if not task_id:
-                    return ToolResult(
-                        success=False,
-                        output="",
-                        error="No task_id provided for 'start' action",
-                    )
-
-                task = self._task_list.start_task(task_id)
-                if not task:
-                    return ToolResult(
-                        success=False,
-                        output="",
-                        error=f"Task not found: {task_id}",
-                    )
-
-                # Format: [id] [>] active_form (consistent with to_display)
-                return ToolResult(
-                    success=True,
-                    output=f"[{task.id}] [>] {task.active_form}",
-                )
-
-            elif action == "complete":
-                if not task_id:
-                    return ToolResult(
-                        success=False,
-                        output="",
-                        error="No task_id provided for 'complete' action",
-                    )
-
-                task = self._task_list.complete_task(task_id)
-                if not task:
-                    return ToolResult(
-                        success=False,
-                        output="",
-                        error=f"Task not found: {task_id}",
-                    )
-
-                # Format: [id] [x] content + progress (consistent with to_display)
-                progress = self._task_list.get_progress_display()
-                return ToolResult(
-                    success=True,
-                    output=f"[{task.id}] [x] {task.content} {progress}",
-                )
-
-            elif action == "remove":
-                if not task_id:
-                    return ToolResult(
-                        success=False,
-                        output="",
-                        error="No task_id provided for 'remove' action",
-                    )
-
-                # Need to get task before removing to show content
-                task = self._task_list.get_task(task_id)
-                if not task:
-                    return ToolResult(
-                        success=False,
-                        output="",
-                        error=f"Task not found: {task_id}",
-                    )
-                
-                content = task.content
-                self._task_list.remove_task(task_id)
-
-                # Format: [id] [-] content (consistent format)
-                return ToolResult(
-                    success=True,
-                    output=f"[{task_id}] [-] {content}",
-                )
-
-            elif action == "list":
-                # Full list only when explicitly requested
-                return ToolResult(
-                    success=True,
-                    output=f"{self._task_list.get_progress_display()}\n{self._task_list.to_display()}",
-                )
-
-            else:
-                return ToolResult(
-                    success=False,
-                    output="",
-                    error=f"Unknown action: {action}. Use: create, start, complete, remove, list",
-                )
-
+            return handler(self, self._task_list, tasks, task_id)
         except ValueError as e:
             return ToolResult(
                 success=False,
@@ -224,3 +140,92 @@ Only ONE task can be in_progress at any time."""
                 output="",
                 error=f"Task operation failed: {e}",
             )
+
+    def _create(
+        self, task_list: TaskList, tasks: list[dict[str, str]] | None, task_id: str | None
+    ) -> ToolResult:
+        if not tasks:
+            return ToolResult(
+                success=False,
+                output="",
+                error="No tasks provided for 'create' action",
+            )
+
+        created = task_list.add_tasks(tasks)
+        # Format: [id] [ ] content (consistent with to_display)
+        task_lines = [f"[{t.id}] [ ] {t.content}" for t in created]
+        return ToolResult(
+            success=True,
+            output="\n".join(task_lines),
+        )
+
+    def _start(
+        self, task_list: TaskList, tasks: list[dict[str, str]] | None, task_id: str | None
+    ) -> ToolResult:
+        if not task_id:
+            return _NO_TASK_ID["start"]
+
+        task = task_list.start_task(task_id)
+        if not task:
+            return _task_not_found(task_id)
+
+        # Format: [id] [>] active_form (consistent with to_display)
+        return ToolResult(
+            success=True,
+            output=f"[{task.id}] [>] {task.active_form}",
+        )
+
+    def _complete(
+        self, task_list: TaskList, tasks: list[dict[str, str]] | None, task_id: str | None
+    ) -> ToolResult:
+        if not task_id:
+            return _NO_TASK_ID["complete"]
+
+        task = task_list.complete_task(task_id)
+        if not task:
+            return _task_not_found(task_id)
+
+        # Format: [id] [x] content + progress (consistent with to_display)
+        progress = task_list.get_progress_display()
+        return ToolResult(
+            success=True,
+            output=f"[{task.id}] [x] {task.content} {progress}",
+        )
+
+    def _remove(
+        self, task_list: TaskList, tasks: list[dict[str, str]] | None, task_id: str | None
+    ) -> ToolResult:
+        if not task_id:
+            return _NO_TASK_ID["remove"]
+
+        # Need to get task before removing to show content
+        task = task_list.get_task(task_id)
+        if not task:
+            return _task_not_found(task_id)
+
+        content = task.content
+        task_list.remove_task(task_id)
+
+        # Format: [id] [-] content (consistent format)
+        return ToolResult(
+            success=True,
+            output=f"[{task_id}] [-] {content}",
+        )
+
+    def _list(
+        self, task_list: TaskList, tasks: list[dict[str, str]] | None, task_id: str | None
+    ) -> ToolResult:
+        # Full list only when explicitly requested
+        return ToolResult(
+            success=True,
+            output=f"{task_list.get_progress_display()}\n{task_list.to_display()}",
+        )
+
+    # Action name -> handler, resolved once for the class
+    _HANDLERS: dict[str, Callable[..., ToolResult]] = {
+        "create": _create,
+        "start": _start,
+        "complete": _complete,
+        "remove": _remove,
+        "list": _list,
+    }
@@ -2,14 +2,54 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
-from typing import Any
+import time
+from collections import OrderedDict
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urljoin, urlparse
 
-import httpx
-
 from lizcode.tools.base import Permission, Tool, ToolResult
 
+if TYPE_CHECKING:
+    import httpx
+
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+# One connection pool for every WebFetchTool, so repeat fetches from the same
+# host reuse an open connection instead of a fresh TCP + TLS handshake. Its
+# connections belong to the event loop that opened them, so it is rebuilt
+# when used from a different loop (a later asyncio.run, subagent runs).
+_CLIENT: httpx.AsyncClient | None = None
+_CLIENT_LOOP: asyncio.AbstractEventLoop | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _CLIENT, _CLIENT_LOOP
+    loop = asyncio.get_running_loop()
+    if _CLIENT is None or _CLIENT.is_closed or _CLIENT_LOOP is not loop:
+        # Imported on first fetch: httpx is most of the cost of importing lizcode.tools
+        import importlib.util
+
+        import httpx
+
+        _CLIENT = httpx.AsyncClient(
+            follow_redirects=True,
+            headers={
+                "User-Agent": "LizCode/1.0 (AI pair programming assistant)",
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            },
+            transport=httpx.AsyncHTTPTransport(
+                retries=1,
+                # HTTP/2 needs h2, installed with the "fast" extra
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60),
+            ),
+        )
+        _CLIENT_LOOP = loop
+    return _CLIENT
+
 
 class WebFetchTool(Tool):
     """Fetch content from a URL and convert to readable format."""
@@ -28,23 +68,39 @@ Returns HTML content (or JSON for API endpoints)."""
 
     permission = Permission.READ
 
-    def __init__(self, timeout: float = 30.0):
+    def __init__(self, timeout: float = 30.0, cache_ttl: float = 300.0, cache_max: int = 128):
         self.timeout = timeout
-        self._client: httpx.AsyncClient | None = None
-
-    async def _get_client(self) -> httpx.AsyncClient:
-        if not self._client:
-            self._client = httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True,
-                headers={
-                    "User-Agent": "LizCode/1.0 (AI pair programming assistant)",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                },
-            )
-        return self._client
-
-    @property
+        self.cache_ttl = cache_ttl
+        self.cache_max = cache_max
+        # URL -> (expiry, output, etag, last_modified), least recently used first
+        self._cache: OrderedDict[str, tuple[float, str, str | None, str | None]] = OrderedDict()
+
+    def _ttl(self, response: httpx.Response) -> float | None:
+        """Seconds a response stays fresh, or None if it must not be cached."""
+        cache_control = response.headers.get("cache-control", "").lower()
+        if "no-store" in cache_control:
+            return None
+        if "no-cache" in cache_control:
+            return 0.0
+        match = _MAX_AGE.search(cache_control)
+        return float(match.group(1)) if match else self.cache_ttl
+
+    def _store(self, url: str, response: httpx.Response, output: str) -> None:
+        ttl = self._ttl(response)
+        if ttl is None:
+            self._cache.pop(url, None)
+            return
+        self._cache[url] = (
+            time.monotonic() + ttl,
+            output,
+            response.headers.get("etag"),
+            response.headers.get("last-modified"),
+        )
+        self._cache.move_to_end(url)
+        while len(self._cache) > self.cache_max:
+            self._cache.popitem(last=False)
+
+    @cached_property
     def parameters(self) -> dict[str, Any]:
         return {
             "type": "object",
@@ -86,30 +142,62 @@ Returns HTML content (or JSON for API endpoints)."""
                 error=f"Invalid URL: {e}",
             )
 
-        try:
-            client = await self._get_client()
-            response = await client.get(url)
-
-            content_type = response.headers.get("content-type", "")
+        cached = self._cache.get(url)
+        if cached is not None and cached[0] > time.monotonic():
+            self._cache.move_to_end(url)
+            return ToolResult(success=True, output=cached[1])
 
-            # Check if it's JSON
-            if "application/json" in content_type:
-                return ToolResult(
-                    success=True,
-                    output=response.text,
-                )
+        # Stale entries are revalidated rather than fetched again
+        headers = {}
+        if cached is not None:
+            if cached[2]:
+                headers["If-None-Match"] = cached[2]
+            if cached[3]:
+                headers["If-Modified-Since"] = cached[3]
 
-            # Return HTML content
-            content = response.text
+        import httpx
 
-            # Truncate if too large (keep first 100KB)
-            max_size = 100_000
-            if len(content) > max_size:
-                content = content[:max_size] + "\n\n[Content truncated - showing first 100KB]"
+        try:
+            client = _get_client()
+            async with client.stream("GET", url, headers=headers, timeout=self.timeout) as response:
+                if response.status_code == 304 and cached is not None:
+                    ttl = self._ttl(response)
+                    self._cache[url] = (time.monotonic() + (ttl or 0.0), *cached[1:])
+                    self._cache.move_to_end(url)
+                    return ToolResult(success=True, output=cached[1])
+
+                content_type = response.headers.get("content-type", "")
+
+                # Check if it's JSON
+                if "application/json" in content_type:
+                    await response.aread()
+                    output = response.text
+                else:
+                    # Return HTML content, reading no further than needed
+                    # to fill the first 100KB
+                    max_size = 100_000
+                    parts = []
+                    size = 0
+                    async for chunk in response.aiter_text():
+                        parts.append(chunk)
+                        size += len(chunk)
+                        if size > max_size:
+                            break
+                    content = "".join(parts)
+
+                    if size > max_size:
+                        content = (
+                            content[:max_size] + "\n\n[Content truncated - showing first 100KB]"
+                        )
+
+                    output = f"URL: {response.url}\nStatus: {response.status_code}\n\n{content}"
+
+            if response.status_code == 200:
+                self._store(url, response, output)
 
             return ToolResult(
                 success=True,
-                output=f"URL: {response.url}\nStatus: {response.status_code}\n\n{content}",
+                output=output,
             )
 
         except httpx.TimeoutException:
@@ -132,7 +220,16 @@ Returns HTML content (or JSON for API endpoints)."""
             )
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Release this tool. The shared HTTP client stays open for other tools; see shutdown()."""
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Close the shared HTTP client; the next fetch opens a new one.
+
+        Called from Agent.close. A client from another event loop is dropped
+        rather than closed, since it can't be awaited from this one.
+        """
+        global _CLIENT, _CLIENT_LOOP
+        client, _CLIENT, loop, _CLIENT_LOOP = _CLIENT, None, _CLIENT_LOOP, None
+        if client is not None and loop is asyncio.get_running_loop():
+            await client.aclose()
@@ -37,10 +37,9 @@ class TestBashBasic:
 
     @pytest.mark.asyncio
     async def test_stderr_captured(self, bash_tool: BashTool) -> None:
-        """Test that stderr is captured."""
-        result = await bash_tool.execute(command="echo error >&2")
-        assert "error" in result.output
-        assert "[stderr]" in result.output
+        """Test that stderr is captured, interleaved with stdout."""
+        result = await bash_tool.execute(command="echo one; echo error >&2; echo two")
+        assert result.output.splitlines() == ["one", "error", "two"]
 
     @pytest.mark.asyncio
     async def test_working_directory(self, bash_tool: BashTool, temp_dir) -> None:
@@ -52,6 +51,15 @@ class TestBashBasic:
         assert result.success
         assert str(temp_dir) in result.output
 
+    @pytest.mark.asyncio
+    async def test_refresh_cwd(self, bash_tool: BashTool, temp_dir, monkeypatch) -> None:
+        """The default directory follows a chdir once refreshed."""
+        monkeypatch.chdir(temp_dir)
+        bash_tool.refresh_cwd()
+
+        result = await bash_tool.execute(command="pwd")
+        assert result.output.strip() == str(temp_dir.resolve())
+
     @pytest.mark.asyncio
     async def test_timeout(self) -> None:
         """Test command timeout."""
@@ -60,6 +68,24 @@ class TestBashBasic:
         assert not result.success
         assert "timed out" in (result.error or "").lower()
 
+    @pytest.mark.asyncio
+    async def test_timeout_kills_children(self, temp_dir) -> None:
+        """A timeout takes down processes the command started, too."""
+        tool = BashTool(timeout=1)
+        pid_file = temp_dir / "child.pid"
+
+        result = await tool.execute(command=f"sleep 30 & echo $! > {pid_file}; wait")
+        assert "timed out" in (result.error or "").lower()
+
+        child_pid = int(pid_file.read_text())
+        await asyncio.sleep(0.1)
+        try:
+            # Killed but possibly not yet reaped by init: a zombie counts as dead
+            state = open(f"/proc/{child_pid}/stat").read().rsplit(")", 1)[1].split()[0]
+        except FileNotFoundError:
+            state = "gone"
+        assert state in ("Z", "gone")
+
 
 class TestBashBackground:
     """Tests for background process functionality - CRITICAL."""
@@ -209,6 +235,16 @@ class TestBashEnvironment:
         
         del os.environ["LIZCODE_TEST_VAR"]
 
+    @pytest.mark.asyncio
+    async def test_term_dumb_in_foreground(self, bash_tool: BashTool) -> None:
+        """Test that captured commands see TERM=dumb without touching os.environ."""
+        term = os.environ.get("TERM")
+
+        result = await bash_tool.execute(command="echo TERM=$TERM")
+
+        assert result.output.strip() == "TERM=dumb"
+        assert os.environ.get("TERM") == term
+
     @pytest.mark.asyncio
     async def test_display_available(self, bash_tool: BashTool) -> None:
         """Test that DISPLAY is available for GUI apps."""
@@ -230,3 +266,20 @@ class TestBashOutputTruncation:
         assert result.success
         assert len(result.output) <= 200  # Some buffer for truncation message
         assert "truncated" in result.output.lower()
+
+    @pytest.mark.asyncio
+    async def test_large_output_reports_total(self) -> None:
+        """Output past the cap is dropped but still counted."""
+        tool = BashTool(max_output=100)
+        result = await tool.execute(command="head -c 1000000 /dev/zero | tr '\\0' a")
+        assert result.success
+        assert result.output.startswith("a" * 100 + "\n")
+        assert "(truncated, 1000000 chars total)" in result.output
+
+    @pytest.mark.asyncio
+    async def test_truncation_counts_characters(self) -> None:
+        """Multi-byte output is kept and counted in characters, not bytes."""
+        tool = BashTool(max_output=100)
+        result = await tool.execute(command="python3 -c \"print('é' * 1000, end='')\"")
+        assert result.output.startswith("é" * 100 + "\n")
+        assert "(truncated, 1000 chars total)" in result.output
@@ -0,0 +1,251 @@
+"""Tests for the browser tool."""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+import sys
+
+import pytest
+
+from lizcode.tools import browser
+from lizcode.tools.browser import MAX_HTML_SIZE, BrowserTool, _prune_html
+
+
+class TestPruneHtml:
+    """Tests for trimming HTML before it reaches the model."""
+
+    def test_drops_noise(self) -> None:
+        """Scripts, styles and comments go; markup and text stay."""
+        html = (
+            "<html>\n  <head><STYLE type='text/css'>p { color: red }</STYLE></head>\n"
+            "  <body><!-- nav -->\n<p id='x'>Hello\n\n   world</p>"
+            "<script src='a.js'></script><script>var s = '<p>';</script></body>\n</html>"
+        )
+
+        assert _prune_html(html) == (
+            "<html> <head></head> <body> <p id='x'>Hello world</p></body> </html>"
+        )
+
+    def test_keeps_preformatted_whitespace(self) -> None:
+        """Whitespace inside pre, textarea and code is left alone."""
+        html = (
+            "<div>\n  <PRE class='x'>a\n    b</PRE>\n  <textarea>one\n\ntwo</textarea>"
+            "<p>see  <code>x  =  1</code>  here</p>\n</div>"
+        )
+
+        assert _prune_html(html) == (
+            "<div> <PRE class='x'>a\n    b</PRE> <textarea>one\n\ntwo</textarea>"
+            "<p>see <code>x  =  1</code> here</p> </div>"
+        )
+
+    def test_truncates_after_pruning(self) -> None:
+        """The size cap applies to pruned HTML."""
+        tool = BrowserTool()
+        padding = "<script>" + "x" * MAX_HTML_SIZE + "</script>"
+
+        assert tool._store_html(None, padding + "<p>kept</p>") == "<p>kept</p>"
+
+        html = tool._store_html(None, "<p>" + "y" * MAX_HTML_SIZE + "</p>")
+        assert html.endswith("HTML truncated - showing first 150KB -->")
+
+    @pytest.mark.asyncio
+    async def test_fused_truncation_note_only_when_cut(self) -> None:
+        """A capped in-page serialization that prunes under the limit is read in full instead."""
+        tool = BrowserTool()
+        tool._page = _FakePage()
+
+        html = await tool._fused_html(1, "<script>xx</script><p>start", True)
+        assert html == "<p>page</p>"
+
+        html = await tool._fused_html(1, "<p>" + "y" * MAX_HTML_SIZE, True)
+        assert html.endswith("HTML truncated - showing first 150KB -->")
+
+
+class TestPlaywrightImport:
+    """Tests for the one-shot playwright import."""
+
+    @pytest.mark.asyncio
+    async def test_missing_playwright_cached(self, monkeypatch) -> None:
+        """A failed import is remembered instead of retried."""
+        monkeypatch.setattr(browser, "_playwright_import", None)
+        monkeypatch.setitem(sys.modules, "playwright", None)
+        monkeypatch.setitem(sys.modules, "playwright.async_api", None)
+
+        result = await BrowserTool().execute(action="goto", url="http://example.com")
+        assert "Playwright not installed" in result.error
+
+        assert browser._playwright_import[1] is not None
+        with pytest.raises(RuntimeError, match="Playwright not installed"):
+            browser._load_playwright()
+
+
+class _FakeBrowser:
+    """Stands in for a launched chromium."""
+
+    def __init__(self):
+        self.closed = False
+
+    def is_connected(self):
+        return not self.closed
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakePlaywright:
+    """Stands in for async_playwright() and the started Playwright."""
+
+    def __init__(self):
+        self.chromium = self
+
+    async def start(self):
+        return self
+
+    async def launch(self, headless):
+        return _FakeBrowser()
+
+    async def stop(self):
+        pass
+
+
+class TestSharedBrowser:
+    """Tests for the chromium instance shared by every BrowserTool."""
+
+    @pytest.fixture(autouse=True)
+    def fake_playwright(self, monkeypatch) -> None:
+        monkeypatch.setattr(browser, "_load_playwright", lambda: _FakePlaywright)
+        for attr in ("_playwright", "_browser", "_launch_lock", "_loop"):
+            monkeypatch.setattr(BrowserTool, attr, None)
+
+    def test_rebuilt_per_event_loop(self) -> None:
+        """Each event loop launches its own browser; shutdown only closes its loop's one."""
+
+        async def launch_twice():
+            return await BrowserTool._shared_browser(), await BrowserTool._shared_browser()
+
+        first, again = asyncio.run(launch_twice())
+        assert first is again
+
+        second = asyncio.run(BrowserTool._shared_browser())
+        assert second is not first
+
+        asyncio.run(BrowserTool.shutdown())
+        assert BrowserTool._browser is None
+        assert not second.closed
+
+    @pytest.mark.asyncio
+    async def test_shutdown_closes_browser(self) -> None:
+        """Shutdown from the owning loop closes chromium."""
+        shared = await BrowserTool._shared_browser()
+
+        await BrowserTool.shutdown()
+        assert shared.closed
+        assert await BrowserTool._shared_browser() is not shared
+
+
+class _FakePage:
+    """Stands in for a Playwright page, recording the calls made on it."""
+
+    url = "https://example.test/"
+
+    def __init__(self, evaluate_result=None):
+        self.evaluate_result = evaluate_result
+        self.calls = []
+
+    async def evaluate(self, script, arg=None):
+        self.calls.append(("evaluate", arg))
+        if script == "window.__lizcodeDomVersion ?? null":
+            return None
+        return self.evaluate_result
+
+    async def click(self, selector):
+        self.calls.append(("click", selector))
+
+    async def fill(self, selector, text):
+        self.calls.append(("fill", selector, text))
+
+    async def wait_for_load_state(self, state):
+        pass
+
+    async def content(self):
+        return "<p>page</p>"
+
+
+def _run_js(function_source: str, args: list, querySelector: str, setup: str = "") -> str:
+    """Call one of the fused scripts under node with a stubbed document."""
+    import json
+    import subprocess
+
+    script = (
+        f"globalThis.document = {{querySelector: {querySelector}}};\n"
+        f"{setup}\n"
+        f"const f = ({function_source});\n"
+        f"console.log(JSON.stringify(f({json.dumps(args)})));"
+    )
+    result = subprocess.run(["node", "-e", script], capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+class TestFusedActions:
+    """Tests for clicks and typing done in one evaluate, with Playwright as fallback."""
+
+    @pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+    def test_playwright_selectors_return_null(self) -> None:
+        """Selectors querySelector rejects (text=, xpath=, >>) make the fused scripts bail out."""
+        throwing = "(sel) => { throw new SyntaxError(`'${sel}' is not a valid selector`); }"
+
+        assert _run_js(browser._FUSED_CLICK_JS, ["text=Login", 100], throwing) == "null"
+        assert _run_js(browser._FUSED_FILL_JS, ["xpath=//input", "x", 100], throwing) == "null"
+        assert _run_js(browser._FUSED_CLICK_JS, ["#missing", 100], "(sel) => null") == "null"
+
+    @pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+    def test_click_only_fused_for_plain_buttons(self) -> None:
+        """el.click() fires no pointer or mouse events, so other elements go to page.click."""
+        setup = """
+        globalThis.window = {};
+        globalThis.getComputedStyle = () => ({visibility: "visible"});
+        Object.assign(document, {
+          doctype: null,
+          documentElement: {outerHTML: "<p>clicked</p>"},
+          elementFromPoint: () => globalThis.el,
+        });
+        globalThis.el = {
+          isConnected: true,
+          getBoundingClientRect: () => ({left: 0, top: 0, width: 10, height: 10}),
+          closest: () => null,
+          contains: (node) => node === globalThis.el,
+          matches: (sel) => globalThis.tag === "BUTTON",
+          click: () => { document.documentElement.outerHTML = "<p>done</p>"; },
+        };
+        """
+
+        assert _run_js(browser._FUSED_CLICK_JS, ["div", 100], "() => el", setup) == "null"
+        button = setup + 'globalThis.tag = "BUTTON";'
+        assert _run_js(browser._FUSED_CLICK_JS, ["button", 100], "() => el", button) == (
+            '[null,"<p>done</p>",false]'
+        )
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_playwright(self) -> None:
+        """When the fused script declines, the action goes through page.click / page.fill."""
+        tool = BrowserTool()
+        tool._page = _FakePage()
+
+        result = await tool.execute(action="click", selector='button:has-text("Save")')
+        assert result.success
+        assert ("click", 'button:has-text("Save")') in tool._page.calls
+
+        result = await tool.execute(action="type", selector="text=Name", text="Liz")
+        assert result.success
+        assert ("fill", "text=Name", "Liz") in tool._page.calls
+
+    @pytest.mark.asyncio
+    async def test_fused_result_used(self) -> None:
+        """A fused click skips page.click and serializes the page it returned."""
+        tool = BrowserTool()
+        tool._page = _FakePage(evaluate_result=[3, "<p>after</p>", False])
+
+        result = await tool.execute(action="click", selector="#toggle")
+        assert result.output.endswith("<p>after</p>")
+        assert [c[0] for c in tool._page.calls] == ["evaluate"]
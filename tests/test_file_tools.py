@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import re
 import pytest
 from pathlib import Path
 
@@ -52,6 +53,50 @@ class TestReadFileTool:
         assert result.success
         assert "Relative content" in result.output
 
+    @pytest.mark.asyncio
+    async def test_read_window(self, tmp_path, monkeypatch) -> None:
+        """Offset and limit select lines the way str.splitlines() splits them."""
+        from lizcode.tools.read_file import ReadFileTool
+
+        monkeypatch.chdir(tmp_path)
+        test_file = tmp_path / "lines.txt"
+        test_file.write_text("one\ntwo\r\nthree\x0cfour\n\nsix")
+
+        tool = ReadFileTool()
+        result = await tool.execute(file_path="lines.txt", offset=2, limit=2)
+        assert result.output == "     3\tthree\n     4\tfour\n\n[Showing lines 3-4 of 6]"
+
+        result = await tool.execute(file_path="lines.txt", offset=10)
+        assert result.output.endswith(" of 6]")
+
+    @pytest.mark.asyncio
+    async def test_read_window_mapped(self, tmp_path, monkeypatch) -> None:
+        """Large files give the same window whether read as bytes or as text."""
+        from lizcode.tools import read_file
+        from lizcode.tools.grep import has_other_breaks
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(read_file, "_COUNT_CHUNK", 7)
+        test_file = tmp_path / "big.txt"
+        lines = b"".join(b"line %d caf\xc3\xa9\r\n" % i for i in range(5000))
+        test_file.write_bytes(lines + b"tail \xff")
+        assert not has_other_breaks(test_file.read_bytes())
+
+        tool = read_file.ReadFileTool()
+        outputs = []
+        for threshold in (0, 1 << 62):
+            monkeypatch.setattr(read_file, "MMAP_THRESHOLD", threshold)
+            outputs.append([
+                (await tool.execute(file_path="big.txt", offset=offset, limit=3)).output
+                for offset in (0, 1234, 4999, 5000, 9000)
+            ])
+
+        assert outputs[0] == outputs[1]
+        assert outputs[0][1].startswith("  1235\tline 1234 café\n")
+        assert outputs[0][2] == (
+            "  5000\tline 4999 café\n  5001\ttail \ufffd\n\n[Showing lines 5000-5001 of 5001]"
+        )
+
 
 class TestWriteFileTool:
     """Tests for write_file tool."""
@@ -144,6 +189,83 @@ class TestEditFileTool:
         
         assert not result.success
 
+    @pytest.mark.asyncio
+    async def test_edit_counts_and_replace_all(self, tmp_path, monkeypatch) -> None:
+        """Non-unique text is refused with its count; replace_all replaces every one."""
+        from lizcode.tools.edit_file import EditFileTool
+
+        monkeypatch.chdir(tmp_path)
+        test_file = tmp_path / "run.sh"
+        test_file.write_text("x = 1\nx = 1\nx = 1\n")
+        test_file.chmod(0o755)
+
+        tool = EditFileTool()
+        result = await tool.execute(file_path=str(test_file), old_string="x = 1", new_string="y")
+        assert not result.success
+        assert "Found 3 occurrences" in result.error
+
+        result = await tool.execute(
+            file_path=str(test_file), old_string="x = 1", new_string="y", replace_all=True
+        )
+        assert result.success
+        assert "3 replacements" in result.output
+        assert test_file.read_text() == "y\ny\ny\n"
+        assert test_file.stat().st_mode & 0o777 == 0o755
+        assert [p.name for p in tmp_path.iterdir()] == ["run.sh"]
+
+    @pytest.mark.asyncio
+    async def test_edit_empty_old_string(self, tmp_path, monkeypatch) -> None:
+        """An empty old_string fills an empty file and is ambiguous anywhere else."""
+        from lizcode.tools.edit_file import EditFileTool
+
+        monkeypatch.chdir(tmp_path)
+        test_file = tmp_path / "empty.py"
+        test_file.write_text("")
+
+        tool = EditFileTool()
+        result = await tool.execute(file_path=str(test_file), old_string="", new_string="x = 1\n")
+        assert result.success
+        assert "1 replacement" in result.output
+        assert test_file.read_text() == "x = 1\n"
+
+        result = await tool.execute(file_path=str(test_file), old_string="", new_string="y")
+        assert not result.success
+        assert "Found 7 occurrences" in result.error
+        assert test_file.read_text() == "x = 1\n"
+
+    @pytest.mark.asyncio
+    async def test_edit_in_place(self, tmp_path, monkeypatch) -> None:
+        """Same-length edits to large files patch the file where it is."""
+        from lizcode.tools import edit_file
+        from lizcode.tools.edit_file import EditFileTool
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(edit_file, "IN_PLACE_THRESHOLD", 0)
+        test_file = tmp_path / "big.py"
+        test_file.write_text("café = 1\nold_name = 2\nx = old_name\n")
+        inode = test_file.stat().st_ino
+
+        tool = EditFileTool()
+        result = await tool.execute(
+            file_path=str(test_file), old_string="old_name", new_string="new_name"
+        )
+        assert not result.success
+        assert "Found 2 occurrences" in result.error
+
+        result = await tool.execute(
+            file_path=str(test_file), old_string="x = old", new_string="y = new"
+        )
+        assert result.success
+        assert test_file.read_text() == "café = 1\nold_name = 2\ny = new_name\n"
+        assert test_file.stat().st_ino == inode
+
+        # Text mode normalises CRLF, so those files still take the rewrite path
+        crlf_file = tmp_path / "crlf.py"
+        crlf_file.write_bytes(b"a = 1\r\nb = 2\r\n")
+        result = await tool.execute(file_path=str(crlf_file), old_string="b", new_string="c")
+        assert result.success
+        assert crlf_file.read_bytes() == b"a = 1\nc = 2\n"
+
 
 class TestGlobTool:
     """Tests for glob tool."""
@@ -188,6 +310,41 @@ class TestGlobTool:
         assert "top.py" in result.output
         assert "nested.py" in result.output
 
+    @pytest.mark.asyncio
+    async def test_glob_max_results(self, tmp_path, monkeypatch) -> None:
+        """Should stop at max_results and say more matches exist."""
+        from lizcode.tools.glob import GlobTool
+
+        monkeypatch.chdir(tmp_path)
+        for i in range(5):
+            (tmp_path / f"f{i}.py").write_text("")
+
+        result = await GlobTool(max_results=3).execute(pattern="*.py")
+        lines = result.output.split("\n\n")[0].splitlines()
+        assert len(lines) == 3
+        assert lines == sorted(lines)
+        assert "more exist" in result.output
+
+        result = await GlobTool(max_results=5).execute(pattern="*.py")
+        assert "more exist" not in result.output
+
+    def test_iter_glob_files_matches_path_glob(self, tmp_path) -> None:
+        """The scandir walker yields the same files, in order, as Path.glob."""
+        from lizcode.tools.glob import iter_glob_files
+
+        for rel in ("a.py", "a/b.py", "a/c/d.py", "a-b/e.py", ".hidden/f.py", "g.txt"):
+            path = tmp_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x")
+        (tmp_path / "link").symlink_to(tmp_path / "a")
+
+        patterns = ("*", "**/*", "**/*.py", "a/**/*.py", "*/b.py", "link/*.py", "**/c/*", "*/.")
+        # A trailing separator matches directories only
+        patterns += ("*/", "a/", "a.py/", "**/*.py/")
+        for pattern in patterns:
+            expected = [str(p) for p in tmp_path.glob(pattern) if p.is_file()]
+            assert [e.path for e in iter_glob_files(tmp_path, pattern)] == expected
+
 
 class TestGrepTool:
     """Tests for grep tool."""
@@ -223,6 +380,119 @@ class TestGrepTool:
         assert result.success
         assert "foo123" in result.output or "bar456" in result.output
 
+    @pytest.mark.asyncio
+    async def test_grep_large_file(self, tmp_path, monkeypatch) -> None:
+        """Large files should report the same lines and context as small ones."""
+        from lizcode.tools.grep import MMAP_THRESHOLD, GrepTool
+
+        monkeypatch.chdir(tmp_path)
+        filler = "x = 1  # café\r\n" * (MMAP_THRESHOLD // 10)
+        (tmp_path / "big.py").write_text(filler + "def target():\r\n    pass\r\n", newline="")
+
+        tool = GrepTool()
+        result = await tool.execute(pattern=r"def \w+", context=1)
+
+        line = MMAP_THRESHOLD // 10 + 1
+        assert f"> {line}: def target():\n" in result.output
+        assert f"  {line - 1}: x = 1  # café\n" in result.output
+        assert f"  {line + 1}:     pass" in result.output
+
+        result = await tool.execute(pattern="targ[e]t", context=0)
+        assert result.output.startswith(f"--- {tmp_path / 'big.py'} ---\n> {line}: def target():\n")
+
+    @pytest.mark.asyncio
+    async def test_grep_literal_prefilter(self, tmp_path, monkeypatch) -> None:
+        """Skipping files without the pattern's literal must not lose matches."""
+        from lizcode.tools.grep import MMAP_THRESHOLD, GrepTool
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "small.txt").write_text("the \u212aiT is here\nno match\n")
+        (tmp_path / "big.txt").write_text("-" * MMAP_THRESHOLD + "\nthe \u212aiT is here\n")
+        (tmp_path / "other.txt").write_text("nothing to see\n")
+
+        tool = GrepTool()
+        result = await tool.execute(pattern="kit is", case_insensitive=True, context=0)
+
+        assert "small.txt" in result.output
+        assert "big.txt" in result.output
+        assert "other.txt" not in result.output
+        assert "searched 3 files" in result.output
+
+    @pytest.mark.asyncio
+    async def test_grep_plain_text_pattern(self, tmp_path, monkeypatch) -> None:
+        """Plain-text patterns are searched with find() and give the same lines."""
+        from lizcode.tools.grep import MMAP_THRESHOLD, GrepTool, _GrepPattern
+
+        assert _GrepPattern.compile("def main", 0).literal == "def main"
+        assert _GrepPattern.compile(r"a\.b", 0).literal == "a.b"
+        assert _GrepPattern.compile("a.b", 0).literal is None
+        assert _GrepPattern.compile("main", re.IGNORECASE).literal is None
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "small.txt").write_text("x\ndef main():\n")
+        (tmp_path / "big.txt").write_text("-" * MMAP_THRESHOLD + "\ndef main():\n")
+
+        result = await GrepTool().execute(pattern="def main", context=0)
+
+        assert f"--- {tmp_path / 'small.txt'} ---\n>    2: def main():" in result.output
+        assert f"--- {tmp_path / 'big.txt'} ---\n>    2: def main():" in result.output
+
+    @pytest.mark.asyncio
+    async def test_grep_line_edges(self, tmp_path, monkeypatch) -> None:
+        """Anchors, CRLF endings and form feeds should behave as per-line matching."""
+        from lizcode.tools.grep import GrepTool
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "crlf.txt").write_bytes(b"one foo\r\ntwo foo bar\r\n")
+        (tmp_path / "ff.txt").write_bytes(b"alpha\x0cbeta\nfoo\n")
+
+        tool = GrepTool()
+        result = await tool.execute(pattern="foo$", context=0)
+
+        assert ">    1: one foo" in result.output
+        assert "two foo bar" not in result.output
+        assert ">    3: foo" in result.output
+
+    @pytest.mark.asyncio
+    async def test_grep_skips_binary(self, tmp_path, monkeypatch) -> None:
+        """Binary files, by extension or NUL bytes, are not searched."""
+        from lizcode.tools.grep import GrepTool
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "text.txt").write_text("needle\n")
+        (tmp_path / "image.png").write_text("needle\n")
+        (tmp_path / "blob").write_bytes(b"needle\x00\x01\n")
+        (tmp_path / "big.dat2").write_bytes(b"\x00" + b"needle\n" * 20000)
+
+        tool = GrepTool()
+        result = await tool.execute(pattern="needle")
+
+        assert "text.txt" in result.output
+        assert "image.png" not in result.output
+        assert "blob" not in result.output
+        assert "big.dat2" not in result.output
+        assert "searched 1 files" in result.output
+
+    @pytest.mark.asyncio
+    async def test_grep_result_order_and_limit(self, tmp_path, monkeypatch) -> None:
+        """Concurrent scanning keeps glob order and stops at max_results."""
+        from lizcode.tools.grep import GrepTool
+
+        monkeypatch.chdir(tmp_path)
+        for i in range(40):
+            (tmp_path / f"f{i:02}.txt").write_text("needle\n" if i % 2 else "hay\n")
+
+        tool = GrepTool()
+        result = await tool.execute(pattern="needle", file_pattern="*.txt")
+        expected = [p.name for p in tmp_path.glob("*.txt") if "needle" in p.read_text()]
+        headers = [line for line in result.output.splitlines() if line.startswith("--- ")]
+        assert headers == [f"--- {tmp_path / name} ---" for name in expected]
+        assert "searched 40 files" in result.output
+
+        limited = await GrepTool(max_results=3).execute(pattern="needle", file_pattern="*.txt")
+        assert limited.output.count("--- ") == 3
+        assert "[Results limited to 3 files]" in limited.output
+
 
 class TestListFilesTool:
     """Tests for list_files tool."""
@@ -260,3 +530,95 @@ class TestListFilesTool:
         
         assert result.success
         assert "cwd_file.txt" in result.output
+
+    @pytest.mark.asyncio
+    async def test_list_recursive_skips_ignored_dirs(self, tmp_path, monkeypatch) -> None:
+        """Recursive listings show ignored directories without expanding them."""
+        from lizcode.tools.list_files import ListFilesTool
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "main.py").write_text("")
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "index.js").write_text("")
+
+        result = await ListFilesTool().execute(recursive=True)
+
+        assert "src/main.py" in result.output
+        assert "node_modules/" in result.output
+        assert "index.js" not in result.output
+
+
+    @pytest.mark.asyncio
+    async def test_list_network_fs_parallel_stats(self, tmp_path, monkeypatch) -> None:
+        """Batched concurrent stats give the same listing as serial ones."""
+        from lizcode.tools import list_files
+        from lizcode.tools.list_files import ListFilesTool
+
+        for i in range(150):
+            (tmp_path / f"d{i % 3}").mkdir(exist_ok=True)
+            (tmp_path / f"d{i % 3}" / f"f{i:03}.txt").write_text("x" * i)
+
+        serial = await ListFilesTool(max_entries=100).execute(str(tmp_path), recursive=True)
+        monkeypatch.setattr(list_files, "_on_network_fs", lambda path: True)
+        parallel = await ListFilesTool(max_entries=100).execute(str(tmp_path), recursive=True)
+
+        assert parallel.output == serial.output
+        assert len(parallel.output.split("\n\n")[0].splitlines()) == 100
+
+    def test_format_size(self) -> None:
+        """Sizes switch units at each power of 1024."""
+        from lizcode.tools.list_files import ListFilesTool
+
+        assert ListFilesTool._format_size(1023) == "1023B"
+        assert ListFilesTool._format_size(1536) == "1.5KB"
+        assert ListFilesTool._format_size(5 * 1024**2) == "5.0MB"
+        assert ListFilesTool._format_size(1024**3) == "1.0GB"
+        assert ListFilesTool._format_size(3 * 1024**4) == "3.0TB"
+
+
+class TestIgnoreRules:
+    """Tests for ignored directories and .gitignore handling in walks."""
+
+    def _tree(self, root) -> None:
+        for rel in (
+            "src/app.py", "node_modules/lib/mod.py", "build/gen.py", "debug.log", "src/out.log"
+        ):
+            path = root / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("needle\n")
+
+    @pytest.mark.asyncio
+    async def test_default_ignores(self, tmp_path, monkeypatch) -> None:
+        """Wildcard walks skip default-ignored directories unless named."""
+        from lizcode.tools.glob import GlobTool
+        from lizcode.tools.grep import GrepTool
+
+        monkeypatch.chdir(tmp_path)
+        self._tree(tmp_path)
+
+        result = await GlobTool().execute(pattern="**/*.py")
+        assert "app.py" in result.output
+        assert "mod.py" not in result.output
+        assert "gen.py" not in result.output
+
+        result = await GlobTool().execute(pattern="node_modules/**/*.py")
+        assert "mod.py" in result.output
+
+        result = await GrepTool().execute(pattern="needle")
+        assert "app.py" in result.output
+        assert "mod.py" not in result.output
+
+    @pytest.mark.asyncio
+    async def test_gitignore(self, tmp_path, monkeypatch) -> None:
+        """Paths matched by the base .gitignore are skipped."""
+        pytest.importorskip("pathspec")
+        from lizcode.tools.glob import GlobTool
+
+        monkeypatch.chdir(tmp_path)
+        self._tree(tmp_path)
+        (tmp_path / ".gitignore").write_text("*.log\n")
+
+        result = await GlobTool().execute(pattern="**/*")
+        assert "app.py" in result.output
+        assert ".log" not in result.output
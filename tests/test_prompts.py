@@ -275,6 +275,30 @@ class TestTodoWriteModeValidation:
         result = await tool.execute(action="complete", task_id=task_id)
         assert result.success, f"complete should work in Act mode: {result.error}"
 
+    @pytest.mark.asyncio
+    async def test_todo_write_errors(self) -> None:
+        """Missing arguments, unknown tasks and unknown actions fail cleanly."""
+        from lizcode.core.tasks import TaskList
+        from lizcode.tools.todo_write import TodoWriteTool
+
+        assert (await TodoWriteTool().execute(action="list")).error == "Task list not initialized"
+
+        task_list = TaskList()
+        task = task_list.add_task("Test", "Testing")
+        tool = TodoWriteTool(task_list)
+        tool.set_mode(Mode.ACT)
+
+        result = await tool.execute(action="remove")
+        assert result.error == "No task_id provided for 'remove' action"
+        result = await tool.execute(action="complete", task_id="missing")
+        assert result.error == "Task not found: missing"
+        result = await tool.execute(action="archive")
+        assert result.error.startswith("Unknown action: archive")
+
+        result = await tool.execute(action="remove", task_id=task.id)
+        assert result.output == f"[{task.id}] [-] Test"
+        assert task_list.tasks == []
+
 
 class TestNotebookModeValidation:
     """Test that notebook_edit validates actions based on mode."""
@@ -0,0 +1,60 @@
+"""Tests for session storage."""
+
+from __future__ import annotations
+
+import json
+
+from lizcode.core.session import SessionManager
+
+
+class TestSessionMetadata:
+    """Tests for session.json persistence."""
+
+    def test_save_metadata_skips_unchanged(self, tmp_path) -> None:
+        """Saving an unchanged session should not rewrite session.json."""
+        mgr = SessionManager(lizcode_dir=tmp_path)
+        session = mgr.create_session(tmp_path / "project", "Test")
+        metadata_file = session.session_dir / "session.json"
+        before = metadata_file.read_text()
+        updated_at = session.updated_at
+
+        metadata_file.write_text(before + "\n")
+        session.save_metadata()
+
+        assert metadata_file.read_text() == before + "\n"
+        assert session.updated_at == updated_at
+
+    def test_save_metadata_writes_changes(self, tmp_path) -> None:
+        """Real changes should still be persisted."""
+        mgr = SessionManager(lizcode_dir=tmp_path)
+        session = mgr.create_session(tmp_path / "project", "Test")
+
+        session.create_checkpoint("first")
+
+        reloaded = mgr.load_session(session.id)
+        assert [cp.message for cp in reloaded.checkpoints] == ["first"]
+
+
+class TestSessionListing:
+    """Tests for listing and selecting sessions."""
+
+    def test_most_recent_session(self, tmp_path) -> None:
+        """get_most_recent_session should agree with list_sessions ordering."""
+        mgr = SessionManager(lizcode_dir=tmp_path)
+        project = tmp_path / "project"
+        first = mgr.create_session(project, "First")
+        second = mgr.create_session(project, "Second")
+        mgr.create_session(tmp_path / "other", "Other")
+
+        first.updated_at = "2000-01-01T00:00:00"
+        second.updated_at = "2001-01-01T00:00:00"
+        for session in (first, second):
+            (session.session_dir / "session.json").write_text(json.dumps(session.to_dict()))
+
+        assert [s.name for s in mgr.list_sessions(project)] == ["Second", "First"]
+        assert mgr.get_most_recent_session(project).id == second.id
+
+    def test_most_recent_session_none(self, tmp_path) -> None:
+        """Projects without sessions should return None."""
+        mgr = SessionManager(lizcode_dir=tmp_path)
+        assert mgr.get_most_recent_session(tmp_path / "project") is None
@@ -0,0 +1,50 @@
+"""Tests for conversation state serialization."""
+
+from __future__ import annotations
+
+from lizcode.core.state import ConversationState, Mode, Role, ToolCall, ToolResult
+
+
+def _populated_state() -> ConversationState:
+    state = ConversationState(mode=Mode.PLAN, model="m", provider="p")
+    state.add_user_message("hello")
+    state.add_assistant_message(
+        "reading", tool_calls=[ToolCall(id="c1", name="read_file", arguments={"file_path": "a.py"})]
+    )
+    state.add_tool_result(ToolResult(tool_call_id="c1", name="read_file", result="contents"))
+    return state
+
+
+class TestConversationStateSerialization:
+    """Tests for to_dict/from_dict round trips."""
+
+    def test_round_trip(self) -> None:
+        """from_dict should restore what to_dict produced."""
+        original = _populated_state()
+
+        restored = ConversationState()
+        restored.from_dict(original.to_dict())
+
+        assert restored.mode == Mode.PLAN
+        assert [m.role for m in restored.messages] == [Role.USER, Role.ASSISTANT, Role.TOOL]
+        assert restored.messages[1].tool_calls[0].arguments == {"file_path": "a.py"}
+        assert restored.messages[2].tool_result.result == "contents"
+
+
+class TestApiFormat:
+    """Tests for Message.to_api_format."""
+
+    def test_plain_message(self) -> None:
+        """Plain messages should only carry role and content."""
+        state = ConversationState()
+        msg = state.add_user_message("hi")
+        assert msg.to_api_format() == {"role": "user", "content": "hi"}
+
+    def test_tool_messages(self) -> None:
+        """Tool calls and results should keep their API fields."""
+        state = _populated_state()
+        call_msg, result_msg = state.messages[1].to_api_format(), state.messages[2].to_api_format()
+
+        assert call_msg["tool_calls"][0]["function"]["arguments"] == '{"file_path": "a.py"}'
+        assert result_msg["role"] == "tool"
+        assert result_msg["tool_call_id"] == "c1"
@@ -0,0 +1,267 @@
+"""Tests for the subagent manager."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Future
+from pathlib import Path
+
+import pytest
+
+from lizcode.core.subagent import SubagentManager, SubagentType
+from tests.mock_provider import MockProvider
+
+
+def _manager(temp_dir: Path, responses: list[dict] | None = None) -> SubagentManager:
+    """Create a manager whose (shared) provider replays the given responses."""
+
+    def provider_factory() -> MockProvider:
+        return MockProvider([dict(r) for r in (responses or [])])
+
+    return SubagentManager(
+        provider_factory=provider_factory,
+        working_directory=temp_dir,
+        output_dir=temp_dir / "subagents",
+    )
+
+
+async def _record_close(closed: list, provider: MockProvider) -> None:
+    """Stand-in for provider.close that records which provider was closed."""
+    closed.append(provider)
+
+
+class TestSpawnParallel:
+    """Tests for parallel async subagents."""
+
+    @pytest.mark.asyncio
+    async def test_results_in_input_order(self, temp_dir: Path) -> None:
+        """Results should line up with the input tasks."""
+        manager = _manager(temp_dir, [{"content": "done"}] * 3)
+
+        results = await manager.spawn_parallel([
+            (SubagentType.EXPLORE, "first"),
+            (SubagentType.PLAN, "second"),
+            (SubagentType.CODE_REVIEWER, "third"),
+        ])
+
+        assert [r.prompt for r in results] == ["first", "second", "third"]
+        assert [r.agent_type for r in results] == [
+            SubagentType.EXPLORE,
+            SubagentType.PLAN,
+            SubagentType.CODE_REVIEWER,
+        ]
+        assert all(r.success and r.result == "done" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_failure_is_isolated(self, temp_dir: Path) -> None:
+        """One failing subagent should not cancel the others."""
+        calls = []
+
+        def provider_factory() -> MockProvider:
+            calls.append(None)
+            if len(calls) == 2:
+                raise RuntimeError("boom")
+            return MockProvider([{"content": "ok"}])
+
+        manager = SubagentManager(
+            provider_factory=provider_factory,
+            working_directory=temp_dir,
+            output_dir=temp_dir / "subagents",
+        )
+
+        results = await manager.spawn_parallel([
+            (SubagentType.EXPLORE, "a"),
+            (SubagentType.EXPLORE, "b"),
+            (SubagentType.EXPLORE, "c"),
+        ])
+
+        assert [r.success for r in results] == [True, False, True]
+        assert results[1].error == "boom"
+
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, temp_dir: Path) -> None:
+        """No more than max_parallel subagents should run at once."""
+        running = 0
+        peak = 0
+
+        class SlowProvider(MockProvider):
+            async def chat(self, messages, tools=None):
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+                return {"content": messages[-1]["content"]}
+
+        manager = SubagentManager(
+            provider_factory=SlowProvider,
+            working_directory=temp_dir,
+            output_dir=temp_dir / "subagents",
+            max_parallel=2,
+        )
+
+        results = await manager.spawn_parallel(
+            [(SubagentType.EXPLORE, str(i)) for i in range(5)]
+        )
+
+        assert peak == 2
+        assert [r.result for r in results] == ["0", "1", "2", "3", "4"]
+
+
+class TestSharedProvider:
+    """Tests for provider reuse across async subagents."""
+
+    @pytest.mark.asyncio
+    async def test_provider_shared_per_model(self, temp_dir: Path) -> None:
+        """Subagents on the same model share a provider until aclose."""
+        created = []
+        closed = []
+
+        def provider_factory() -> MockProvider:
+            provider = MockProvider([{"content": "ok"}] * 2)
+            provider.model = "other-model" if len(created) == 2 else "mock-model"
+            provider.close = lambda p=provider: _record_close(closed, p)
+            created.append(provider)
+            return provider
+
+        manager = SubagentManager(
+            provider_factory=provider_factory,
+            working_directory=temp_dir,
+            output_dir=temp_dir / "subagents",
+        )
+
+        await manager.spawn(SubagentType.EXPLORE, "a")
+        await manager.spawn(SubagentType.EXPLORE, "b")
+        await manager.spawn(SubagentType.EXPLORE, "c")
+
+        assert len(created[0].call_history) == 2
+        assert created[1].call_history == []
+        assert len(created[2].call_history) == 1
+        assert closed == []
+
+        await manager.aclose()
+        assert closed == [created[0], created[2]]
+
+    @pytest.mark.asyncio
+    async def test_provider_not_shared_across_credentials(self, temp_dir: Path) -> None:
+        """A changed API key or endpoint gets its own provider."""
+        created = []
+
+        def provider_factory() -> MockProvider:
+            provider = MockProvider([{"content": "ok"}] * 3)
+            provider.api_key = "new-key" if len(created) == 1 else "old-key"
+            provider.host = "http://remote:11434" if len(created) == 2 else "http://localhost:11434"
+            created.append(provider)
+            return provider
+
+        manager = SubagentManager(
+            provider_factory=provider_factory,
+            working_directory=temp_dir,
+            output_dir=temp_dir / "subagents",
+        )
+
+        for prompt in ("a", "b", "c"):
+            await manager.spawn(SubagentType.EXPLORE, prompt)
+
+        assert [len(p.call_history) for p in created] == [1, 1, 1]
+        assert len(manager._providers) == 3
+
+
+class TestSpawnAsync:
+    """Tests for the async subagent conversation loop."""
+
+    @pytest.mark.asyncio
+    async def test_runs_allowed_tools(self, temp_dir: Path) -> None:
+        """Allowed tools run; disallowed ones are reported back to the model."""
+        (temp_dir / "notes.txt").write_text("hello from notes")
+        provider = MockProvider()
+        provider.add_response(
+            content="Looking.",
+            tool_calls=[
+                {"name": "read_file", "arguments": {"file_path": str(temp_dir / "notes.txt")}},
+                {"name": "write_file", "arguments": {"file_path": "x", "content": "y"}},
+            ],
+        )
+        provider.add_response(content=" Done.")
+
+        manager = SubagentManager(
+            provider_factory=lambda: provider,
+            working_directory=temp_dir,
+            output_dir=temp_dir / "subagents",
+        )
+        result = await manager.spawn(SubagentType.EXPLORE, "read the notes")
+
+        assert result.success
+        assert result.result == "Looking. Done."
+        tool_messages = [
+            m for m in provider.call_history[1]["messages"] if m["role"] == "tool"
+        ]
+        assert "hello from notes" in tool_messages[0]["content"]
+        assert tool_messages[1]["content"] == "Tool not allowed: write_file"
+
+
+class TestToolCallConcurrency:
+    """Tests for running one turn's tool calls together."""
+
+    @pytest.mark.asyncio
+    async def test_tool_calls_run_concurrently(self, temp_dir: Path) -> None:
+        """Independent tool calls overlap but results keep call order."""
+        provider = MockProvider()
+        provider.add_response(
+            tool_calls=[
+                {"name": "bash", "arguments": {"command": "sleep 0.3; echo one"}},
+                {"name": "glob", "arguments": {"pattern": "*.nothing", "directory": str(temp_dir)}},
+                {"name": "bash", "arguments": {"command": "echo two"}},
+            ],
+        )
+
+        manager = SubagentManager(
+            provider_factory=lambda: provider,
+            working_directory=temp_dir,
+            output_dir=temp_dir / "subagents",
+        )
+        result = await manager.spawn(SubagentType.TEST_RUNNER, "run")
+
+        assert result.success
+        tool_messages = [
+            m for m in provider.call_history[1]["messages"] if m["role"] == "tool"
+        ]
+        assert [m["tool_call_id"] for m in tool_messages] == ["call_0_0", "call_0_1", "call_0_2"]
+        assert tool_messages[0]["content"].strip() == "one"
+        assert "No files found" in tool_messages[1]["content"]
+        assert tool_messages[2]["content"].strip() == "two"
+
+
+class TestBackgroundStatus:
+    """Tests for polling background agents."""
+
+    @pytest.mark.asyncio
+    async def test_check_background_agent(self, temp_dir: Path) -> None:
+        """Status reflects the future; output comes from the agent's file."""
+        manager = _manager(temp_dir)
+        future: Future = Future()
+        manager._background_processes["abc"] = future
+        (manager.output_dir / "abc.txt").write_text("working\n")
+
+        assert (await manager.check_background_agent("abc"))["status"] == "queued"
+
+        future.set_running_or_notify_cancel()
+        status = await manager.check_background_agent("abc")
+        assert status == {"status": "running", "agent_id": "abc", "output": "working\n"}
+
+        future.set_result(None)
+        assert (await manager.check_background_agent("abc"))["status"] == "completed"
+        assert (await manager.check_background_agent("nope"))["status"] == "not_found"
+
+    @pytest.mark.asyncio
+    async def test_resume_agent(self, temp_dir: Path) -> None:
+        """Resuming folds the previous output into the new prompt."""
+        manager = _manager(temp_dir)
+        (manager.output_dir / "abc.txt").write_text("found the bug")
+
+        prompt = await manager.resume_agent("abc", "now fix it")
+        assert "found the bug" in prompt and "now fix it" in prompt
+
+        with pytest.raises(ValueError, match="No output found"):
+            await manager.resume_agent("missing", "anything")
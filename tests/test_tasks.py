@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+
 import pytest
 
 from lizcode.core.tasks import Task, TaskList, TaskState
@@ -59,6 +61,18 @@ class TestTask:
         assert restored.state == TaskState.IN_PROGRESS
         assert restored.metadata == {"key": "value"}
 
+    def test_serialized_timestamps(self) -> None:
+        """to_dict timestamps should match isoformat, including after a reload."""
+        task = Task(id="abc", content="Test", active_form="Testing")
+        task.start()
+        task.complete()
+
+        data = task.to_dict()
+        assert data["created_at"] == task.created_at.isoformat()
+        assert data["started_at"] == task.started_at.isoformat()
+        assert data["completed_at"] == task.completed_at.isoformat()
+        assert Task.from_dict(data).to_dict() == data
+
 
 class TestTaskList:
     """Tests for TaskList management."""
@@ -136,6 +150,16 @@ class TestTaskList:
         
         assert removed is True
         assert len(task_list.tasks) == 0
+        assert task_list.get_task(task.id) is None
+        assert task_list.remove_task(task.id) is False
+
+    def test_get_task_after_load(self, task_list: TaskList, temp_dir) -> None:
+        """Loaded task lists should look tasks up by ID."""
+        task = task_list.add_task("Test", "Testing")
+
+        loaded = TaskList.load(temp_dir / "tasks.json")
+
+        assert loaded.get_task(task.id).content == "Test"
 
     def test_get_pending(self, task_list: TaskList) -> None:
         """Test getting pending tasks."""
@@ -158,6 +182,21 @@ class TestTaskList:
         
         assert task_list.get_in_progress() is task
 
+    def test_in_progress_released(self, task_list: TaskList, temp_dir) -> None:
+        """Completing or removing the in-progress task frees the slot."""
+        task1 = task_list.add_task("Task 1", "Doing 1")
+        task2 = task_list.add_task("Task 2", "Doing 2")
+
+        task_list.start_task(task1.id)
+        assert TaskList.load(temp_dir / "tasks.json").get_in_progress().id == task1.id
+
+        task_list.complete_task(task1.id)
+        task_list.start_task(task2.id)
+        task_list.remove_task(task2.id)
+
+        assert task_list.get_in_progress() is None
+        assert TaskList.load(temp_dir / "tasks.json").get_in_progress() is None
+
     def test_clear_completed(self, task_list: TaskList) -> None:
         """Test clearing completed tasks."""
         task1 = task_list.add_task("Task 1", "Doing 1")
@@ -207,6 +246,26 @@ class TestTaskList:
         
         assert "1/2" in task_list.get_progress_display()
 
+    def test_counts_track_mutations(self, task_list: TaskList, temp_dir) -> None:
+        """Progress counts should follow adds, transitions, removals and reloads."""
+        task1 = task_list.add_task("Task 1", "Doing 1")
+        task2 = task_list.add_task("Task 2", "Doing 2")
+        task3 = task_list.add_task("Task 3", "Doing 3")
+        task_list.start_task(task1.id)
+        task_list.complete_task(task1.id)
+        task_list.complete_task(task2.id)
+        task_list.remove_task(task3.id)
+
+        assert task_list.get_progress() == (2, 2)
+        assert task_list.get_pending_count() == 0
+        assert task_list.get_next_pending() is None
+
+        loaded = TaskList.load(temp_dir / "tasks.json")
+        assert loaded.get_progress() == (2, 2)
+
+        assert task_list.clear_completed() == 2
+        assert task_list.get_progress() == (0, 0)
+
     def test_persistence(self, task_list: TaskList, temp_dir) -> None:
         """Test that tasks are persisted to disk."""
         task = task_list.add_task("Test", "Testing")
@@ -217,6 +276,55 @@ class TestTaskList:
         assert len(loaded.tasks) == 1
         assert loaded.tasks[0].content == "Test"
 
+    def test_journal_replay(self, task_list: TaskList, temp_dir) -> None:
+        """Mutations after the first snapshot go to the journal and are replayed on load."""
+        first = task_list.add_task("First", "Doing first")
+        second = task_list.add_task("Second", "Doing second")
+        third = task_list.add_task("Third", "Doing third")
+        task_list.start_task(first.id)
+        task_list.complete_task(first.id)
+        task_list.remove_task(second.id)
+
+        snapshot = json.loads((temp_dir / "tasks.json").read_text())
+        assert len(snapshot["tasks"]) == 1
+        assert (temp_dir / "tasks.jsonl").read_text().count("\n") == 5
+
+        loaded = TaskList.load(temp_dir / "tasks.json")
+
+        assert [t.id for t in loaded.tasks] == [first.id, third.id]
+        assert loaded.get_task(first.id).state == TaskState.COMPLETED
+        assert loaded.get_task(first.id).completed_at == first.completed_at
+
+    def test_add_tasks_single_journal_write(
+        self, task_list: TaskList, temp_dir, monkeypatch
+    ) -> None:
+        """Bulk-adding tasks should write the journal once."""
+        task_list.add_task("First", "Doing first")
+        writes = []
+        original_write = task_list._journal.write
+        monkeypatch.setattr(
+            task_list._journal, "write", lambda s: writes.append(s) or original_write(s)
+        )
+
+        task_list.add_tasks([
+            {"content": "Task 1", "active_form": "Doing task 1"},
+            {"content": "Task 2", "active_form": "Doing task 2"},
+            {"content": "Task 3", "active_form": "Doing task 3"},
+        ])
+
+        assert len(writes) == 1
+        assert len(TaskList.load(temp_dir / "tasks.json").tasks) == 4
+
+    def test_journal_compaction(self, task_list: TaskList, temp_dir) -> None:
+        """clear_all rewrites the snapshot and empties the journal."""
+        task_list.add_task("First", "Doing first")
+        task_list.add_task("Second", "Doing second")
+
+        task_list.clear_all()
+
+        assert (temp_dir / "tasks.jsonl").read_text() == ""
+        assert TaskList.load(temp_dir / "tasks.json").tasks == []
+
 
 class TestTaskListFromPlan:
     """Test task list integration with plan."""
@@ -0,0 +1,154 @@
+"""Tests for the tool base class and registry."""
+
+from __future__ import annotations
+
+import json
+
+from lizcode.core.state import Mode
+from lizcode.tools import create_tool_registry
+from lizcode.tools.base import ToolResult
+from lizcode.tools.skill import Skill, SkillTool
+
+
+class TestModeFiltering:
+    """Tests for permission-indexed mode filtering."""
+
+    def test_registration_order_kept(self) -> None:
+        """Mode filtering should match a scan of all tools, in order."""
+        registry = create_tool_registry()
+
+        for mode in Mode:
+            expected = [t for t in registry.get_all() if t.is_allowed_in_mode(mode)]
+            assert registry.get_for_mode(mode) == expected
+
+    def test_replacing_tool_keeps_position(self) -> None:
+        """Re-registering a name swaps the tool in place."""
+        registry = create_tool_registry()
+        before = [t.name for t in registry.get_for_mode(Mode.ACT)]
+
+        replacement = SkillTool()
+        registry.register(replacement)
+
+        after = registry.get_for_mode(Mode.ACT)
+        assert [t.name for t in after] == before
+        assert replacement in after
+
+
+class TestSchemaCaching:
+    """Tests for cached tool lists and schemas."""
+
+    def test_schemas_reused_across_calls(self) -> None:
+        """Repeated calls return equal lists built from the same schema objects."""
+        registry = create_tool_registry()
+
+        first = registry.get_schemas_for_context(Mode.ACT)
+        second = registry.get_schemas_for_context(Mode.ACT)
+
+        assert first == second
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+
+    def test_static_schemas_stable(self) -> None:
+        """Static tools hand back one schema object, identical across registries."""
+        registry = create_tool_registry()
+        other = create_tool_registry()
+
+        for name in (
+            "bash", "browser", "attempt_completion", "task", "ask_user", "todo_write", "webfetch"
+        ):
+            tool = registry.get(name)
+            schema = tool.get_schema()
+            assert tool.get_schema() is schema
+            assert schema["function"]["parameters"] is tool.parameters
+            assert other.get(name).get_schema() == schema
+
+    def test_register_invalidates(self) -> None:
+        """Registering a tool shows up in later filter results."""
+        registry = create_tool_registry()
+        registry.get_for_mode(Mode.PLAN)
+        registry.get_schemas(Mode.PLAN)
+
+        class ExtraTool(SkillTool):
+            name = "extra_skill"
+
+        registry.register(ExtraTool())
+
+        assert "extra_skill" in [t.name for t in registry.get_for_mode(Mode.PLAN)]
+        assert "extra_skill" in [s["function"]["name"] for s in registry.get_schemas(Mode.PLAN)]
+
+    def test_schemas_json(self) -> None:
+        """Encoded schemas match the dict form and are re-encoded after changes."""
+        registry = create_tool_registry()
+
+        encoded = registry.get_schemas_json(Mode.ACT)
+        assert json.loads(encoded) == registry.get_schemas(Mode.ACT)
+        assert registry.get_schemas_json(Mode.ACT) is encoded
+        assert json.loads(registry.get_schemas_json(Mode.PLAN, has_plan=True)) == (
+            registry.get_schemas_for_context(Mode.PLAN, has_plan=True)
+        )
+
+        registry.get("skill").register_skill(
+            Skill(name="deploy", description="Deploy", prompt_template="x")
+        )
+        assert b"deploy" in registry.get_schemas_json(Mode.ACT)
+
+    def test_dynamic_schema_invalidated(self) -> None:
+        """Registering a custom skill refreshes the skill tool's schema."""
+        registry = create_tool_registry()
+        registry.get_schemas(Mode.ACT)
+        skill_tool = registry.get("skill")
+
+        skill_tool.register_skill(Skill(name="deploy", description="Deploy", prompt_template="x"))
+
+        schema = next(s for s in registry.get_schemas(Mode.ACT) if s["function"]["name"] == "skill")
+        assert "deploy" in schema["function"]["parameters"]["properties"]["skill"]["description"]
+
+
+class TestSummarySchemas:
+    """Tests for two-phase (summary, then full) tool schemas."""
+
+    def test_summary_schema_is_compact(self) -> None:
+        """Summaries keep the name, first description line and required arguments."""
+        registry = create_tool_registry()
+        tool = registry.get("bash")
+
+        summary = tool.get_summary_schema()["function"]
+
+        assert summary["name"] == "bash"
+        assert "\n" not in summary["description"]
+        assert summary["description"] == tool.description.strip().split("\n")[0]
+        assert summary["parameters"] == {
+            "type": "object",
+            "properties": {"command": {"type": "string"}},
+            "required": ["command"],
+        }
+        todo = registry.get("todo_write").get_summary_schema()["function"]["parameters"]
+        assert todo["properties"]["action"]["enum"] == [
+            "create", "start", "complete", "remove", "list"
+        ]
+
+    def test_promoted_schemas(self) -> None:
+        """Named tools get full schemas; order follows get_for_context."""
+        registry = create_tool_registry()
+
+        schemas = registry.get_promoted_schemas(Mode.ACT, {"read_file"})
+
+        names = [s["function"]["name"] for s in schemas]
+        assert names == [t.name for t in registry.get_for_context(Mode.ACT)]
+        by_name = {s["function"]["name"]: s for s in schemas}
+        assert by_name["read_file"] is registry.get("read_file").get_schema()
+        assert by_name["bash"] is registry.get("bash").get_summary_schema()
+
+
+class TestToolResult:
+    """Tests for ToolResult formatting."""
+
+    def test_str(self) -> None:
+        """Successes show output; failures show the error, falling back to output."""
+        assert str(ToolResult(success=True, output="ok")) == "ok"
+        assert str(ToolResult(success=False, output="out", error="bad")) == "Error: bad"
+
+        failed = ToolResult(success=False, output="out")
+        assert str(failed) == "Error: out"
+        assert str(failed) is str(failed)
+        assert failed == ToolResult(success=False, output="out")
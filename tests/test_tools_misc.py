@@ -72,6 +72,26 @@ class TestSkillTool:
         assert skill1 is not None
         assert skill2 is not None
         assert skill1.name == skill2.name
+        assert tool.get_skill("//commit") is None
+
+    def test_custom_skill_shadows_builtin(self) -> None:
+        """A custom skill replaces the built-in of the same name and refreshes the parameters."""
+        from lizcode.tools.skill import BUILTIN_SKILLS, Skill, SkillTool
+
+        tool = SkillTool()
+        parameters = tool.parameters
+        assert tool.parameters is parameters
+
+        custom = Skill(name="commit", description="Team commit", prompt_template="x")
+        tool.register_skill(custom)
+        tool.register_skill(Skill(name="deploy", description="Deploy", prompt_template="y"))
+        assert "deploy" in tool.parameters["properties"]["skill"]["description"]
+
+        assert tool.get_skill("/commit") is custom
+        assert BUILTIN_SKILLS["commit"] is not custom
+        names = [s.name for s in tool.list_skills()]
+        assert names == [*BUILTIN_SKILLS, "deploy"]
+        assert tool.list_skills()[0] is custom
 
 
 class TestAttemptCompletionTool:
@@ -134,6 +154,27 @@ class TestNotebookEditTool:
         assert "Cell 0 (markdown)" in result.output
         assert "Cell 1 (code)" in result.output
 
+    @pytest.mark.asyncio
+    async def test_read_truncates_long_cells(self, tmp_path) -> None:
+        """Long cells are shown up to PREVIEW_CHARS, string or list sources alike."""
+        from lizcode.tools.notebook import PREVIEW_CHARS, NotebookEditTool
+
+        notebook_path = tmp_path / "long.ipynb"
+        lines = [f"line {i:04}\n" for i in range(1000)]
+        notebook = {
+            "cells": [
+                {"cell_type": "code", "source": lines},
+                {"cell_type": "code", "source": "".join(lines)},
+            ]
+        }
+        notebook_path.write_text(json.dumps(notebook))
+
+        result = await NotebookEditTool().execute(action="read", notebook_path=str(notebook_path))
+
+        preview = "".join(lines)[:PREVIEW_CHARS] + "..."
+        assert result.output.count(preview) == 2
+        assert "line 0999" not in result.output
+
     @pytest.mark.asyncio
     async def test_insert_cell(self, tmp_path) -> None:
         """Should insert new cell."""
@@ -263,6 +304,117 @@ class TestNotebookEditTool:
         assert not result.success
         assert "out of range" in result.error.lower()
 
+    @pytest.mark.asyncio
+    async def test_parsed_notebook_reused(self, tmp_path, monkeypatch) -> None:
+        """Repeated actions reuse the parsed notebook until the file changes."""
+        from lizcode.tools import notebook as notebook_module
+        from lizcode.tools.notebook import NotebookEditTool
+
+        notebook_path = tmp_path / "test.ipynb"
+        notebook_path.write_text(json.dumps({"cells": [{"cell_type": "code", "source": ["a"]}]}))
+        parses = []
+        read_notebook = notebook_module._read_notebook
+        monkeypatch.setattr(
+            notebook_module,
+            "_read_notebook",
+            lambda path: parses.append(path) or read_notebook(path),
+        )
+
+        tool = NotebookEditTool()
+        tool.set_mode(Mode.ACT)
+        path = str(notebook_path)
+        await tool.execute(action="read", notebook_path=path)
+        await tool.execute(action="edit", notebook_path=path, cell_number=0, source="b")
+        await tool.execute(action="insert", notebook_path=path, cell_number=1, source="c")
+        assert len(parses) == 1
+
+        changed = {"cells": [{"cell_type": "code", "source": ["changed"]}]}
+        notebook_path.write_text(json.dumps(changed))
+        result = await tool.execute(action="read", notebook_path=str(notebook_path))
+        assert "changed" in result.output
+        assert len(parses) == 2
+
+    @pytest.mark.asyncio
+    async def test_arguments_checked_before_reading(self, tmp_path, monkeypatch) -> None:
+        """Bad arguments are rejected without parsing the notebook."""
+        from lizcode.tools import notebook as notebook_module
+        from lizcode.tools.notebook import NotebookEditTool
+
+        notebook_path = tmp_path / "test.ipynb"
+        notebook_path.write_text(json.dumps({"cells": [{"cell_type": "code", "source": ["a"]}]}))
+        monkeypatch.setattr(
+            notebook_module, "_read_notebook", lambda path: pytest.fail("notebook was read")
+        )
+
+        tool = NotebookEditTool()
+        tool.set_mode(Mode.ACT)
+        path = str(notebook_path)
+
+        result = await tool.execute(action="edit", notebook_path=path, cell_number=0)
+        assert result.error == "source required for 'edit' action"
+        result = await tool.execute(action="delete", notebook_path=path)
+        assert result.error == "cell_number required for 'delete' action"
+        result = await tool.execute(action="delete", notebook_path=path, cell_number=-1)
+        assert "out of range" in result.error
+        result = await tool.execute(action="rename", notebook_path=path)
+        assert result.error == "Unknown action: rename"
+
+    @pytest.mark.asyncio
+    async def test_atomic_write(self, tmp_path) -> None:
+        """Edits replace the file whole, keeping its mode and leaving no temp files."""
+        import os
+
+        from lizcode.tools.notebook import NotebookEditTool
+
+        notebook_path = tmp_path / "test.ipynb"
+        notebook_path.write_text(json.dumps({"cells": [{"cell_type": "code", "source": ["a"]}]}))
+        os.chmod(notebook_path, 0o640)
+        inode = notebook_path.stat().st_ino
+
+        tool = NotebookEditTool()
+        tool.set_mode(Mode.ACT)
+        result = await tool.execute(
+            action="edit", notebook_path=str(notebook_path), cell_number=0, source="b"
+        )
+
+        assert result.success
+        assert notebook_path.stat().st_ino != inode
+        assert notebook_path.stat().st_mode & 0o777 == 0o640
+        assert os.listdir(tmp_path) == ["test.ipynb"]
+
+    def test_dump_notebook(self) -> None:
+        """Notebooks are written in nbformat's layout, so saved files don't re-indent."""
+        from lizcode.tools.notebook import _dump_notebook
+
+        notebook = {
+            "cells": [{"cell_type": "markdown", "metadata": {}, "source": ["# Café ☕\n", "naïve"]}]
+        }
+        dumped = _dump_notebook(notebook)
+
+        assert dumped == (json.dumps(notebook, indent=1, ensure_ascii=False) + "\n").encode()
+        assert dumped.startswith(b'{\n "cells": [\n  {\n')
+        assert "☕".encode() in dumped
+        assert json.loads(dumped) == notebook
+
+    @pytest.mark.asyncio
+    async def test_malformed_notebook(self, tmp_path) -> None:
+        """Should report JSON errors without touching the file."""
+        from lizcode.tools.notebook import NotebookEditTool
+
+        notebook_path = tmp_path / "broken.ipynb"
+        notebook_path.write_text('{"cells": [')
+
+        tool = NotebookEditTool()
+        tool.set_mode(Mode.ACT)
+
+        for action in ("read", "delete"):
+            result = await tool.execute(
+                action=action, notebook_path=str(notebook_path), cell_number=0
+            )
+            assert not result.success
+            assert "invalid notebook json" in result.error.lower()
+        assert notebook_path.read_text() == '{"cells": ['
+
 
 class TestWebFetchTool:
     """Tests for web fetch tool (mocked HTTP)."""
@@ -302,3 +454,297 @@ class TestWebFetchTool:
         tool = WebFetchTool()
         await tool.close()  # Should not raise
         await tool.close()  # Should be idempotent
+
+    @pytest.mark.asyncio
+    async def test_shared_client(self) -> None:
+        """All tools fetch through one client; only shutdown() closes it."""
+        from lizcode.tools import webfetch
+
+        client = webfetch._get_client()
+        assert webfetch._get_client() is client
+
+        await webfetch.WebFetchTool().close()
+        assert not client.is_closed
+
+        await webfetch.WebFetchTool.shutdown()
+        assert client.is_closed
+        assert not webfetch._get_client().is_closed
+        await webfetch.WebFetchTool.shutdown()
+        await webfetch.WebFetchTool.shutdown()
+
+    def test_client_rebuilt_per_event_loop(self) -> None:
+        """A client opened under one asyncio.run isn't reused under the next."""
+        import asyncio
+
+        from lizcode.tools import webfetch
+
+        async def get_client():
+            return webfetch._get_client()
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+        assert second is not first
+        asyncio.run(webfetch.WebFetchTool.shutdown())
+
+    @pytest.mark.asyncio
+    async def test_response_cache(self, monkeypatch) -> None:
+        """Fresh hits skip the network; stale entries are revalidated and reused on 304."""
+        import asyncio
+
+        import httpx
+
+        from lizcode.tools import webfetch
+        from lizcode.tools.webfetch import WebFetchTool
+
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200, text="hello", headers={"ETag": '"v1"', "Cache-Control": "max-age=60"}
+            )
+
+        tool = WebFetchTool(cache_max=1)
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(webfetch, "_CLIENT", client)
+        monkeypatch.setattr(webfetch, "_CLIENT_LOOP", asyncio.get_running_loop())
+
+        first = await tool.execute(url="https://example.test/docs")
+        second = await tool.execute(url="https://example.test/docs")
+        assert first.success and "hello" in first.output
+        assert second.output == first.output
+        assert len(requests) == 1
+
+        url = "https://example.test/docs"
+        tool._cache[url] = (0.0, *tool._cache[url][1:])
+        third = await tool.execute(url=url)
+        assert third.output == first.output
+        assert requests[-1].headers["if-none-match"] == '"v1"'
+        assert tool._cache[url][0] > 0.0
+
+        await tool.execute(url="https://example.test/other")
+        assert list(tool._cache) == ["https://example.test/other"]
+        await tool.close()
+
+    @pytest.mark.asyncio
+    async def test_large_page_truncated_early(self, monkeypatch) -> None:
+        """Long pages are cut at 100KB without reading the rest of the body."""
+        import asyncio
+
+        import httpx
+
+        from lizcode.tools import webfetch
+        from lizcode.tools.webfetch import WebFetchTool
+
+        sent = []
+
+        async def body():
+            for _ in range(100):
+                sent.append(1)
+                yield b"x" * 16384
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, content=body(), headers={"Content-Type": "text/html; charset=utf-8"}
+            )
+
+        tool = WebFetchTool()
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(webfetch, "_CLIENT", client)
+        monkeypatch.setattr(webfetch, "_CLIENT_LOOP", asyncio.get_running_loop())
+
+        result = await tool.execute(url="https://example.test/big")
+        assert result.success
+        content = result.output.split("\n\n", 1)[1]
+        assert content == "x" * 100_000 + "\n\n[Content truncated - showing first 100KB]"
+        assert len(sent) < 100
+        await tool.close()
+
+
+class TestModelCompleter:
+    """Tests for /model tab completion."""
+
+    @staticmethod
+    def _settings(tmp_path):
+        from types import SimpleNamespace
+
+        return SimpleNamespace(
+            config_dir=tmp_path,
+            provider="ollama",
+            openrouter_api_key=None,
+            openrouter_base_url="https://or.test",
+            ollama_host="http://ollama.test",
+        )
+
+    @pytest.mark.asyncio
+    async def test_warmup_fills_cache(self, tmp_path, monkeypatch) -> None:
+        """warmup() fetches once in the background; stale lists are served while refreshing."""
+        from lizcode.tools import model_completer
+        from lizcode.tools.model_completer import ModelCompleter
+
+        completer = ModelCompleter(self._settings(tmp_path))
+        fetches = []
+
+        async def fake_fetch(provider: str) -> list[str]:
+            fetches.append(provider)
+            return ["llama3", f"qwen{len(fetches)}"]
+
+        monkeypatch.setattr(completer, "_fetch_models", fake_fetch)
+
+        completer.warmup()
+        completer.warmup()
+        await completer._refresh_tasks["ollama"]
+        assert completer._get_cached_models("ollama") == ["llama3", "qwen1"]
+        assert completer._get_cached_models("openrouter") == []
+        assert fetches == ["ollama"]
+
+        monkeypatch.setattr(model_completer, "MODEL_CACHE_TTL", -1.0)
+        assert completer._get_cached_models("ollama") == ["llama3", "qwen1"]
+        assert completer._get_cached_models("ollama") == ["llama3", "qwen1"]
+        await completer._refresh_tasks["ollama"]
+        assert fetches == ["ollama", "ollama"]
+        assert completer._get_cached_models("ollama") == ["llama3", "qwen2"]
+
+    @pytest.mark.asyncio
+    async def test_providers_refresh_concurrently(self, tmp_path, monkeypatch) -> None:
+        """Each provider's list is fetched in its own task, at the same time."""
+        import asyncio
+
+        from lizcode.tools.model_completer import ModelCompleter
+
+        settings = self._settings(tmp_path)
+        settings.provider = "openrouter"
+        settings.openrouter_api_key = "key"
+        completer = ModelCompleter(settings)
+        started = []
+        release = asyncio.Event()
+
+        async def fake_fetch(provider: str) -> list[str]:
+            started.append(provider)
+            await release.wait()
+            if provider == "ollama":
+                raise ConnectionError("ollama is down")
+            return [f"{provider}/model"]
+
+        monkeypatch.setattr(completer, "_fetch_models", fake_fetch)
+
+        completer.warmup()
+        await asyncio.sleep(0)
+        assert sorted(started) == ["ollama", "openrouter"]
+
+        release.set()
+        await asyncio.gather(*completer._refresh_tasks.values())
+        assert completer._model_cache == {"openrouter": ["openrouter/model"]}
+        assert set(completer._fetched_at) == {"ollama", "openrouter"}
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_backs_off(self, tmp_path, monkeypatch) -> None:
+        """Failed listings are retried after 1s, 2s, ... and keep the last good list."""
+        from lizcode.tools.model_completer import ModelCompleter
+
+        completer = ModelCompleter(self._settings(tmp_path))
+        completer._set_models("ollama", ["llama3"])
+        results = [ConnectionError("down"), [], ["llama3", "qwen"]]
+
+        async def fake_fetch(provider: str) -> list[str]:
+            result = results.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        monkeypatch.setattr(completer, "_fetch_models", fake_fetch)
+
+        for failures, wait in ((1, 1.0), (2, 2.0)):
+            completer.warmup()
+            await completer._refresh_tasks["ollama"]
+            assert completer._failures["ollama"] == failures
+            assert completer._get_cached_models("ollama") == ["llama3"]
+            assert completer._refresh_tasks["ollama"].done()  # Not retried yet
+
+            completer._fetched_at["ollama"] -= wait + 0.1
+
+        completer.warmup()
+        await completer._refresh_tasks["ollama"]
+        assert completer._failures == {}
+        assert completer._get_cached_models("ollama") == ["llama3", "qwen"]
+
+    @pytest.mark.asyncio
+    async def test_disk_cache(self, tmp_path, monkeypatch) -> None:
+        """Fetched lists seed the next completer for the same endpoints only."""
+        from lizcode.tools import model_completer
+        from lizcode.tools.model_completer import ModelCompleter
+
+        settings = self._settings(tmp_path)
+        first = ModelCompleter(settings)
+        first._model_cache["ollama"] = ["llama3"]
+        first._fetched_wall["ollama"] = model_completer.time.time()
+        first._save_disk_cache()
+
+        second = ModelCompleter(settings)
+        assert second._model_cache == {"ollama": ["llama3"]}
+        second.warmup()
+        assert second._refresh_tasks == {}  # Fresh enough, no fetch
+
+        settings.ollama_host = "http://elsewhere.test"
+        assert ModelCompleter(settings)._model_cache == {}
+
+        settings.ollama_host = "http://ollama.test"
+        monkeypatch.setattr(model_completer, "DISK_CACHE_TTL", 0.0)
+        assert ModelCompleter(settings)._model_cache == {}
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_failed_write(self, tmp_path, monkeypatch) -> None:
+        """A failed save keeps the previous cache file and leaves no temp files behind."""
+        import os
+
+        from lizcode.tools import model_completer
+        from lizcode.tools.model_completer import ModelCompleter
+
+        completer = ModelCompleter(self._settings(tmp_path))
+        completer._model_cache["ollama"] = ["llama3"]
+        completer._fetched_wall["ollama"] = model_completer.time.time()
+        completer._save_disk_cache()
+        saved = completer._cache_path.read_text()
+
+        completer._model_cache["ollama"] = {"not", "json"}
+        completer._save_disk_cache()
+
+        completer._model_cache["ollama"] = ["qwen"]
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", fail_replace)
+        completer._save_disk_cache()
+
+        assert completer._cache_path.read_text() == saved
+        assert [p.name for p in completer._cache_path.parent.iterdir()] == [
+            completer._cache_path.name
+        ]
+
+    @pytest.mark.asyncio
+    async def test_prefix_completions(self, tmp_path, monkeypatch) -> None:
+        """Model completions are the cached models with the typed prefix, sorted and capped."""
+        from prompt_toolkit.completion import CompleteEvent
+        from prompt_toolkit.document import Document
+
+        from lizcode.tools import model_completer
+        from lizcode.tools.model_completer import ModelCompleter
+
+        completer = ModelCompleter(self._settings(tmp_path))
+        completer._set_models("ollama", ["qwen:7b", "llama3:8b", "llama3", "llava", "mistral"])
+        completer._fetched_at["ollama"] = model_completer.time.monotonic()
+
+        def complete(text: str) -> list[str]:
+            return [c.text for c in completer.get_completions(Document(text), CompleteEvent())]
+
+        assert complete("/model ollama/lla") == ["llama3", "llama3:8b", "llava"]
+        assert complete("/model ollama/llama3:") == ["llama3:8b"]
+        assert complete("/model ollama/z") == []
+        assert complete("/model ol") == ["ollama/"]
+        assert complete("/model ") == complete("/modelol") == complete("hi /model ol") == []
+
+        monkeypatch.setattr(model_completer, "MAX_COMPLETIONS", 2)
+        assert complete("/model ollama/l") == ["llama3", "llama3:8b"]
@@ -170,6 +170,48 @@ class TestActModeWorkflow:
         
         assert iteration_limit_emitted, "Should emit iteration_limit warning at 20"
 
+    @pytest.mark.asyncio
+    async def test_lazy_schemas_stay_promoted(self, temp_dir: Path) -> None:
+        """A tool keeps its full schema in every turn after its first use."""
+
+        class SchemaRecordingProvider(MockProvider):
+            async def chat(self, messages, tools=None):
+                self.schemas = getattr(self, "schemas", []) + [tools]
+                return await super().chat(messages)
+
+        provider = SchemaRecordingProvider()
+        provider.add_response(tool_calls=[{"name": "list_files", "arguments": {}}])
+        provider.add_response(tool_calls=[{"name": "glob", "arguments": {"pattern": "*.py"}}])
+        provider.add_response(tool_calls=[{"name": "list_files", "arguments": {}}])
+        provider.add_response(
+            tool_calls=[{"name": "attempt_completion", "arguments": {"result": "Done"}}],
+        )
+
+        state = ConversationState()
+        state.set_mode(Mode.ACT)
+        agent = Agent(
+            provider=provider, state=state, working_directory=temp_dir, lazy_tool_schemas=True
+        )
+
+        async for _ in agent.chat("Look around"):
+            pass
+
+        def full_schemas(tools):
+            registry = agent.tool_registry
+            return {
+                schema["function"]["name"]
+                for schema in tools
+                if schema is registry.get(schema["function"]["name"]).get_schema()
+            }
+
+        assert [full_schemas(tools) for tools in provider.schemas[:4]] == [
+            set(),
+            {"list_files"},
+            {"list_files", "glob"},
+            {"list_files", "glob"},
+        ]
+        assert provider.schemas[2] == provider.schemas[3]
+
 
 class TestPlanModeWorkflow:
     """Test plan mode workflow."""